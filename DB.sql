@@ -71,10 +71,13 @@ CREATE TABLE `project` (
   `end_date` date DEFAULT NULL,
   `status` enum('PLANNED','IN_PROGRESS','ON_HOLD','COMPLETED') DEFAULT 'PLANNED',
   `owner_emp_id` int DEFAULT NULL,
+  `change_version` bigint NOT NULL DEFAULT '0',
   `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
   `updated_at` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
   PRIMARY KEY (`project_id`),
   KEY `owner_emp_id` (`owner_emp_id`),
+  KEY `idx_project_list` (`created_at`, `project_id`),
+  KEY `idx_project_status_list` (`status`, `created_at`, `project_id`),
   CONSTRAINT `project_ibfk_1` FOREIGN KEY (`owner_emp_id`) REFERENCES `employee` (`emp_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
@@ -97,12 +100,24 @@ CREATE TABLE `task` (
   KEY `project_id` (`project_id`),
   KEY `assignee_emp_id` (`assignee_emp_id`),
   KEY `parent_task_id` (`parent_task_id`),
+  KEY `idx_task_project_status_due` (`project_id`, `status`, `due_date`),
+  KEY `idx_task_project_due` (`project_id`, `due_date`, `task_id`),
+  KEY `idx_task_project_assignee_due` (`project_id`, `assignee_emp_id`, `due_date`),
+  FULLTEXT KEY `ft_task_title_description` (`title`, `description`) WITH PARSER ngram,
   CONSTRAINT `task_ibfk_1` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`),
   CONSTRAINT `task_ibfk_2` FOREIGN KEY (`assignee_emp_id`) REFERENCES `employee` (`emp_id`),
   CONSTRAINT `task_ibfk_3` FOREIGN KEY (`parent_task_id`) REFERENCES `task` (`task_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
 ALTER TABLE task ADD COLUMN progress INT DEFAULT 0; -- 0~100%
+-- 하위 업무 롤업 (모든 하위 업무의 개수 / 완료 수 / 가중치(예상 시간) 합 / 가중치×진행률 합)
+ALTER TABLE task
+  ADD COLUMN rollup_task_count INT NOT NULL DEFAULT 0,
+  ADD COLUMN rollup_done_count INT NOT NULL DEFAULT 0,
+  ADD COLUMN rollup_weight DECIMAL(12,2) NOT NULL DEFAULT 0,
+  ADD COLUMN rollup_weighted_progress DECIMAL(14,2) NOT NULL DEFAULT 0;
+-- 기존 DB 이관: 컬럼 추가 후 프로젝트별로 한 번 재계산
+-- python -c "from app.database import SessionLocal; from app.services.rollup_service import rebuild_rollups; rebuild_rollups(SessionLocal())"
 
 -- 5) project를 참조
 CREATE TABLE `milestone` (
@@ -249,17 +264,30 @@ CREATE TABLE `attachment` (
   `file_path` varchar(1024) NOT NULL,
   `file_size` bigint DEFAULT NULL,
   `file_type` varchar(100) DEFAULT NULL,
+  `content_hash` char(64) DEFAULT NULL,
   `is_deleted` tinyint(1) DEFAULT '0',
   `uploaded_at` datetime DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`attachment_id`),
   KEY `fk_attachment_project` (`project_id`),
   KEY `fk_attachment_task` (`task_id`),
   KEY `fk_attachment_employee` (`uploaded_by`),
+  KEY `idx_attachment_content_hash` (`content_hash`),
   CONSTRAINT `fk_attachment_employee` FOREIGN KEY (`uploaded_by`) REFERENCES `employee` (`emp_id`) ON DELETE SET NULL,
   CONSTRAINT `fk_attachment_project` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`) ON DELETE CASCADE,
   CONSTRAINT `fk_attachment_task` FOREIGN KEY (`task_id`) REFERENCES `task` (`task_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
+-- 12-1) 첨부파일 내용 저장소 (SHA-256 기준 중복 제거, 참조 수 관리)
+CREATE TABLE `attachment_blob` (
+  `content_hash` char(64) NOT NULL,
+  `file_size` bigint NOT NULL,
+  `ref_count` int NOT NULL DEFAULT '0',
+  `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  `updated_at` datetime DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (`content_hash`),
+  KEY `idx_attachment_blob_refs` (`ref_count`, `updated_at`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
 -- 13) task/employee/project 참조
 CREATE TABLE `task_comment` (
   `comment_id` int NOT NULL AUTO_INCREMENT,
@@ -273,27 +301,77 @@ CREATE TABLE `task_comment` (
   PRIMARY KEY (`comment_id`),
   KEY `emp_id` (`emp_id`),
   KEY `idx_task_comment_task` (`task_id`),
+  KEY `idx_task_comment_thread` (`task_id`, `parent_comment_id`),
   KEY `idx_task_comment_parent` (`parent_comment_id`),
   KEY `project_id` (`project_id`),
+  FULLTEXT KEY `ft_task_comment_content` (`content`) WITH PARSER ngram,
   CONSTRAINT `task_comment_ibfk_1` FOREIGN KEY (`task_id`) REFERENCES `task` (`task_id`),
   CONSTRAINT `task_comment_ibfk_2` FOREIGN KEY (`emp_id`) REFERENCES `employee` (`emp_id`),
-  CONSTRAINT `task_comment_ibfk_3` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`)
+  CONSTRAINT `task_comment_ibfk_3` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`),
+  CONSTRAINT `task_comment_ibfk_4` FOREIGN KEY (`parent_comment_id`) REFERENCES `task_comment` (`comment_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
 -- 14) task/employee 참조
 CREATE TABLE `task_history` (
   `history_id` int NOT NULL AUTO_INCREMENT,
   `task_id` int NOT NULL,
+  `project_id` int NOT NULL,
   `old_status` enum('TODO','IN_PROGRESS','REVIEW','DONE') DEFAULT NULL,
   `new_status` enum('TODO','IN_PROGRESS','REVIEW','DONE') DEFAULT NULL,
+  `changes` json DEFAULT NULL,
   `changed_by` int DEFAULT NULL,
   `changed_at` datetime DEFAULT NULL,
   PRIMARY KEY (`history_id`),
   KEY `task_id` (`task_id`),
   KEY `changed_by` (`changed_by`),
   KEY `ix_task_history_history_id` (`history_id`),
+  KEY `idx_task_history_project_changed` (`project_id`, `changed_at`, `history_id`),
+  KEY `idx_task_history_task_changed` (`task_id`, `changed_at`, `history_id`),
   CONSTRAINT `task_history_ibfk_1` FOREIGN KEY (`task_id`) REFERENCES `task` (`task_id`),
-  CONSTRAINT `task_history_ibfk_2` FOREIGN KEY (`changed_by`) REFERENCES `employee` (`emp_id`)
+  CONSTRAINT `task_history_ibfk_2` FOREIGN KEY (`changed_by`) REFERENCES `employee` (`emp_id`),
+  CONSTRAINT `task_history_ibfk_3` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+-- 기존 DB 이관: project_id 추가 후 task에서 채움
+-- ALTER TABLE task_history ADD COLUMN project_id int NULL AFTER task_id, ADD COLUMN changes json NULL AFTER new_status;
+-- UPDATE task_history h JOIN task t ON t.task_id = h.task_id SET h.project_id = t.project_id;
+-- ALTER TABLE task_history MODIFY project_id int NOT NULL,
+--   ADD KEY idx_task_history_project_changed (project_id, changed_at, history_id),
+--   ADD KEY idx_task_history_task_changed (task_id, changed_at, history_id),
+--   ADD CONSTRAINT task_history_ibfk_3 FOREIGN KEY (project_id) REFERENCES project (project_id) ON DELETE CASCADE;
+
+-- 14-1) 프로젝트 변경 피드 (엔티티별 마지막 변경 버전 + 삭제 툼스톤)
+CREATE TABLE `project_change` (
+  `project_id` int NOT NULL,
+  `entity_type` varchar(10) NOT NULL,
+  `entity_id` int NOT NULL,
+  `version` bigint NOT NULL,
+  `deleted` tinyint(1) NOT NULL DEFAULT '0',
+  `changed_at` datetime NOT NULL,
+  PRIMARY KEY (`project_id`, `entity_type`, `entity_id`),
+  KEY `idx_project_change_version` (`project_id`, `version`),
+  CONSTRAINT `fk_project_change_project` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
+-- 14-2) 태스크 상태 체류 시간 누적 (상태 변경 시 증분 갱신, 흐름 지표용)
+CREATE TABLE `task_flow` (
+  `task_id` int NOT NULL,
+  `project_id` int NOT NULL,
+  `status` varchar(11) NOT NULL,
+  `status_since` datetime NOT NULL,
+  `started_at` datetime DEFAULT NULL,
+  `done_at` datetime DEFAULT NULL,
+  `todo_seconds` bigint NOT NULL DEFAULT '0',
+  `in_progress_seconds` bigint NOT NULL DEFAULT '0',
+  `review_seconds` bigint NOT NULL DEFAULT '0',
+  `done_seconds` bigint NOT NULL DEFAULT '0',
+  `lead_seconds` bigint DEFAULT NULL,
+  `cycle_seconds` bigint DEFAULT NULL,
+  `transitions` int NOT NULL DEFAULT '0',
+  PRIMARY KEY (`task_id`),
+  KEY `idx_task_flow_project_done` (`project_id`, `done_at`),
+  CONSTRAINT `fk_task_flow_task` FOREIGN KEY (`task_id`) REFERENCES `task` (`task_id`) ON DELETE CASCADE,
+  CONSTRAINT `fk_task_flow_project` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`) ON DELETE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
 -- 15) employee/project/task 참조
@@ -309,8 +387,8 @@ CREATE TABLE `activity_log` (
   `created_at` datetime DEFAULT CURRENT_TIMESTAMP,
   PRIMARY KEY (`log_id`),
   KEY `idx_activity_emp` (`emp_id`),
-  KEY `idx_activity_project` (`project_id`),
-  KEY `idx_activity_task` (`task_id`),
+  KEY `idx_activity_project_feed` (`project_id`,`created_at`,`log_id`),
+  KEY `idx_activity_task_feed` (`task_id`,`created_at`,`log_id`),
   KEY `idx_activity_action` (`action`),
   CONSTRAINT `fk_activity_emp` FOREIGN KEY (`emp_id`) REFERENCES `employee` (`emp_id`) ON DELETE CASCADE,
   CONSTRAINT `fk_activity_project` FOREIGN KEY (`project_id`) REFERENCES `project` (`project_id`) ON DELETE SET NULL,
@@ -333,6 +411,16 @@ CREATE TABLE `notification` (
   KEY `idx_notification_task` (`task_id`)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
 
+-- 16-1) 수신자별 알림 개수 (배지 조회용 PK 단건 읽기, 주기적 재계산으로 보정)
+CREATE TABLE `notification_counter` (
+  `recipient_emp_id` int NOT NULL,
+  `total_count` int NOT NULL DEFAULT '0',
+  `unread_count` int NOT NULL DEFAULT '0',
+  `updated_at` datetime DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (`recipient_emp_id`),
+  CONSTRAINT `fk_notification_counter_emp` FOREIGN KEY (`recipient_emp_id`) REFERENCES `employee` (`emp_id`) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_0900_ai_ci;
+
 -- 17) employee/external_person 참조
 CREATE TABLE `member` (
   `member_id` int NOT NULL AUTO_INCREMENT,
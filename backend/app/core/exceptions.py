@@ -19,3 +19,7 @@ def forbidden(detail: str = "Forbidden"):
 
 def conflict(detail: str = "Conflict - duplicate or invalid state"):
     raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+
+
+def payload_too_large(detail: str = "Payload too large"):
+    raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=detail)
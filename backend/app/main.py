@@ -1,25 +1,45 @@
 # ---------------------------
 # DB 테이블 자동 생성
 # ---------------------------
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import models
-from app.database import Base, engine
+from app.database import Base, SessionLocal, engine
 from app.routers import (
     activity_router,
+    analytics_router,
     comment_router,
     department_router,
     employee_router,
     history_router,
+    metrics_router,
     milestone_router,
     notification_router,
     project_router,
+    search_router,
     task_router,
+    ws_router,
 )
 from app.routers.auth import login, signup
+from app.services.attachment_service import (
+    ATTACHMENT_MAX_BYTES,
+    ATTACHMENT_MULTIPART_OVERHEAD,
+    BLOB_GC_INTERVAL,
+    run_blob_gc,
+)
+from app.services.notification_service import (
+    NOTIFICATION_RECONCILE_INTERVAL,
+    run_counter_reconciler,
+)
+from app.utils.event_bus import event_bus
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.password_hasher import password_hasher
+from app.utils.upload_limit import BodySizeLimitMiddleware
 
 logging.basicConfig(level=logging.INFO)
 
@@ -27,10 +47,38 @@ logging.info("🚀 DB 연결 시도 중...")
 Base.metadata.create_all(bind=engine)
 logging.info("✅ DB 테이블 생성 완료")
 
+
+# ---------------------------
+# 앱 수명주기 (실시간 이벤트 버스 + 알림 카운터 보정 + 첨부파일 GC)
+# ---------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await event_bus.start()
+    background = []
+    if NOTIFICATION_RECONCILE_INTERVAL > 0:
+        background.append(asyncio.create_task(run_counter_reconciler(SessionLocal)))
+    if BLOB_GC_INTERVAL > 0:
+        background.append(asyncio.create_task(run_blob_gc(SessionLocal)))
+    yield
+    for task in background:
+        task.cancel()
+    password_hasher.shutdown()
+    await event_bus.stop()
+
+
 # ---------------------------
 # FastAPI 앱 생성
 # ---------------------------
-app = FastAPI(title="업무툴 프로젝트 관리")
+app = FastAPI(title="업무툴 프로젝트 관리", lifespan=lifespan)
+
+# 📎 첨부파일 업로드: 폼 파싱(임시 파일 스풀링) 전에 크기 한도 초과 요청 차단
+# (CORS보다 먼저 등록 → 안쪽에서 동작하므로 413 응답에도 CORS 헤더가 붙음)
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=ATTACHMENT_MAX_BYTES + ATTACHMENT_MULTIPART_OVERHEAD,
+    path_pattern=r"^/projects/\d+/tasks/\d+/attachments/?$",
+    detail=f"첨부파일 크기가 허용 한도({ATTACHMENT_MAX_BYTES:,} bytes)를 초과했습니다.",
+)
 
 # ✅ 프론트엔드 허용 도메인 (Vite: 5173)
 origins = ["http://localhost:5173", "http://127.0.0.1:5173"]
@@ -43,6 +91,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 커서 페이지네이션 + 첨부파일 다운로드(파일명, 부분 응답, 캐시 검증자)
+    expose_headers=[
+        NEXT_CURSOR_HEADER,
+        "Content-Disposition",
+        "Content-Range",
+        "Accept-Ranges",
+        "ETag",
+        "Last-Modified",
+    ],
 )
 
 # ---------------------------
@@ -59,6 +116,10 @@ app.include_router(employee_router.router)
 app.include_router(history_router.router)
 app.include_router(notification_router.router)
 app.include_router(activity_router.router)  # ✅ 프로젝트 활동 피드
+app.include_router(search_router.router)  # 🔍 업무·댓글 검색
+app.include_router(analytics_router.router)  # ⏱️ 흐름 지표 (cycle time 등)
+app.include_router(ws_router.router)  # 🔌 실시간 프로젝트 이벤트
+app.include_router(metrics_router.router)  # 🩺 DB 풀 지표
 
 
 # ---------------------------
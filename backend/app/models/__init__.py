@@ -1,11 +1,12 @@
 # app/models/__init__.py
 
 from app.models.activity_log import ActivityLog
-from app.models.attachment import Attachment
+from app.models.attachment import Attachment, AttachmentBlob
 from app.models.department import Department, DepartmentPermission
 from app.models.employee import Employee
 from app.models.enums import (
     ActivityAction,
+    ChangeEntityType,
     MemberRole,
     MilestoneStatus,
     ProjectStatus,
@@ -14,7 +15,7 @@ from app.models.enums import (
 )
 from app.models.external import External
 from app.models.member import Member
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationCounter, NotificationType
 from app.models.project import (
     Milestone,
     Project,
@@ -23,7 +24,9 @@ from app.models.project import (
     TaskComment,
     TaskHistory,
 )
+from app.models.project_change import ProjectChange
 from app.models.role import Role
+from app.models.task_flow import TaskFlow
 
 __all__ = [
     "Department",
@@ -34,8 +37,12 @@ __all__ = [
     "Member",
     "Project",
     "ProjectMember",
+    "ProjectChange",
+    "TaskFlow",
     "Attachment",
+    "AttachmentBlob",
     "Notification",
+    "NotificationCounter",
     "ActivityLog",
     "ProjectStatus",
     "TaskStatus",
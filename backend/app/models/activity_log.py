@@ -38,8 +38,9 @@ class ActivityLog(Base):
 
     __table_args__ = (
         Index("idx_activity_emp", "emp_id"),
-        Index("idx_activity_project", "project_id"),
-        Index("idx_activity_task", "task_id"),
+        # 피드 키셋 페이지네이션 (ORDER BY created_at DESC, log_id DESC) 용 복합 인덱스
+        Index("idx_activity_project_feed", "project_id", "created_at", "log_id"),
+        Index("idx_activity_task_feed", "task_id", "created_at", "log_id"),
     )
 
     def __repr__(self):
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     func,
@@ -32,6 +33,7 @@ class Attachment(Base):
     file_path = Column(String(1024), nullable=False)
     file_size = Column(BigInteger)
     file_type = Column(String(100))
+    content_hash = Column(String(64))  # SHA-256 (hex) → attachment_blob
     is_deleted = Column(Boolean, default=False)
 
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -41,5 +43,27 @@ class Attachment(Base):
     task = relationship("Task", back_populates="attachments")
     uploader = relationship("Employee", back_populates="attachments")  # ✅ 이름 일치
 
+    __table_args__ = (Index("idx_attachment_content_hash", "content_hash"),)
+
     def __repr__(self):
         return f"<Attachment(id={self.attachment_id}, file={self.file_name})>"
+
+
+class AttachmentBlob(Base):
+    """
+    내용 주소 기반 저장소의 실제 파일 1개 (SHA-256 기준 중복 제거).
+    같은 내용의 첨부파일은 blob 하나를 공유하고 ref_count로 참조 수를 관리.
+    """
+
+    __tablename__ = "attachment_blob"
+
+    content_hash = Column(String(64), primary_key=True)
+    file_size = Column(BigInteger, nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("idx_attachment_blob_refs", "ref_count", "updated_at"),)
+
+    def __repr__(self):
+        return f"<AttachmentBlob(hash={self.content_hash}, refs={self.ref_count})>"
@@ -50,6 +50,24 @@ class MilestoneStatus(str, Enum):
     MISSED = "MISSED"
 
 
+# ------------------------------------------
+# 🔄 변경 피드 엔티티 종류
+# ------------------------------------------
+class ChangeEntityType(str, Enum):
+    task = "task"
+    milestone = "milestone"
+    comment = "comment"
+    attachment = "attachment"
+
+
+# ------------------------------------------
+# 🔍 검색 대상
+# ------------------------------------------
+class SearchTarget(str, Enum):
+    task = "task"
+    comment = "comment"
+
+
 # ------------------------------------------
 # 🧾 활동 로그 타입 (ActivityAction)
 # ------------------------------------------
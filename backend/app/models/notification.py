@@ -91,3 +91,24 @@ class Notification(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+class NotificationCounter(Base):
+    """수신자별 알림 개수 (배지용, 알림 생성/읽음/삭제 시 함께 갱신)"""
+
+    __tablename__ = "notification_counter"
+
+    recipient_emp_id = Column(
+        Integer,
+        ForeignKey("employee.emp_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    total_count = Column(Integer, nullable=False, default=0)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return (
+            f"<NotificationCounter(emp={self.recipient_emp_id}, "
+            f"unread={self.unread_count}, total={self.total_count})>"
+        )
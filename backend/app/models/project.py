@@ -1,11 +1,14 @@
 from sqlalchemy import (
     DECIMAL,
+    JSON,
+    BigInteger,
     Boolean,
     Column,
     Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -41,6 +44,8 @@ class Project(Base):
     owner_emp_id = Column(
         Integer, ForeignKey("employee.emp_id", ondelete="SET NULL"), nullable=True
     )
+    # 변경 피드 버전 (업무/마일스톤/댓글/첨부 변경 트랜잭션마다 +1)
+    change_version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -63,6 +68,12 @@ class Project(Base):
         "Attachment", back_populates="project", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # 목록 키셋 페이지 (최신순) / 상태 필터 + 최신순
+        Index("idx_project_list", "created_at", "project_id"),
+        Index("idx_project_status_list", "status", "created_at", "project_id"),
+    )
+
 
 # ---------------------------------
 # 프로젝트 멤버
@@ -112,6 +123,13 @@ class Task(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     progress = Column(Integer, default=0)
+    # 하위 업무 롤업 (자기 자신 제외 모든 하위 업무 합계, 변경 시 상위 경로만 증분 갱신)
+    rollup_task_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rollup_done_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rollup_weight = Column(DECIMAL(12, 2), nullable=False, default=0, server_default="0")
+    rollup_weighted_progress = Column(
+        DECIMAL(14, 2), nullable=False, default=0, server_default="0"
+    )
 
     # ✅ 관계
     project = relationship("Project", back_populates="tasks")
@@ -133,6 +151,21 @@ class Task(Base):
         "Attachment", back_populates="task", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # 목록 필터 + 정렬 (상태별 마감순 / 전체 마감순 / 담당자별 마감순)
+        Index("idx_task_project_status_due", "project_id", "status", "due_date"),
+        Index("idx_task_project_due", "project_id", "due_date", "task_id"),
+        Index("idx_task_project_assignee_due", "project_id", "assignee_emp_id", "due_date"),
+        # 검색 (MySQL ngram 전문 인덱스 — 한국어 2-gram, 다른 DB에서는 생성하지 않음)
+        Index(
+            "ft_task_title_description",
+            "title",
+            "description",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
+
     @hybrid_property
     def assignee_name(self):
         return self.assignee.name if self.assignee else None
@@ -154,6 +187,10 @@ class TaskComment(Base):
     emp_id = Column(
         Integer, ForeignKey("employee.emp_id", ondelete="CASCADE"), nullable=False
     )
+    # 답글이면 스레드 최상위 댓글 ID (답글의 답글도 최상위 댓글에 연결 → 1단계 스레드)
+    parent_comment_id = Column(
+        Integer, ForeignKey("task_comment.comment_id", ondelete="CASCADE"), nullable=True
+    )
 
     content = Column(Text, nullable=False)
 
@@ -164,6 +201,21 @@ class TaskComment(Base):
     project = relationship("Project", back_populates="comments")
     task = relationship("Task", back_populates="comments")
     employee = relationship("Employee", back_populates="comments")
+    # 답글은 DB FK(ON DELETE CASCADE)로 삭제 — 관계는 삭제 순서(답글 → 원댓글) 결정용
+    parent = relationship("TaskComment", remote_side=[comment_id], back_populates="replies")
+    replies = relationship("TaskComment", back_populates="parent", passive_deletes=True)
+
+    __table_args__ = (
+        # 최상위 댓글 페이지 (task_id + parent IS NULL, comment_id 순) / 스레드 답글 페이지
+        Index("idx_task_comment_thread", "task_id", "parent_comment_id"),
+        Index("idx_task_comment_parent", "parent_comment_id"),
+        Index(
+            "ft_task_comment_content",
+            "content",
+            mysql_prefix="FULLTEXT",
+            mysql_with_parser="ngram",
+        ).ddl_if(dialect="mysql"),
+    )
 
     def __repr__(self):
         return f"<TaskComment(comment_id={self.comment_id}, task_id={self.task_id}, emp_id={self.emp_id})>"
@@ -199,9 +251,20 @@ class TaskHistory(Base):
     task_id = Column(
         Integer, ForeignKey("task.task_id", ondelete="CASCADE"), nullable=False
     )
+    # 프로젝트 이력 조회용 비정규화 (task 조인/서브쿼리 없이 인덱스 범위 스캔)
+    project_id = Column(
+        Integer, ForeignKey("project.project_id", ondelete="CASCADE"), nullable=False
+    )
     old_status = Column(Enum(TaskStatus, native_enum=False))
     new_status = Column(Enum(TaskStatus, native_enum=False))
+    changes = Column(JSON)  # {"필드": [이전 값, 새 값]} — 바뀐 필드만
     changed_by = Column(Integer, ForeignKey("employee.emp_id", ondelete="SET NULL"))
     changed_at = Column(DateTime, server_default=func.now())
 
     task = relationship("Task", back_populates="histories")
+
+    __table_args__ = (
+        # 프로젝트 / 태스크 이력 최신순 키셋 페이지
+        Index("idx_task_history_project_changed", "project_id", "changed_at", "history_id"),
+        Index("idx_task_history_task_changed", "task_id", "changed_at", "history_id"),
+    )
@@ -0,0 +1,28 @@
+# app/models/project_change.py
+from sqlalchemy import BigInteger, Boolean, Column, DateTime, Enum, ForeignKey, Index, Integer
+
+from app.database import Base
+from app.models.enums import ChangeEntityType
+
+
+class ProjectChange(Base):
+    """
+    프로젝트 변경 피드: 엔티티별 마지막 변경 버전 1행 (upsert).
+    삭제된 엔티티는 deleted=True 행(툼스톤)으로 남아 증분 동기화 클라이언트에 전달됨.
+    """
+
+    __tablename__ = "project_change"
+
+    project_id = Column(
+        Integer, ForeignKey("project.project_id", ondelete="CASCADE"), primary_key=True
+    )
+    entity_type = Column(Enum(ChangeEntityType, native_enum=False), primary_key=True)
+    entity_id = Column(Integer, primary_key=True, autoincrement=False)
+    version = Column(BigInteger, nullable=False)
+    deleted = Column(Boolean, nullable=False, default=False)
+    changed_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        # ?since= 범위 스캔
+        Index("idx_project_change_version", "project_id", "version"),
+    )
@@ -0,0 +1,36 @@
+# app/models/task_flow.py
+from sqlalchemy import BigInteger, Column, DateTime, Enum, ForeignKey, Index, Integer
+
+from app.database import Base
+from app.models.enums import TaskStatus
+
+
+class TaskFlow(Base):
+    """
+    태스크별 상태 체류 시간 누적 (상태 변경 시 증분 갱신, 태스크당 1행).
+    - *_seconds: 지난 상태 구간의 합 (현재 상태는 status_since부터 진행 중)
+    - 완료 시 lead(생성 → 완료) / cycle(착수 → 완료) 시간 확정, 재오픈되면 해제
+    """
+
+    __tablename__ = "task_flow"
+
+    task_id = Column(Integer, ForeignKey("task.task_id", ondelete="CASCADE"), primary_key=True)
+    project_id = Column(
+        Integer, ForeignKey("project.project_id", ondelete="CASCADE"), nullable=False
+    )
+    status = Column(Enum(TaskStatus, native_enum=False), nullable=False)
+    status_since = Column(DateTime, nullable=False)
+    started_at = Column(DateTime)  # 처음 TODO를 벗어난 시각
+    done_at = Column(DateTime)
+    todo_seconds = Column(BigInteger, nullable=False, default=0)
+    in_progress_seconds = Column(BigInteger, nullable=False, default=0)
+    review_seconds = Column(BigInteger, nullable=False, default=0)
+    done_seconds = Column(BigInteger, nullable=False, default=0)
+    lead_seconds = Column(BigInteger)
+    cycle_seconds = Column(BigInteger)
+    transitions = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # 프로젝트 흐름 지표 (완료 기간 필터)
+        Index("idx_task_flow_project_done", "project_id", "done_at"),
+    )
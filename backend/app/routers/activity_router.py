@@ -1,16 +1,17 @@
 # app/routers/activity_router.py
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models, schemas
 from app.core.exceptions import forbidden
-from app.database import get_db
+from app.database import get_async_db
 from app.services.activity_logger import (
-    get_project_activity,
-    get_task_activity,
-    is_project_member,
+    get_project_activity_async,
+    get_task_activity_async,
+    is_project_member_async,
 )
-from app.utils.token import get_current_user
+from app.utils.pagination import set_next_cursor
+from app.utils.token import get_current_user_async
 
 router = APIRouter(prefix="/projects/{project_id}/activity", tags=["activity_feed"])
 
@@ -19,36 +20,45 @@ router = APIRouter(prefix="/projects/{project_id}/activity", tags=["activity_fee
 # ✅ 프로젝트 단위 활동 피드 조회
 # -------------------------------
 @router.get("/", response_model=list[schemas.activity.ActivityFeedItem])
-def get_project_activity_feed(
+async def get_project_activity_feed(
     project_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.Member = Depends(get_current_user),
-    limit: int = Query(100, le=300),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Member = Depends(get_current_user_async),
+    limit: int = Query(100, ge=1, le=300),
+    cursor: str | None = Query(None),
 ):
     """
     프로젝트 전체 활동 로그 조회 (댓글, 상태변경, 첨부 등)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
     """
-    if not is_project_member(db, project_id, current_user.emp_id):
+    if not await is_project_member_async(db, project_id, current_user.emp_id):
         forbidden("이 프로젝트의 활동 피드를 볼 권한이 없습니다.")
 
-    return get_project_activity(db, project_id, limit)
+    items, next_cursor = await get_project_activity_async(db, project_id, limit, cursor)
+    set_next_cursor(response, next_cursor)
+    return items
 
 
 # -------------------------------
 # ✅ 업무 단위 활동 피드 조회
 # -------------------------------
 @router.get("/tasks/{task_id}", response_model=list[schemas.activity.ActivityFeedItem])
-def get_task_activity_feed(
+async def get_task_activity_feed(
     project_id: int,
     task_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.Member = Depends(get_current_user),
-    limit: int = Query(100, le=300),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Member = Depends(get_current_user_async),
+    limit: int = Query(100, ge=1, le=300),
+    cursor: str | None = Query(None),
 ):
     """
-    개별 업무(Task) 단위의 활동 로그 조회
+    개별 업무(Task) 단위의 활동 로그 조회 (X-Next-Cursor 헤더로 페이지 이어가기)
     """
-    if not is_project_member(db, project_id, current_user.emp_id):
+    if not await is_project_member_async(db, project_id, current_user.emp_id):
         forbidden("이 프로젝트의 활동 피드를 볼 권한이 없습니다.")
 
-    return get_task_activity(db, project_id, task_id, limit)
+    items, next_cursor = await get_task_activity_async(db, project_id, task_id, limit, cursor)
+    set_next_cursor(response, next_cursor)
+    return items
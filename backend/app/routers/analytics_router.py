@@ -0,0 +1,58 @@
+# app/routers/analytics_router.py
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.core.exceptions import bad_request, forbidden, not_found
+from app.database import get_db
+from app.services import flow_service
+from app.services.history_service import is_project_member_by_project
+from app.utils.token import get_current_user
+
+router = APIRouter(prefix="/projects/{project_id}/analytics", tags=["analytics"])
+
+
+def _check_member(db: Session, project_id: int, emp_id: int):
+    if not is_project_member_by_project(db, project_id, emp_id):
+        forbidden("해당 프로젝트의 멤버만 접근할 수 있습니다.")
+
+
+# -------------------------------
+# 프로젝트 흐름 지표
+# -------------------------------
+@router.get("/flow", response_model=schemas.analytics.ProjectFlow)
+def get_project_flow(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.Employee = Depends(get_current_user),
+    done_from: Optional[date] = Query(None, description="이 날짜 이후 완료된 태스크만"),
+    done_to: Optional[date] = Query(None, description="이 날짜까지 완료된 태스크만"),
+):
+    """
+    lead / cycle time 백분위·분포, 상태별 체류 시간, WIP 경과 시간.
+    - 상태 변경 시점에 누적해 둔 task_flow 행만 읽음 (이력 재계산 없음)
+    """
+    _check_member(db, project_id, current_user.emp_id)
+    if done_from and done_to and done_from > done_to:
+        bad_request("done_from은 done_to보다 이후일 수 없습니다.")
+    return flow_service.get_project_flow(db, project_id, done_from, done_to)
+
+
+# -------------------------------
+# 태스크별 흐름
+# -------------------------------
+@router.get("/flow/tasks/{task_id}", response_model=schemas.analytics.TaskFlow)
+def get_task_flow(
+    project_id: int,
+    task_id: int,
+    db: Session = Depends(get_db),
+    current_user: models.Employee = Depends(get_current_user),
+):
+    _check_member(db, project_id, current_user.emp_id)
+    flow = flow_service.get_task_flow(db, project_id, task_id)
+    if flow is None:
+        not_found("태스크를 찾을 수 없습니다.")
+    return flow
@@ -10,7 +10,7 @@ from app.models.employee import Employee
 from app.models.external import External
 from app.models.member import Member
 from app.schemas.user import LoginRequest, LoginResponse, MemberOut
-from app.utils.token import create_access_token, verify_password
+from app.utils.token import create_access_token, verify_and_update_password
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -26,11 +26,14 @@ def login(req: LoginRequest, db: Session = Depends(get_db)):
     member = db.scalars(select(Member).where(Member.login_id == req.login_id)).first()
     if not member:
         raise HTTPException(status_code=401, detail="존재하지 않는 ID 입니다.")
-    if not verify_password(req.password, member.password_hash):
+    verified, new_hash = verify_and_update_password(req.password, member.password_hash)
+    if not verified:
         raise HTTPException(status_code=401, detail="비밀번호가 일치하지 않습니다.")
 
-    # 2) 마지막 로그인 기록
+    # 2) 마지막 로그인 기록 (+ bcrypt rounds 변경 시 해시 교체)
     member.last_login_at = datetime.utcnow()
+    if new_hash:
+        member.password_hash = new_hash
     db.add(member)
     db.commit()
 
@@ -1,10 +1,15 @@
 # app/routers/comment_router.py
-from fastapi import APIRouter, Depends
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app import models, schemas
-from app.database import get_db
-from app.services import comment_service, task_service
+from app.database import get_async_db, get_db
+from app.services import change_service, comment_service, task_service
 from app.core.exceptions import not_found
+from app.utils.http_cache import check_etag, version_etag
+from app.utils.pagination import set_next_cursor
 from app.utils.token import get_current_user
 
 router = APIRouter(
@@ -16,11 +21,63 @@ router = APIRouter(
 # 💬 댓글 목록
 # -------------------------------
 @router.get("/", response_model=list[schemas.project.TaskComment])
-def get_comments(project_id: int, task_id: int, db: Session = Depends(get_db)):
-    task = task_service.get_task_by_id(db, task_id)
+async def get_comments(
+    project_id: int,
+    task_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    최상위 댓글 목록 (작성순, 스레드별 reply_count 포함)
+    - 답글은 GET .../comments/{comment_id}/replies 로 스레드마다 따로 조회
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
+    - 프로젝트 변경 버전 기반 ETag → If-None-Match 일치 시 304
+    """
+    version = await change_service.get_change_version_async(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
+    task = await task_service.get_task_by_id_async(db, task_id)
+    if not task or task.project_id != project_id:
+        not_found("해당 프로젝트 내 태스크를 찾을 수 없습니다.")
+    comments, next_cursor = await comment_service.get_comments_by_task_async(
+        db, task_id, limit, cursor
+    )
+    set_next_cursor(response, next_cursor)
+    return comments
+
+# -------------------------------
+# 💬 답글 목록 (스레드)
+# -------------------------------
+@router.get("/{comment_id}/replies", response_model=list[schemas.project.TaskComment])
+async def get_comment_replies(
+    project_id: int,
+    task_id: int,
+    comment_id: int,
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """한 스레드의 답글 목록 (작성순, X-Next-Cursor 페이지네이션, ETag/304)"""
+    version = await change_service.get_change_version_async(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
+    task = await task_service.get_task_by_id_async(db, task_id)
     if not task or task.project_id != project_id:
         not_found("해당 프로젝트 내 태스크를 찾을 수 없습니다.")
-    return comment_service.get_comments_by_task(db, task_id)
+    replies, next_cursor = await comment_service.get_comment_replies_async(
+        db, task_id, comment_id, limit, cursor
+    )
+    set_next_cursor(response, next_cursor)
+    return replies
 
 # -------------------------------
 # 💬 댓글 작성
@@ -41,6 +98,7 @@ def create_comment(
         task_id=task_id,
         emp_id=current_user.emp_id,
         content=comment.content.strip(),
+        parent_comment_id=comment.parent_comment_id,
     )
 
 # -------------------------------
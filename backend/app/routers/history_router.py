@@ -1,11 +1,14 @@
 # app/routers/history_router.py
-from fastapi import APIRouter, Depends, Query
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.core.exceptions import forbidden, not_found
+from app.core.exceptions import forbidden
 from app.database import get_db
 from app.services import history_service
+from app.utils.pagination import set_next_cursor
 from app.utils.token import get_current_user
 
 router = APIRouter(prefix="/tasks/{task_id}/history", tags=["task_history"])
@@ -14,24 +17,25 @@ router = APIRouter(prefix="/tasks/{task_id}/history", tags=["task_history"])
 # -------------------------------
 # 태스크 이력 조회
 # -------------------------------
-@router.get("/", response_model=list[schemas.activity.ActivityLogSchema])
+@router.get("/", response_model=list[schemas.history.TaskHistoryItem])
 def get_task_history(
     task_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.Employee = Depends(get_current_user),
-    limit: int = Query(50, le=200),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
 ):
     """
-    특정 태스크의 상태 변경 / 담당자 변경 / 코멘트 등의 이력을 조회.
-    limit 기본 50, 최대 200개.
+    특정 태스크의 변경 이력 (상태 변경 + 필드별 이전/새 값), 최신순.
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
     """
     # 접근 권한 검사
     if not history_service.is_project_member(db, task_id, current_user.emp_id):
         forbidden("해당 프로젝트의 멤버만 이력에 접근할 수 있습니다.")
 
-    histories = history_service.get_task_history(db, task_id, limit)
-    if not histories:
-        not_found("이력 정보가 없습니다.")
+    histories, next_cursor = history_service.get_task_history(db, task_id, limit, cursor)
+    set_next_cursor(response, next_cursor)
     return histories
 
 
@@ -39,23 +43,26 @@ def get_task_history(
 # 전체 프로젝트 이력 조회
 # -------------------------------
 @router.get(
-    "/project/{project_id}", response_model=list[schemas.activity.ActivityLogSchema]
+    "/project/{project_id}", response_model=list[schemas.history.TaskHistoryItem]
 )
 def get_project_history(
     project_id: int,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.Employee = Depends(get_current_user),
-    limit: int = Query(100, le=300),
+    limit: int = Query(100, ge=1, le=300),
+    cursor: Optional[str] = Query(None),
 ):
     """
-    프로젝트 전체의 태스크 관련 변경 이력을 조회.
+    프로젝트 전체의 태스크 변경 이력 (최신순, X-Next-Cursor 페이지네이션).
     """
     if not history_service.is_project_member_by_project(
         db, project_id, current_user.emp_id
     ):
         forbidden("해당 프로젝트의 멤버만 접근할 수 있습니다.")
 
-    histories = history_service.get_project_history(db, project_id, limit)
-    if not histories:
-        not_found("해당 프로젝트의 이력 기록이 없습니다.")
+    histories, next_cursor = history_service.get_project_history(
+        db, project_id, limit, cursor
+    )
+    set_next_cursor(response, next_cursor)
     return histories
@@ -0,0 +1,35 @@
+# app/routers/metrics_router.py
+from fastapi import APIRouter, Depends
+
+from app import database
+from app.utils.password_hasher import password_hasher
+from app.utils.pool_metrics import pool_status
+from app.utils.token import get_current_user
+
+# 운영 지표 → 로그인한 사용자만 조회 (비인증 요청은 401)
+router = APIRouter(prefix="/metrics", tags=["metrics"], dependencies=[Depends(get_current_user)])
+
+
+# -------------------------------
+# 🩺 DB 커넥션 풀 지표
+# -------------------------------
+@router.get("/db")
+def get_db_pool_metrics():
+    """
+    워커(프로세스) 단위 커넥션 풀 지표.
+    - checkedout / overflow: 현재 사용 중 연결 수, 기본 풀 초과 연결 수
+    - wait_ms_buckets: 체크아웃 대기 시간 누적 히스토그램, pool_timeouts: 대기 한도 초과 횟수
+    """
+    return {
+        "sync": pool_status(database.engine.pool),
+        "async": pool_status(database.async_engine.pool),
+    }
+
+
+# -------------------------------
+# 🔐 비밀번호 해시 풀 지표
+# -------------------------------
+@router.get("/auth")
+def get_password_hasher_metrics():
+    """bcrypt 프로세스 풀 사용량 + 슬롯 대기 시간 히스토그램 + 거절(503) 횟수"""
+    return password_hasher.status()
@@ -1,12 +1,15 @@
 # app/routers/milestone_router.py
-from fastapi import APIRouter, Depends
+from datetime import date
+
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core.exceptions import conflict, forbidden, not_found
 from app.database import get_db
 from app.models.project import MilestoneStatus
-from app.services import milestone_service
+from app.services import change_service, milestone_service
+from app.utils.http_cache import check_etag, version_etag
 from app.utils.token import get_current_user
 
 router = APIRouter(prefix="/projects/{project_id}/milestones", tags=["milestones"])
@@ -16,9 +19,23 @@ router = APIRouter(prefix="/projects/{project_id}/milestones", tags=["milestones
 # 마일스톤 목록 조회
 # -------------------------------
 @router.get("/", response_model=list[schemas.project.Milestone])
-def get_milestones(project_id: int, db: Session = Depends(get_db)):
+def get_milestones(
+    project_id: int, request: Request, response: Response, db: Session = Depends(get_db)
+):
+    """
+    마일스톤 목록 (If-None-Match 일치 시 304)
+    - 기한 경과 자동 갱신이 날짜에 따라 달라지므로 ETag에 오늘 날짜 포함
+    """
+    version = change_service.get_change_version(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version, date.today()))
+    if cached is not None:
+        return cached
+
     # ✅ 자동 상태 업데이트 (서비스 계층으로 분리)
-    milestone_service.auto_update_missed_milestones(db, project_id)
+    if milestone_service.auto_update_missed_milestones(db, project_id):
+        # 상태가 바뀌면 버전도 올라가므로 새 버전으로 ETag 재설정
+        version = change_service.get_change_version(db, project_id)
+        response.headers["ETag"] = version_etag(request, version, date.today())
     return milestone_service.get_milestones(db, project_id)
 
 
@@ -1,11 +1,13 @@
 # app/routers/notification_router.py
 from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.core.exceptions import bad_request, not_found
-from app.database import get_db
-from app.utils.token import get_current_user
+from app.core.exceptions import bad_request
+from app.database import get_async_db, get_db
+from app.services import notification_service
+from app.utils.token import get_current_user, get_current_user_async
 
 router = APIRouter(prefix="/notifications", tags=["notifications"])
 
@@ -14,9 +16,9 @@ router = APIRouter(prefix="/notifications", tags=["notifications"])
 # 내 알림 목록 조회
 # -------------------------------
 @router.get("/", response_model=schemas.notification.NotificationList)
-def get_notifications(
-    db: Session = Depends(get_db),
-    current_user: models.Member = Depends(get_current_user),
+async def get_notifications(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Member = Depends(get_current_user_async),
     is_read: bool | None = Query(None),
     ntype: str | None = Query(None),
     limit: int = Query(50, le=200),
@@ -27,25 +29,8 @@ def get_notifications(
     - ntype: 알림 유형 필터
     - limit: 최대 표시 개수
     """
-    q = db.query(models.Notification).filter(
-        models.Notification.recipient_emp_id == current_user.emp_id
-    )
-
-    if is_read is not None:
-        q = q.filter(models.Notification.is_read == is_read)
-    if ntype:
-        q = q.filter(models.Notification.type == ntype)
-
-    notifications = q.order_by(models.Notification.created_at.desc()).limit(limit).all()
-
-    total = q.count()
-    unread_count = (
-        db.query(models.Notification)
-        .filter(
-            models.Notification.recipient_emp_id == current_user.emp_id,
-            models.Notification.is_read == False,
-        )
-        .count()
+    notifications, total, unread_count = await notification_service.get_notifications_async(
+        db, current_user.emp_id, is_read=is_read, ntype=ntype, limit=limit
     )
 
     return schemas.notification.NotificationList(
@@ -62,20 +47,7 @@ def mark_notification_as_read(
     db: Session = Depends(get_db),
     current_user: models.Member = Depends(get_current_user),
 ):
-    notif = (
-        db.query(models.Notification)
-        .filter(
-            models.Notification.notification_id == notification_id,
-            models.Notification.recipient_emp_id == current_user.emp_id,
-        )
-        .first()
-    )
-    if not notif:
-        not_found(f"알림 ID {notification_id}를 찾을 수 없습니다.")
-
-    notif.is_read = True
-    db.commit()
-
+    notification_service.mark_as_read(db, notification_id, current_user.emp_id)
     return {"success": True, "message": f"알림 {notification_id} 읽음 처리 완료"}
 
 
@@ -87,15 +59,7 @@ def mark_all_as_read(
     db: Session = Depends(get_db),
     current_user: models.Member = Depends(get_current_user),
 ):
-    updated_count = (
-        db.query(models.Notification)
-        .filter(
-            models.Notification.recipient_emp_id == current_user.emp_id,
-            models.Notification.is_read == False,
-        )
-        .update({"is_read": True})
-    )
-    db.commit()
+    updated_count = notification_service.mark_all_as_read(db, current_user.emp_id)
     return {"success": True, "updated": updated_count}
 
 
@@ -103,18 +67,11 @@ def mark_all_as_read(
 # 안 읽은 알림 개수 조회
 # -------------------------------
 @router.get("/unread/count")
-def get_unread_count(
-    db: Session = Depends(get_db),
-    current_user: models.Member = Depends(get_current_user),
+async def get_unread_count(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Member = Depends(get_current_user_async),
 ):
-    count = (
-        db.query(models.Notification)
-        .filter(
-            models.Notification.recipient_emp_id == current_user.emp_id,
-            models.Notification.is_read == False,
-        )
-        .count()
-    )
+    count = await notification_service.get_unread_count_async(db, current_user.emp_id)
     return {"unread_count": count}
 
 
@@ -127,17 +84,5 @@ def delete_notification(
     db: Session = Depends(get_db),
     current_user: models.Member = Depends(get_current_user),
 ):
-    notif = (
-        db.query(models.Notification)
-        .filter(
-            models.Notification.notification_id == notification_id,
-            models.Notification.recipient_emp_id == current_user.emp_id,
-        )
-        .first()
-    )
-    if not notif:
-        not_found("삭제할 알림을 찾을 수 없습니다.")
-
-    db.delete(notif)
-    db.commit()
+    notification_service.delete_notification(db, notification_id, current_user.emp_id)
     return {"success": True, "message": f"알림 {notification_id} 삭제 완료"}
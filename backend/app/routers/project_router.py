@@ -1,11 +1,17 @@
 # app/routers/project_router.py
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core.exceptions import conflict, forbidden, not_found
-from app.database import get_db
-from app.services import project_service
+from app.database import get_async_db, get_db
+from app.models.enums import ProjectStatus
+from app.services import change_service, milestone_service, project_service
+from app.services.activity_logger import is_project_member
+from app.utils.pagination import set_next_cursor
 from app.utils.token import get_current_user
 
 router = APIRouter(prefix="/projects", tags=["projects"])
@@ -14,10 +20,31 @@ router = APIRouter(prefix="/projects", tags=["projects"])
 # -------------------------------
 # 전체 프로젝트 조회
 # -------------------------------
-@router.get("/", response_model=list[schemas.project.Project])
-def read_projects(db: Session = Depends(get_db)):
-    """모든 프로젝트 목록 조회"""
-    return project_service.get_all_projects(db)
+@router.get("/", response_model=list[schemas.project.ProjectSummary])
+async def read_projects(
+    response: Response,
+    status: Optional[List[ProjectStatus]] = Query(None),
+    owner_emp_id: Optional[int] = Query(None),
+    member_emp_id: Optional[int] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    프로젝트 요약 목록 (최신순, 상태별/지연 업무 수·멤버 수 포함)
+    - 업무·댓글·마일스톤 전체가 필요하면 GET /projects/{project_id}
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
+    """
+    items, next_cursor = await project_service.get_project_summaries_async(
+        db,
+        statuses=status,
+        owner_emp_id=owner_emp_id,
+        member_emp_id=member_emp_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
+    return items
 
 
 # -------------------------------
@@ -31,6 +58,33 @@ def read_project(project_id: int, db: Session = Depends(get_db)):
     return project
 
 
+# -------------------------------
+# 증분 동기화 (since 버전 이후 변경분)
+# -------------------------------
+@router.get("/{project_id}/changes", response_model=schemas.change.ProjectChangeSet)
+def read_project_changes(
+    project_id: int,
+    since: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=change_service.CHANGES_MAX_LIMIT),
+    db: Session = Depends(get_db),
+    current_user: models.Employee = Depends(get_current_user),
+):
+    """
+    since 이후 추가·수정된 업무/마일스톤/댓글/첨부파일 + 삭제 툼스톤
+    - 응답의 version을 다음 요청의 since로 사용 (최초 동기화는 since=0)
+    - has_more면 같은 방식으로 이어서 요청, reset이면 전체 재조회
+    """
+    if not is_project_member(db, project_id, current_user.emp_id):
+        forbidden("프로젝트 멤버만 변경 내역을 조회할 수 있습니다.")
+
+    # 기한이 지난 마일스톤 상태 반영 (변경되면 버전도 함께 증가)
+    milestone_service.auto_update_missed_milestones(db, project_id)
+    changes = change_service.get_project_changes(db, project_id, since, limit)
+    if changes is None:
+        not_found(f"프로젝트 ID {project_id}를 찾을 수 없습니다.")
+    return changes
+
+
 # -------------------------------
 # 프로젝트 생성
 # -------------------------------
@@ -0,0 +1,46 @@
+# app/routers/search_router.py
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models, schemas
+from app.database import get_async_db
+from app.models.enums import SearchTarget
+from app.services import search_service
+from app.utils.pagination import set_next_cursor
+from app.utils.token import get_current_user_async
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+# -------------------------------
+# 🔍 업무 / 댓글 통합 검색
+# -------------------------------
+@router.get("/", response_model=list[schemas.search.SearchResult])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="검색어 (공백으로 여러 단어)"),
+    type: Optional[List[SearchTarget]] = Query(None, description="task | comment (기본: 전체)"),
+    project_id: Optional[int] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Member = Depends(get_current_user_async),
+):
+    """
+    내가 멤버인 프로젝트의 업무(제목·설명)와 댓글을 관련도순으로 검색
+    - 모든 단어를 포함한 결과만 반환 (단어는 2자 이상)
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
+    """
+    items, next_cursor = await search_service.search_async(
+        db,
+        current_user.emp_id,
+        q,
+        targets=type,
+        project_id=project_id,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
+    return items
@@ -1,14 +1,27 @@
 # app/routers/task_router.py
-from typing import List
-from fastapi import APIRouter, Depends, File, UploadFile
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, File, Query, Request, Response, UploadFile
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
-from app.core.exceptions import not_found
-from app.database import get_db
+from app.core.exceptions import forbidden, not_found
+from app.database import get_async_db, get_db
+from app.models.enums import TaskPriority, TaskStatus
 from app.schemas import attachment as attachment_schema
-from app.services import attachment_service, task_service
-from app.utils.token import get_current_user
+from app.services import attachment_service, change_service, task_service
+from app.services.activity_logger import is_project_member
+from app.utils.http_cache import (
+    check_etag,
+    http_date,
+    is_not_modified,
+    not_modified,
+    version_etag,
+)
+from app.utils.pagination import set_next_cursor
+from app.utils.token import get_current_user, get_current_user_async
 
 # ✅ /projects/... 으로 시작
 router = APIRouter(prefix="/projects", tags=["tasks"])
@@ -17,58 +30,80 @@ router = APIRouter(prefix="/projects", tags=["tasks"])
 # 🌳 트리형 태스크 목록
 # =====================================================
 @router.get("/{project_id}/tasks/tree", response_model=List[schemas.project.TaskTree])
-def get_task_tree(
+async def get_task_tree(
     project_id: int,
-    db: Session = Depends(get_db),
-    current_user: models.Employee = Depends(get_current_user),
+    request: Request,
+    response: Response,
+    root_task_id: Optional[int] = Query(None),
+    depth: Optional[int] = Query(None, ge=1),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: models.Employee = Depends(get_current_user_async),
 ):
-    """특정 프로젝트의 트리형(Task Tree) 구조 반환"""
-    roots = (
-        db.query(models.Task)
-        .filter(
-            models.Task.project_id == project_id,
-            models.Task.parent_task_id.is_(None),
-        )
-        .all()
+    """특정 프로젝트의 트리형(Task Tree) 구조 반환 (root_task_id: 하위 트리, depth: 최대 깊이)"""
+    version = await change_service.get_change_version_async(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
+    tree = await task_service.get_task_tree_async(
+        db, project_id, root_task_id=root_task_id, max_depth=depth
     )
-    if not roots:
+    if tree is None:
+        if root_task_id is not None:
+            not_found("해당 프로젝트 내에서 상위 업무를 찾을 수 없습니다.")
         not_found("등록된 상위 업무가 없습니다.")
-
-    def build_tree(task):
-        subtasks = (
-            db.query(models.Task)
-            .filter(models.Task.parent_task_id == task.task_id)
-            .all()
-        )
-        return {
-            "task_id": task.task_id,
-            "project_id": task.project_id,
-            "title": task.title,
-            "description": task.description,
-            "status": task.status,
-            "priority": task.priority,
-            "start_date": task.start_date,
-            "due_date": task.due_date,
-            "assignee_emp_id": task.assignee_emp_id,
-            "assignee_name": task.assignee.name if task.assignee else None,
-            "subtasks": [build_tree(sub) for sub in subtasks],
-        }
-
-    return [build_tree(t) for t in roots]
+    return tree
 
 
 # =====================================================
 # 📋 태스크 CRUD
 # =====================================================
-@router.get("/{project_id}/tasks", response_model=List[schemas.project.Task])
-def get_tasks_by_project(
+@router.get("/{project_id}/tasks", response_model=List[schemas.project.TaskSummary])
+async def get_tasks_by_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    status: Optional[List[TaskStatus]] = Query(None),
+    priority: Optional[List[TaskPriority]] = Query(None),
+    assignee_emp_id: Optional[int] = Query(None),
+    parent_task_id: Optional[int] = Query(None),
+    top_level: bool = Query(False, description="true면 최상위 업무만"),
+    due_from: Optional[date] = Query(None),
+    due_to: Optional[date] = Query(None),
+    sort: str = Query(
+        "due_date",
+        description="due_date | start_date | created_at | updated_at | task_id ('-' 접두어: 내림차순)",
+    ),
+    limit: int = Query(200, ge=1, le=500),
+    cursor: Optional[str] = Query(None),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    """특정 프로젝트의 모든 태스크 목록"""
-    tasks = task_service.get_tasks_by_project(db, project_id)
-    if not tasks:
-        not_found(f"프로젝트 {project_id}에 등록된 태스크가 없습니다.")
+    """
+    특정 프로젝트의 태스크 요약 목록 (댓글 미포함)
+    - 필터: 상태/우선순위(복수 가능), 담당자, 상위 업무, 마감일 범위
+    - 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서 반환 → ?cursor= 로 이어서 조회
+    - 프로젝트 변경 버전 기반 ETag → If-None-Match 일치 시 304 (목록 조회 생략)
+    """
+    version = await change_service.get_change_version_async(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
+    tasks, next_cursor = await task_service.get_tasks_by_project_async(
+        db,
+        project_id,
+        statuses=status,
+        priorities=priority,
+        assignee_emp_id=assignee_emp_id,
+        parent_task_id=parent_task_id,
+        top_level=top_level,
+        due_from=due_from,
+        due_to=due_to,
+        sort=sort,
+        limit=limit,
+        cursor=cursor,
+    )
+    set_next_cursor(response, next_cursor)
     return tasks
 
 
@@ -76,9 +111,16 @@ def get_tasks_by_project(
 def get_task(
     project_id: int,
     task_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
 ):
     """개별 태스크 상세 조회"""
+    version = change_service.get_change_version(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
     task = task_service.get_task_by_id(db, task_id)
     if not task or task.project_id != project_id:
         not_found("해당 프로젝트 내에서 태스크를 찾을 수 없습니다.")
@@ -165,10 +207,17 @@ def delete_task(
 def get_task_attachments(
     project_id: int,
     task_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: models.Employee = Depends(get_current_user),
 ):
     """첨부파일 목록"""
+    version = change_service.get_change_version(db, project_id)
+    cached = check_etag(request, response, version_etag(request, version))
+    if cached is not None:
+        return cached
+
     task = task_service.get_task_by_id(db, task_id)
     if not task or task.project_id != project_id:
         not_found("해당 프로젝트 내에 태스크가 없습니다.")
@@ -199,6 +248,46 @@ def upload_task_attachment(
     )
 
 
+@router.get("/{project_id}/tasks/{task_id}/attachments/{attachment_id}/content")
+def download_task_attachment(
+    project_id: int,
+    task_id: int,
+    attachment_id: int,
+    request: Request,
+    inline: bool = Query(False, description="true면 브라우저에서 바로 열기"),
+    db: Session = Depends(get_db),
+    current_user: models.Employee = Depends(get_current_user),
+):
+    """
+    첨부파일 다운로드
+    - Range / If-Range 지원 (이어받기, 부분 요청 → 206)
+    - 내용 해시 기반 강한 ETag + Last-Modified → If-None-Match / If-Modified-Since 일치 시 304
+    - 파일을 메모리에 올리지 않고 청크 단위로 전송
+    """
+    if not is_project_member(db, project_id, current_user.emp_id):
+        forbidden("이 프로젝트의 첨부파일을 내려받을 권한이 없습니다.")
+    attachment = attachment_service.get_attachment_for_download(
+        db, project_id, task_id, attachment_id
+    )
+
+    headers = {"Cache-Control": "private, no-cache"}
+    etag = attachment_service.attachment_etag(attachment)
+    if etag:
+        headers["ETag"] = etag
+    if attachment.uploaded_at:
+        headers["Last-Modified"] = http_date(attachment.uploaded_at)
+    if is_not_modified(request, etag, attachment.uploaded_at):
+        return not_modified(headers)
+
+    return FileResponse(
+        attachment.file_path,
+        media_type=attachment.file_type or "application/octet-stream",
+        filename=attachment.file_name,
+        content_disposition_type="inline" if inline else "attachment",
+        headers=headers,
+    )
+
+
 @router.delete("/{project_id}/tasks/{task_id}/attachments/{attachment_id}")
 def delete_task_attachment(
     project_id: int,
@@ -212,3 +301,22 @@ def delete_task_attachment(
     if not task or task.project_id != project_id:
         not_found("삭제할 태스크를 찾을 수 없습니다.")
     return attachment_service.delete_attachment(db, attachment_id, current_user)
+
+
+# =====================================================
+# 📦 태스크 일괄 작업
+# =====================================================
+@router.post(
+    "/{project_id}/tasks:batch",
+    response_model=schemas.project.TaskBatchResponse,
+)
+def batch_tasks(
+    project_id: int,
+    request: schemas.project.TaskBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: models.Employee = Depends(get_current_user),
+):
+    """태스크 생성/수정/상태 변경/삭제를 한 요청·한 트랜잭션으로 처리 (항목별 결과 반환)"""
+    return task_service.apply_task_batch(
+        db, project_id, request.operations, current_user.emp_id
+    )
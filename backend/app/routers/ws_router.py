@@ -1,28 +1,105 @@
 # app/routers/ws_router.py
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import Dict, List
 import json
 
-router = APIRouter()
-active_connections: Dict[int, List[WebSocket]] = {}
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from sqlalchemy import select
+
+from app import database
+from app.models.member import Member
+from app.schemas.event import NotificationEvent, NotificationEventType
+from app.services import notification_service
+from app.services.activity_logger import is_project_member_async
+from app.utils.event_bus import event_bus, project_channel, user_channel
+from app.utils.token import decode_login_id
+
+router = APIRouter(tags=["websocket"])
+
 
 async def notify_project(project_id: int, message: dict):
-    if project_id in active_connections:
-        for conn in active_connections[project_id]:
-            await conn.send_text(json.dumps(message))
+    """프로젝트 구독자 전체에게 임의 메시지 발행 (서비스 이벤트는 stage_project_event 사용)"""
+    await event_bus.publish(project_channel(project_id), json.dumps(message, ensure_ascii=False))
+
+
+async def _authenticate(websocket: WebSocket, token: str | None) -> int | None:
+    """
+    ?token=<JWT> (브라우저 WebSocket은 헤더 지정 불가) 또는 Authorization: Bearer → emp_id.
+    실패하면 None (호출 측에서 1008로 종료)
+    """
+    authorization = websocket.headers.get("authorization", "")
+    if not token and authorization.startswith("Bearer "):
+        token = authorization.split(" ")[1]
+
+    try:
+        login_id = decode_login_id(token or "")
+    except HTTPException:
+        return None
+
+    async with database.AsyncSessionLocal() as db:
+        member = (
+            await db.execute(select(Member).where(Member.login_id == login_id))
+        ).scalar_one_or_none()
+    return member.emp_id if member and member.emp_id else None
+
 
 @router.websocket("/ws/projects/{project_id}")
-async def project_ws(websocket: WebSocket, project_id: int):
-    project_id = int(project_id)
+async def project_ws(websocket: WebSocket, project_id: int, token: str | None = Query(None)):
+    """
+    프로젝트 이벤트 스트림 (태스크·댓글·마일스톤 변경).
+    - 인증은 /ws/notifications와 동일, 프로젝트 멤버만 구독 가능 (accept 이전에 검사)
+    """
+    emp_id = await _authenticate(websocket, token)
+    if emp_id is None:
+        await websocket.close(code=1008)
+        return
+    async with database.AsyncSessionLocal() as db:
+        is_member = await is_project_member_async(db, project_id, emp_id)
+    if not is_member:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    subscriber = event_bus.subscribe(project_channel(project_id), websocket)
+
+    try:
+        while True:
+            # 클라이언트 → 서버 메시지는 keep-alive 용도로만 수신
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        event_bus.unsubscribe(subscriber)
+
+
+@router.websocket("/ws/notifications")
+async def notification_ws(websocket: WebSocket, token: str | None = Query(None)):
+    """
+    개인 알림 스트림 (배지 polling 대체).
+    - 인증: ?token=<JWT> (브라우저 WebSocket은 헤더 지정 불가) 또는 Authorization: Bearer
+    - 연결 직후 notification.sync로 현재 안 읽은 개수 전송, 이후 커밋된 변경만 푸시
+    """
+    emp_id = await _authenticate(websocket, token)
+    if emp_id is None:
+        await websocket.close(code=1008)
+        return
+
+    async with database.AsyncSessionLocal() as db:
+        unread_count = await notification_service.get_unread_count_async(db, emp_id)
+
     await websocket.accept()
-    if project_id not in active_connections:
-        active_connections[project_id] = []
-    active_connections[project_id].append(websocket)
+    subscriber = event_bus.subscribe(user_channel(emp_id), websocket)
+    event_bus.send_to(
+        subscriber,
+        NotificationEvent(
+            event=NotificationEventType.sync,
+            recipient_emp_id=emp_id,
+            unread_count=unread_count,
+        ).model_dump_json(),
+    )
 
     try:
         while True:
-            data = await websocket.receive_text()
-            print("📥 WebSocket 수신:", data)
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        active_connections[project_id].remove(websocket)
-        print(f"🔌 WebSocket 연결 종료: {project_id}")
+        pass
+    finally:
+        event_bus.unsubscribe(subscriber)
@@ -1,8 +1,12 @@
 # app/schemas/__init__.py
 from .activity import ActivityFeedItem, ActivityLogSchema
+from .analytics import ProjectFlow, TaskFlow
 from .auth import LoginRequest, LoginResponse, SignupRequest, SignupResponse, UserType
+from .change import ChangeTombstone, ProjectChangeSet
 from .department import Department, DepartmentCreate
 from .employee import Employee
+from .event import NotificationEvent, NotificationEventType, ProjectEvent, ProjectEventType
+from .history import TaskHistoryItem
 from .notification import Notification as NotificationSchema
 from .project import (
     Milestone,
@@ -10,11 +14,14 @@ from .project import (
     Project,
     ProjectCreate,
     ProjectMember,
+    ProjectSummary,
     ProjectUpdate,
     Task,
     TaskComment,
     TaskCommentCreate,
     TaskCreate,
+    TaskSummary,
     TaskUpdate,
 )
 from .role import Role
+from .search import SearchResult
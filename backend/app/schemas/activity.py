@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, computed_field, field_serializer
 
 from app.models.activity_log import ActivityAction
 
@@ -23,12 +23,20 @@ class ActivityLogSchema(BaseModel):
 
 
 class ActivityFeedItem(BaseModel):
+    log_id: int
     created_at: datetime
     emp_id: int
+    emp_name: Optional[str] = None
     task_id: Optional[int] = None
-    type: Optional[str] = None
+    action: ActivityAction
     detail: Optional[str] = None
 
+    @computed_field
+    @property
+    def type(self) -> str:
+        """기존 응답 필드 호환 (action과 같은 값)"""
+        return self.action.value
+
     @field_serializer("created_at", when_used="always")
     def serialize_datetime(self, v: datetime, _info):
         return v.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,62 @@
+# app/schemas/analytics.py
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, field_serializer
+
+from app.models.enums import TaskStatus
+
+
+# ----------------------------
+# 시간 분포 요약 (단위: 시간)
+# ----------------------------
+class FlowSummary(BaseModel):
+    count: int = 0
+    mean_hours: Optional[float] = None
+    p50_hours: Optional[float] = None
+    p75_hours: Optional[float] = None
+    p85_hours: Optional[float] = None
+    p95_hours: Optional[float] = None
+    max_hours: Optional[float] = None
+
+
+class StatusTimeSummary(FlowSummary):
+    total_hours: float = 0
+
+
+class CycleTimeBucket(BaseModel):
+    le_days: Optional[int] = None  # None = 마지막 구간 초과분
+    count: int
+
+
+# ----------------------------
+# 프로젝트 흐름 지표 (GET /projects/{id}/analytics/flow)
+# ----------------------------
+class ProjectFlow(BaseModel):
+    project_id: int
+    task_count: int
+    completed_count: int
+    wip_count: int
+    lead_time: FlowSummary
+    cycle_time: FlowSummary
+    cycle_time_histogram: List[CycleTimeBucket]
+    wip_age: FlowSummary
+    time_in_status: Dict[str, StatusTimeSummary]
+
+
+# ----------------------------
+# 태스크 흐름 (GET /projects/{id}/analytics/flow/tasks/{task_id})
+# ----------------------------
+class TaskFlow(BaseModel):
+    task_id: int
+    status: Optional[TaskStatus] = None
+    started_at: Optional[datetime] = None
+    done_at: Optional[datetime] = None
+    transitions: int = 0
+    lead_time_hours: Optional[float] = None
+    cycle_time_hours: Optional[float] = None
+    time_in_status_hours: Dict[str, float]
+
+    @field_serializer("started_at", "done_at", when_used="always")
+    def serialize_datetime(self, v: Optional[datetime], _info):
+        return v.strftime("%Y-%m-%d %H:%M:%S") if v else None
@@ -12,6 +12,7 @@ class AttachmentBase(BaseModel):
     file_path: str
     file_size: int | None = None
     file_type: str | None = None
+    content_hash: str | None = None
 
 
 # -------------------------------
@@ -0,0 +1,37 @@
+# app/schemas/change.py
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.models.enums import ChangeEntityType
+from app.schemas.attachment import Attachment
+from app.schemas.project import Milestone, TaskComment, TaskSummary
+
+
+# ----------------------------
+# 삭제 툼스톤
+# ----------------------------
+class ChangeTombstone(BaseModel):
+    entity_type: ChangeEntityType
+    entity_id: int
+    version: int
+
+
+# ----------------------------
+# 증분 동기화 응답 (GET /projects/{id}/changes?since=)
+# ----------------------------
+class ProjectChangeSet(BaseModel):
+    """
+    since 이후 변경분. 클라이언트는 upsert 목록을 덮어쓰고 deleted를 제거한 뒤
+    version을 다음 요청의 since로 사용 (has_more면 바로 이어서 요청)
+    """
+
+    since: int
+    version: int
+    has_more: bool = False
+    reset: bool = False  # true면 로컬 상태를 버리고 전체 재조회
+    tasks: List[TaskSummary] = Field(default_factory=list)
+    milestones: List[Milestone] = Field(default_factory=list)
+    comments: List[TaskComment] = Field(default_factory=list)
+    attachments: List[Attachment] = Field(default_factory=list)
+    deleted: List[ChangeTombstone] = Field(default_factory=list)
@@ -0,0 +1,62 @@
+# app/schemas/event.py
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional
+
+from pydantic import BaseModel, Field
+
+
+# ----------------------------------------
+# 실시간 이벤트 유형
+# ----------------------------------------
+class ProjectEventType(str, Enum):
+    # 📋 업무(Task)
+    task_created = "task.created"
+    task_updated = "task.updated"
+    task_status_changed = "task.status_changed"
+    task_deleted = "task.deleted"
+
+    # 💬 댓글
+    comment_created = "comment.created"
+    comment_updated = "comment.updated"
+    comment_deleted = "comment.deleted"
+
+    # 📎 첨부파일
+    attachment_added = "attachment.added"
+    attachment_removed = "attachment.removed"
+
+    # 🎯 마일스톤
+    milestone_created = "milestone.created"
+    milestone_updated = "milestone.updated"
+    milestone_deleted = "milestone.deleted"
+
+
+# ----------------------------------------
+# WebSocket으로 전달되는 이벤트 본문
+# ----------------------------------------
+class ProjectEvent(BaseModel):
+    event: ProjectEventType
+    project_id: int
+    actor_emp_id: Optional[int] = None
+    payload: dict[str, Any] = Field(default_factory=dict)
+    emitted_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+# ----------------------------------------
+# 개인 알림 스트림 (/ws/notifications)
+# ----------------------------------------
+class NotificationEventType(str, Enum):
+    sync = "notification.sync"  # 연결 직후 현재 안 읽은 개수
+    created = "notification.created"
+    read = "notification.read"
+    read_all = "notification.read_all"
+    deleted = "notification.deleted"
+
+
+class NotificationEvent(BaseModel):
+    event: NotificationEventType
+    recipient_emp_id: int
+    unread_delta: int = 0  # 배지 증감
+    unread_count: Optional[int] = None  # 절대값이 확실할 때만 (sync, read_all)
+    payload: dict[str, Any] = Field(default_factory=dict)
+    emitted_at: datetime = Field(default_factory=datetime.utcnow)
@@ -0,0 +1,28 @@
+# app/schemas/history.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, field_serializer
+
+from app.models.enums import TaskStatus
+
+
+# ----------------------------
+# 태스크 변경 이력
+# ----------------------------
+class TaskHistoryItem(BaseModel):
+    history_id: int
+    task_id: int
+    project_id: int
+    old_status: Optional[TaskStatus] = None
+    new_status: Optional[TaskStatus] = None
+    changes: Optional[Dict[str, List[Any]]] = None  # {"필드": [이전 값, 새 값]}
+    changed_by: Optional[int] = None
+    changed_by_name: Optional[str] = None
+    changed_at: Optional[datetime] = None
+
+    @field_serializer("changed_at", when_used="always")
+    def serialize_datetime(self, v: Optional[datetime], _info):
+        return v.strftime("%Y-%m-%d %H:%M:%S") if v else None
+
+    model_config = {"from_attributes": True}
@@ -1,6 +1,6 @@
 # app/schemas/project.py
 from datetime import date, datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_serializer, field_validator
 
@@ -33,6 +33,7 @@ class TaskComment(TaskCommentBase):
     author_name: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
+    reply_count: int = 0  # 최상위 댓글의 답글 수 (답글 목록은 /replies로 따로 조회)
 
     @field_serializer("created_at", "updated_at", when_used="always")
     def serialize_datetime(self, v: Optional[datetime], _info):
@@ -91,6 +92,42 @@ class TaskStatusUpdate(BaseModel):
     status: TaskStatus
 
 
+# ----------------------------
+# Task 일괄 작업 (batch)
+# ----------------------------
+class TaskBatchFields(TaskUpdate):
+    parent_task_id: Optional[int] = None  # 상위 업무 이동
+
+    @field_validator("priority", "status", mode="before")
+    def normalize_enum(cls, v):
+        return v.upper() if isinstance(v, str) else v
+
+
+class TaskBatchOperation(BaseModel):
+    op: Literal["create", "update", "status", "delete"]
+    task_id: Optional[int] = None  # update / status / delete 대상
+    fields: Optional[TaskBatchFields] = None  # create / update 값
+    status: Optional[TaskStatus] = None  # status 변경 값
+
+
+class TaskBatchRequest(BaseModel):
+    operations: List[TaskBatchOperation] = Field(..., min_length=1, max_length=500)
+
+
+class TaskBatchResult(BaseModel):
+    index: int
+    op: str
+    success: bool
+    task_id: Optional[int] = None
+    detail: Optional[str] = None
+
+
+class TaskBatchResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[TaskBatchResult]
+
+
 class Task(TaskBase):
     task_id: int
     project_id: int
@@ -100,6 +137,31 @@ class Task(TaskBase):
     model_config = {"from_attributes": True}
 
 
+class TaskSummary(BaseModel):
+    """목록용 경량 태스크 (설명·댓글 제외)"""
+
+    task_id: int
+    project_id: int
+    parent_task_id: Optional[int] = None
+    title: str
+    status: TaskStatus
+    priority: TaskPriority
+    assignee_emp_id: Optional[int] = None
+    assignee_name: Optional[str] = None
+    start_date: Optional[date] = None
+    due_date: Optional[date] = None
+    estimate_hours: float = 0.0
+    progress: int = 0
+    # 하위 업무 롤업 (모든 하위 업무 수 / 완료 수 / 예상 시간 가중 진행률, 하위 업무가 없으면 None)
+    rollup_task_count: int = 0
+    rollup_done_count: int = 0
+    rollup_progress: Optional[float] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
+
+
 class TaskTree(BaseModel):
     task_id: int
     project_id: int
@@ -112,6 +174,11 @@ class TaskTree(BaseModel):
     assignee_emp_id: Optional[int] = None
     assignee_name: Optional[str] = None
     progress: Optional[int] = 0
+    parent_task_id: Optional[int] = None
+    subtask_count: int = 0  # depth 제한으로 잘린 경우에도 하위 업무 수 유지
+    rollup_task_count: int = 0  # 모든 하위 업무 수 (직계 + 그 아래)
+    rollup_done_count: int = 0
+    rollup_progress: Optional[float] = None  # 예상 시간 가중 진행률
     subtasks: List["TaskTree"] = []  # 자기참조
 
     class Config:
@@ -188,6 +255,20 @@ class ProjectUpdate(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class ProjectSummary(ProjectBase):
+    """목록용 경량 프로젝트 (하위 객체 대신 집계 값)"""
+
+    project_id: int
+    owner_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    member_count: int = 0
+    task_count: int = 0
+    overdue_count: int = 0  # 마감일이 지났고 DONE이 아닌 업무
+    task_status_counts: Dict[str, int] = Field(default_factory=dict)  # TaskStatus → 업무 수
+
+    model_config = {"from_attributes": True}
+
+
 class Project(ProjectBase):
     project_id: int
     members: List[ProjectMember] = Field(default_factory=list)
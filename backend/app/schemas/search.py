@@ -0,0 +1,21 @@
+# app/schemas/search.py
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from app.models.enums import SearchTarget
+
+
+# ----------------------------
+# 검색 결과 (업무 / 댓글)
+# ----------------------------
+class SearchResult(BaseModel):
+    type: SearchTarget
+    entity_id: int  # task_id 또는 comment_id
+    project_id: int
+    task_id: int
+    task_title: str
+    snippet: Optional[str] = None  # 검색어 주변 본문 일부
+    score: float
+    updated_at: Optional[datetime] = None
@@ -1,10 +1,12 @@
 # app/services/activity_logger.py
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
 
 
 # -------------------------------
@@ -37,82 +39,123 @@ def log_activity(
 
 
 # -------------------------------
-# ✅ 프로젝트 단위 활동 피드 조회
+# ✅ 공통: 키셋(created_at, log_id) 페이지 조회
 # -------------------------------
-def get_project_activity(db: Session, project_id: int, limit: int = 100):
-    logs = (
-        db.query(models.ActivityLog)
-        .join(models.Employee, models.Employee.emp_id == models.ActivityLog.emp_id)
-        .filter(models.ActivityLog.project_id == project_id)
-        .order_by(models.ActivityLog.created_at.desc())
-        .limit(limit)
-        .all()
+def _activity_page_stmt(filters: list, limit: int, cursor: str | None):
+    """
+    최신순 활동 로그 한 페이지 조회 SQL.
+    (project_id|task_id, created_at, log_id) 복합 인덱스를 따라 범위 스캔하므로
+    오래된 페이지도 첫 페이지와 같은 비용으로 조회됨.
+    """
+    Log = models.ActivityLog
+    # ActivityFeedItem에 필요한 컬럼만 Core select로 조회 (ORM 객체 생성 없음)
+    stmt = (
+        select(
+            Log.log_id,
+            Log.action,
+            Log.detail,
+            Log.created_at,
+            Log.task_id,
+            Log.emp_id,
+            func.coalesce(models.Employee.name, "시스템").label("emp_name"),
+        )
+        .outerjoin(models.Employee, models.Employee.emp_id == Log.emp_id)
+        .where(*filters)
     )
 
-    result = []
-    for log in logs:
-        result.append(
-            {
-                "log_id": log.log_id,
-                "action": log.action,
-                "detail": log.detail,
-                "created_at": log.created_at,
-                "task_id": log.task_id,
-                "emp_id": log.emp_id,
-                "emp_name": (
-                    getattr(log, "employee", None).name
-                    if getattr(log, "employee", None)
-                    else "시스템"
-                ),
-            }
+    if cursor:
+        created_at, log_id = decode_cursor(cursor, 2)
+        created_at = decode_datetime(created_at)
+        stmt = stmt.where(
+            or_(
+                Log.created_at < created_at,
+                and_(Log.created_at == created_at, Log.log_id < log_id),
+            )
         )
-    return result
+
+    return stmt.order_by(Log.created_at.desc(), Log.log_id.desc()).limit(limit + 1)
+
+
+def _to_page(rows, limit: int):
+    """limit+1 행 → (로그 dict 리스트, 다음 페이지 커서 | None)"""
+    rows = [dict(row) for row in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["log_id"])
+    return rows, next_cursor
+
+
+def _get_activity_page(db: Session, filters: list, limit: int, cursor: str | None):
+    return _to_page(db.execute(_activity_page_stmt(filters, limit, cursor)).mappings(), limit)
+
+
+async def _get_activity_page_async(db: AsyncSession, filters: list, limit: int, cursor: str | None):
+    result = await db.execute(_activity_page_stmt(filters, limit, cursor))
+    return _to_page(result.mappings(), limit)
+
+
+def _project_filters(project_id: int) -> list:
+    return [models.ActivityLog.project_id == project_id]
+
+
+def _task_filters(project_id: int, task_id: int) -> list:
+    return [
+        models.ActivityLog.task_id == task_id,
+        models.ActivityLog.project_id == project_id,
+    ]
+
+
+# -------------------------------
+# ✅ 프로젝트 단위 활동 피드 조회
+# -------------------------------
+def get_project_activity(db: Session, project_id: int, limit: int = 100, cursor: str | None = None):
+    return _get_activity_page(db, _project_filters(project_id), limit, cursor)
+
+
+async def get_project_activity_async(
+    db: AsyncSession, project_id: int, limit: int = 100, cursor: str | None = None
+):
+    return await _get_activity_page_async(db, _project_filters(project_id), limit, cursor)
 
 
 # -------------------------------
 # ✅ 업무 단위 활동 피드 조회
 # -------------------------------
-def get_task_activity(db: Session, project_id: int, task_id: int, limit: int = 100):
-    logs = (
-        db.query(models.ActivityLog)
-        .join(models.Employee, models.Employee.emp_id == models.ActivityLog.emp_id)
-        .filter(models.ActivityLog.project_id == project_id)
-        .filter(models.ActivityLog.task_id == task_id)
-        .order_by(models.ActivityLog.created_at.desc())
-        .limit(limit)
-        .all()
-    )
+def get_task_activity(
+    db: Session,
+    project_id: int,
+    task_id: int,
+    limit: int = 100,
+    cursor: str | None = None,
+):
+    return _get_activity_page(db, _task_filters(project_id, task_id), limit, cursor)
 
-    result = []
-    for log in logs:
-        result.append(
-            {
-                "log_id": log.log_id,
-                "action": log.action,
-                "detail": log.detail,
-                "created_at": log.created_at,
-                "task_id": log.task_id,
-                "emp_id": log.emp_id,
-                "emp_name": (
-                    getattr(log, "employee", None).name
-                    if getattr(log, "employee", None)
-                    else "시스템"
-                ),
-            }
-        )
-    return result
+
+async def get_task_activity_async(
+    db: AsyncSession,
+    project_id: int,
+    task_id: int,
+    limit: int = 100,
+    cursor: str | None = None,
+):
+    return await _get_activity_page_async(db, _task_filters(project_id, task_id), limit, cursor)
 
 
 # -------------------------------
 # ✅ 권한 확인 유틸
 # -------------------------------
-def is_project_member(db: Session, project_id: int, emp_id: int) -> bool:
-    exists = (
-        db.query(models.ProjectMember)
-        .filter(
-            models.ProjectMember.project_id == project_id,
-            models.ProjectMember.emp_id == emp_id,
-        )
-        .first()
+def _member_exists_stmt(project_id: int, emp_id: int):
+    return select(models.ProjectMember.emp_id).where(
+        models.ProjectMember.project_id == project_id,
+        models.ProjectMember.emp_id == emp_id,
     )
-    return bool(exists)
+
+
+def is_project_member(db: Session, project_id: int, emp_id: int) -> bool:
+    return db.execute(_member_exists_stmt(project_id, emp_id)).first() is not None
+
+
+async def is_project_member_async(db: AsyncSession, project_id: int, emp_id: int) -> bool:
+    result = await db.execute(_member_exists_stmt(project_id, emp_id))
+    return result.first() is not None
@@ -1,19 +1,47 @@
 # app/services/attachment_service.py
+import asyncio
+import hashlib
+import logging
+import mimetypes
 import os
+import tempfile
 from datetime import datetime
+from pathlib import Path
 
-from fastapi import UploadFile
+from dotenv import load_dotenv
+from fastapi import HTTPException, UploadFile
 from sqlalchemy.orm import Session
 
 from app import models
-from app.core.exceptions import bad_request, forbidden, not_found
-from app.utils.activity_logger import log_task_action
+from app.core.exceptions import bad_request, forbidden, not_found, payload_too_large
+from app.models.enums import ChangeEntityType
+from app.schemas.event import ProjectEventType
+from app.services.unit_of_work import UnitOfWork
+from app.utils.blob_store import (
+    BLOB_GC_GRACE,
+    BLOB_TMP_DIR,
+    acquire_blob,
+    drop_released_blobs,
+    is_blob_path,
+    reconcile_blob_refs,
+    release_blobs,
+    sweep_blobs,
+    sweep_orphan_files,
+)
 
-# -------------------------------
-# 🧭 기본 저장 경로 설정
-# -------------------------------
-UPLOAD_DIR = os.path.join("uploads", "files")  # 루트 경로 기준
-os.makedirs(UPLOAD_DIR, exist_ok=True)
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# 첨부파일 최대 크기(바이트, 기본 50MiB) / 디스크 기록 단위(바이트, 기본 1MiB)
+ATTACHMENT_MAX_BYTES = int(os.getenv("ATTACHMENT_MAX_BYTES", str(50 * 1024 * 1024)))
+ATTACHMENT_CHUNK_SIZE = int(os.getenv("ATTACHMENT_CHUNK_SIZE", str(1024 * 1024)))
+# 업로드 요청 본문 한도 = 파일 한도 + multipart 경계·헤더 여유분(바이트, 기본 64KiB)
+ATTACHMENT_MULTIPART_OVERHEAD = int(os.getenv("ATTACHMENT_MULTIPART_OVERHEAD", str(64 * 1024)))
+# blob GC 주기 (초, 0이면 비활성화)
+BLOB_GC_INTERVAL = int(os.getenv("BLOB_GC_INTERVAL", "3600"))
+
+logger = logging.getLogger(__name__)
 
 
 # -------------------------------
@@ -31,6 +59,63 @@ def get_attachments_by_task(db: Session, task_id: int):
     return attachments
 
 
+# -------------------------------
+# ✅ 다운로드 대상 첨부파일 조회
+# -------------------------------
+def get_attachment_for_download(db: Session, project_id: int, task_id: int, attachment_id: int):
+    """경로의 프로젝트/태스크에 속한 첨부파일 + 실제 파일 존재 확인"""
+    attachment = db.get(models.Attachment, attachment_id)
+    if (
+        not attachment
+        or attachment.is_deleted
+        or attachment.task_id != task_id
+        or attachment.project_id != project_id
+    ):
+        not_found(f"첨부파일 ID {attachment_id}를 찾을 수 없습니다.")
+    if not attachment.file_path or not os.path.isfile(attachment.file_path):
+        not_found("첨부파일의 실제 파일을 찾을 수 없습니다.")
+    return attachment
+
+
+def attachment_etag(attachment) -> str | None:
+    """내용 해시 기반 강한 ETag (같은 내용이면 첨부파일이 달라도 동일)"""
+    if attachment.content_hash:
+        return f'"sha256-{attachment.content_hash}"'
+    return None
+
+
+# -------------------------------
+# 🧩 스트리밍 저장 (청크 단위 기록 + SHA-256/크기 계산)
+# -------------------------------
+def _stream_to_temp(src) -> tuple[str, int, str]:
+    """
+    업로드 스트림을 고정 크기 청크로 임시 파일에 기록하면서 해시·크기를 계산.
+    - 최대 크기를 넘는 순간 중단하고 임시 파일 삭제 (413)
+    - fsync까지 끝난 임시 파일은 acquire_blob이 원자적으로 이동 (또는 중복이면 삭제)
+    반환: (임시 파일 경로, 바이트 수, sha256 hex)
+    """
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=BLOB_TMP_DIR, prefix=".upload-")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := src.read(ATTACHMENT_CHUNK_SIZE):
+                size += len(chunk)
+                if size > ATTACHMENT_MAX_BYTES:
+                    payload_too_large(
+                        f"첨부파일 크기가 허용 한도({ATTACHMENT_MAX_BYTES:,} bytes)를 초과했습니다."
+                    )
+                digest.update(chunk)
+                out.write(chunk)
+            out.flush()
+            os.fsync(out.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path, size, digest.hexdigest()
+
+
 # -------------------------------
 # ✅ 첨부파일 업로드
 # -------------------------------
@@ -54,45 +139,66 @@ def upload_attachment(
         # ----------------------------
         # 1️⃣ 실제 파일 저장
         # ----------------------------
-        filename = file.filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
-        safe_name = f"{timestamp}_{filename}"
-        file_path = os.path.join(UPLOAD_DIR, safe_name)
+        filename = os.path.basename(file.filename or "") or "file"
 
-        # UploadFile은 async이므로 .file.read() 보다는 .read() 써도 되지만, 파일이 클 경우는 async context 필요
-        with open(file_path, "wb") as buffer:
-            buffer.write(file.file.read())
-
-        # ----------------------------
-        # 2️⃣ DB 기록
-        # ----------------------------
-        new_file = models.Attachment(
-            project_id=project_id,
-            task_id=task_id,
-            uploaded_by=current_user.emp_id,
-            file_name=filename,
-            file_path=file_path,
-            uploaded_at=datetime.utcnow(),
+        # 전체를 메모리에 읽지 않고 청크 단위로 기록 (스레드풀에서 실행되는 동기 라우트)
+        tmp_path, file_size, content_hash = _stream_to_temp(file.file)
+        file_type = (
+            file.content_type or mimetypes.guess_type(filename)[0] or "application/octet-stream"
         )
-        db.add(new_file)
-        db.commit()
-        db.refresh(new_file)
 
         # ----------------------------
-        # 3️⃣ 로그 기록
+        # 2️⃣ blob 참조 + DB 기록 + 로그 (단일 커밋)
         # ----------------------------
-        log_task_action(
-            db=db,
-            task_id=task_id,
-            emp_id=current_user.emp_id,
-            action="file_uploaded",
-            detail=f"{filename} 업로드됨",
-        )
+        try:
+            with UnitOfWork(db) as uow:
+                # 같은 내용이 이미 저장돼 있으면 참조 수만 증가 (파일 중복 저장 없음)
+                file_path = acquire_blob(db, content_hash, file_size, tmp_path)
+                new_file = uow.add(
+                    models.Attachment(
+                        project_id=project_id,
+                        task_id=task_id,
+                        uploaded_by=current_user.emp_id,
+                        file_name=filename,
+                        file_path=file_path,
+                        file_size=file_size,
+                        file_type=file_type,
+                        content_hash=content_hash,
+                        uploaded_at=datetime.utcnow(),
+                    )
+                )
+                uow.log(
+                    current_user.emp_id,
+                    project_id,
+                    task_id,
+                    "attachment_added",
+                    f"{filename} 업로드됨",
+                )
+                uow.change(
+                    project_id, ChangeEntityType.attachment, lambda: new_file.attachment_id
+                )
+                uow.event(
+                    project_id,
+                    ProjectEventType.attachment_added,
+                    lambda: {
+                        "attachment_id": new_file.attachment_id,
+                        "task_id": task_id,
+                        "file_name": new_file.file_name,
+                        "file_size": new_file.file_size,
+                        "uploaded_by": new_file.uploaded_by,
+                    },
+                    actor_emp_id=current_user.emp_id,
+                )
+        finally:
+            # 이동되지 않은 임시 파일 정리 (새로 배치된 blob이 롤백되면 GC가 정리)
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
         return new_file
 
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
         bad_request(f"파일 업로드 중 오류 발생: {str(e)}")
 
 
@@ -112,24 +218,75 @@ def delete_attachment(db: Session, attachment_id: int, current_user):
         forbidden("본인이 업로드한 파일만 삭제할 수 있습니다.")
 
     try:
-        # 실제 파일 삭제
-        if attachment.file_path and os.path.exists(attachment.file_path):
-            os.remove(attachment.file_path)
-
-        db.delete(attachment)
-        db.commit()
-
-        # 로그 기록
-        log_task_action(
-            db=db,
-            task_id=attachment.task_id,
-            emp_id=current_user.emp_id,
-            action="file_deleted",
-            detail=f"{attachment.file_name} 삭제됨",
-        )
+        file_name = attachment.file_name
+        file_path = attachment.file_path
+        content_hash = attachment.content_hash
+
+        with UnitOfWork(db) as uow:
+            released = release_blobs(db, [(content_hash, file_path)])
+            uow.log(
+                current_user.emp_id,
+                attachment.project_id,
+                attachment.task_id,
+                "attachment_removed",
+                f"{file_name} 삭제됨",
+            )
+            uow.change(
+                attachment.project_id, ChangeEntityType.attachment, attachment_id, deleted=True
+            )
+            uow.event(
+                attachment.project_id,
+                ProjectEventType.attachment_removed,
+                {"attachment_id": attachment_id, "task_id": attachment.task_id},
+                actor_emp_id=current_user.emp_id,
+            )
+            uow.delete(attachment)
 
-        return {"success": True, "message": f"{attachment.file_name} 삭제 완료"}
+        # 실제 파일 삭제 (DB 반영 이후): blob은 마지막 참조일 때만, 이전 방식 파일은 바로 삭제
+        if released:
+            drop_released_blobs(db, released)
+        elif file_path and not is_blob_path(content_hash, file_path) and os.path.exists(file_path):
+            os.remove(file_path)
+
+        return {"success": True, "message": f"{file_name} 삭제 완료"}
 
     except Exception as e:
-        db.rollback()
         bad_request(f"첨부파일 삭제 중 오류 발생: {str(e)}")
+
+
+# -------------------------------
+# 🧹 첨부파일 저장소 GC
+# -------------------------------
+def collect_blob_garbage(db: Session, grace: int = BLOB_GC_GRACE) -> dict:
+    """
+    1) attachment 기준 참조 수 보정 (CASCADE 삭제 등 참조 해제를 거치지 않은 변경)
+    2) 유예 시간이 지난 미참조 blob 삭제
+    3) 행이 없는 고아 파일 / 남은 임시 파일 삭제
+    """
+    return {
+        "reconciled": reconcile_blob_refs(db),
+        "blobs_removed": sweep_blobs(db, grace=grace),
+        "orphans_removed": sweep_orphan_files(db, grace=grace),
+    }
+
+
+async def run_blob_gc(session_factory, interval: int = BLOB_GC_INTERVAL):
+    """앱 수명주기 동안 주기적으로 GC 실행 (스레드에서 동기 세션 사용)"""
+
+    def collect_once():
+        db = session_factory()
+        try:
+            stats = collect_blob_garbage(db)
+            if any(stats.values()):
+                logger.info("🧹 첨부파일 저장소 정리: %s", stats)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            await asyncio.to_thread(collect_once)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("첨부파일 저장소 GC 실패")
+        await asyncio.sleep(interval)
@@ -0,0 +1,123 @@
+# app/services/change_service.py
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.models.enums import ChangeEntityType
+from app.services.comment_service import comment_select
+from app.services.task_service import task_summary_select
+
+# 한 번에 돌려줄 최대 변경 엔티티 수 (같은 버전은 나누지 않음)
+CHANGES_MAX_LIMIT = 1000
+
+
+# --------------------------------
+# 🔖 변경 버전 (조건부 GET용 지문 — PK 조회 한 번)
+# --------------------------------
+def _version_stmt(project_id: int):
+    return select(models.Project.change_version).where(models.Project.project_id == project_id)
+
+
+def get_change_version(db: Session, project_id: int) -> int | None:
+    """프로젝트의 현재 변경 버전 (프로젝트가 없으면 None)"""
+    return db.execute(_version_stmt(project_id)).scalar()
+
+
+async def get_change_version_async(db: AsyncSession, project_id: int) -> int | None:
+    result = await db.execute(_version_stmt(project_id))
+    return result.scalar()
+
+
+# --------------------------------
+# 🔄 증분 동기화
+# --------------------------------
+def _change_rows(db: Session, project_id: int, since: int, limit: int):
+    """
+    since 이후 변경 행 (버전 오름차순, (project_id, version) 인덱스 범위 스캔).
+    limit을 넘으면 마지막 버전을 잘라내 한 트랜잭션의 변경이 나뉘지 않게 함
+    → (행 목록, 더 있음 여부)
+    """
+    C = models.ProjectChange
+    columns = (C.entity_type, C.entity_id, C.version, C.deleted)
+    rows = db.execute(
+        select(*columns)
+        .where(C.project_id == project_id, C.version > since)
+        .order_by(C.version.asc())
+        .limit(limit + 1)
+    ).all()
+    if len(rows) <= limit:
+        return rows, False
+
+    cut = rows[limit].version
+    rows = [r for r in rows[:limit] if r.version < cut]
+    if not rows:
+        # 한 버전의 변경이 limit보다 많으면 그 버전 전체를 반환
+        rows = db.execute(
+            select(*columns).where(C.project_id == project_id, C.version == cut)
+        ).all()
+        more = db.execute(
+            select(C.version).where(C.project_id == project_id, C.version > cut).limit(1)
+        ).first()
+        return rows, more is not None
+    return rows, True
+
+
+def _load(db: Session, stmt) -> list[dict]:
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+def get_project_changes(db: Session, project_id: int, since: int, limit: int):
+    """
+    since 버전 이후 변경된 엔티티의 현재 상태 + 삭제 툼스톤.
+    엔티티 종류별로 IN 조회 한 번씩 (변경이 없으면 조회하지 않음). 프로젝트가 없으면 None
+    """
+    current = get_change_version(db, project_id)
+    if current is None:
+        return None
+    if since > current:
+        # 클라이언트가 서버보다 앞선 버전 (DB 복원 등) → 전체 재조회 필요
+        return {"since": since, "version": current, "reset": True}
+
+    rows, has_more = _change_rows(db, project_id, since, min(limit, CHANGES_MAX_LIMIT))
+    upserts: dict[ChangeEntityType, list[int]] = {t: [] for t in ChangeEntityType}
+    deleted = []
+    for row in rows:
+        if row.deleted:
+            deleted.append(
+                {"entity_type": row.entity_type, "entity_id": row.entity_id, "version": row.version}
+            )
+        else:
+            upserts[row.entity_type].append(row.entity_id)
+
+    result = {
+        "since": since,
+        "version": rows[-1].version if has_more else current,
+        "has_more": has_more,
+        "deleted": deleted,
+    }
+
+    Task, Milestone = models.Task, models.Milestone
+    Comment, Attachment = models.TaskComment, models.Attachment
+    if upserts[ChangeEntityType.task]:
+        result["tasks"] = _load(
+            db, task_summary_select().where(Task.task_id.in_(upserts[ChangeEntityType.task]))
+        )
+    if upserts[ChangeEntityType.milestone]:
+        result["milestones"] = (
+            db.query(Milestone)
+            .filter(Milestone.milestone_id.in_(upserts[ChangeEntityType.milestone]))
+            .all()
+        )
+    if upserts[ChangeEntityType.comment]:
+        result["comments"] = _load(
+            db,
+            comment_select().where(Comment.comment_id.in_(upserts[ChangeEntityType.comment])),
+        )
+    if upserts[ChangeEntityType.attachment]:
+        result["attachments"] = (
+            db.query(Attachment)
+            .filter(Attachment.attachment_id.in_(upserts[ChangeEntityType.attachment]))
+            .all()
+        )
+    return result
@@ -1,46 +1,130 @@
 from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
 from app import models
 from app.core.exceptions import bad_request, forbidden, not_found
-from app.utils.activity_logger import log_task_action
-from app.utils.mention import extract_mentions
-from app.utils.notifier import create_notifications
+from app.models.enums import ChangeEntityType
+from app.models.notification import NotificationType
+from app.schemas.event import ProjectEventType
+from app.services.unit_of_work import UnitOfWork
+from app.utils.mention import resolve_mentions
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 # --------------------------------
 # 🧱 댓글 목록 조회
 # --------------------------------
-def get_comments_by_task(db: Session, task_id: int):
-    """특정 태스크의 댓글 목록 조회"""
-    comments = (
-        db.query(models.TaskComment)
-        .options(joinedload(models.TaskComment.employee))
-        .filter(models.TaskComment.task_id == task_id)
-        .order_by(models.TaskComment.created_at.asc())
-        .all()
+def comment_select():
+    """댓글 + 작성자 이름 컬럼 (TaskComment 응답 형태, 조건 없음)"""
+    Comment = models.TaskComment
+    return select(
+        Comment.comment_id,
+        Comment.project_id,
+        Comment.task_id,
+        Comment.parent_comment_id,
+        Comment.emp_id,
+        models.Employee.name.label("author_name"),
+        Comment.content,
+        Comment.created_at,
+        Comment.updated_at,
+    ).outerjoin(models.Employee, models.Employee.emp_id == Comment.emp_id)
+
+
+def _comment_page_stmt(task_id: int, parent_comment_id: int | None, limit: int, cursor: str | None):
+    """
+    최상위 댓글(parent_comment_id=None) 또는 한 스레드의 답글 페이지 (동기/비동기 공용).
+    comment_id 오름차순(작성순) 키셋 → idx_task_comment_thread / idx_task_comment_parent 범위 스캔
+    """
+    Comment = models.TaskComment
+    stmt = comment_select().where(Comment.task_id == task_id)
+    if parent_comment_id is None:
+        stmt = stmt.where(Comment.parent_comment_id.is_(None))
+    else:
+        stmt = stmt.where(Comment.parent_comment_id == parent_comment_id)
+    if cursor:
+        (last_id,) = decode_cursor(cursor, 1)
+        if not isinstance(last_id, int):
+            bad_request("잘못된 커서 값입니다.")
+        stmt = stmt.where(Comment.comment_id > last_id)
+    return stmt.order_by(Comment.comment_id.asc()).limit(limit + 1)
+
+
+def _reply_count_stmt(comment_ids: list[int]):
+    """페이지 안 최상위 댓글들의 답글 수 (GROUP BY 한 번)"""
+    Comment = models.TaskComment
+    return (
+        select(Comment.parent_comment_id, func.count(Comment.comment_id))
+        .where(Comment.parent_comment_id.in_(comment_ids))
+        .group_by(Comment.parent_comment_id)
     )
 
-    return [
-        {
-            "comment_id": c.comment_id,
-            "project_id": c.project_id,
-            "task_id": c.task_id,
-            "emp_id": c.emp_id,
-            "author_name": c.employee.name if c.employee else None,
-            "content": c.content,
-            "created_at": c.created_at,
-            "updated_at": c.updated_at,
-        }
-        for c in comments
-    ]
+
+def _to_comment_page(rows, limit: int):
+    """limit+1 행 → (댓글 dict 리스트, 다음 페이지 커서 | None)"""
+    rows = [dict(row) for row in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["comment_id"])
+    return rows, next_cursor
+
+
+def _attach_reply_counts(rows: list[dict], counts):
+    counts = dict(counts)
+    for row in rows:
+        row["reply_count"] = counts.get(row["comment_id"], 0)
+    return rows
+
+
+def get_comments_by_task(db: Session, task_id: int, limit: int = 50, cursor: str | None = None):
+    """특정 태스크의 최상위 댓글 페이지 + 스레드별 답글 수 → (목록, 다음 커서)"""
+    rows, next_cursor = _to_comment_page(
+        db.execute(_comment_page_stmt(task_id, None, limit, cursor)).mappings(), limit
+    )
+    if rows:
+        ids = [row["comment_id"] for row in rows]
+        _attach_reply_counts(rows, db.execute(_reply_count_stmt(ids)).all())
+    return rows, next_cursor
+
+
+async def get_comments_by_task_async(
+    db: AsyncSession, task_id: int, limit: int = 50, cursor: str | None = None
+):
+    """get_comments_by_task 비동기 버전 (같은 SQL)"""
+    result = await db.execute(_comment_page_stmt(task_id, None, limit, cursor))
+    rows, next_cursor = _to_comment_page(result.mappings(), limit)
+    if rows:
+        ids = [row["comment_id"] for row in rows]
+        _attach_reply_counts(rows, (await db.execute(_reply_count_stmt(ids))).all())
+    return rows, next_cursor
+
+
+def get_comment_replies(
+    db: Session, task_id: int, comment_id: int, limit: int = 50, cursor: str | None = None
+):
+    """한 스레드의 답글 페이지 (작성순) → (목록, 다음 커서)"""
+    stmt = _comment_page_stmt(task_id, comment_id, limit, cursor)
+    return _to_comment_page(db.execute(stmt).mappings(), limit)
+
+
+async def get_comment_replies_async(
+    db: AsyncSession, task_id: int, comment_id: int, limit: int = 50, cursor: str | None = None
+):
+    """get_comment_replies 비동기 버전 (같은 SQL)"""
+    result = await db.execute(_comment_page_stmt(task_id, comment_id, limit, cursor))
+    return _to_comment_page(result.mappings(), limit)
 
 
 # --------------------------------
 # 📝 댓글 생성
 # --------------------------------
-def create_comment(db: Session, task_id: int, emp_id: int, content: str):
-    """댓글 작성 + 멘션 알림 + 액티비티 로그"""
+def create_comment(
+    db: Session, task_id: int, emp_id: int, content: str, parent_comment_id: int | None = None
+):
+    """댓글(또는 답글) 작성 + 멘션 알림 + 액티비티 로그 (단일 커밋)"""
     if not content.strip():
         bad_request("댓글 내용을 입력하세요.")
 
@@ -48,61 +132,74 @@ def create_comment(db: Session, task_id: int, emp_id: int, content: str):
     if not task:
         not_found("해당 태스크를 찾을 수 없습니다.")
 
-    new_comment = models.TaskComment(
-        project_id=task.project_id,
-        task_id=task_id,
-        emp_id=emp_id,
-        content=content.strip(),
-        created_at=datetime.utcnow(),
-    )
+    if parent_comment_id is not None:
+        parent = db.execute(
+            select(models.TaskComment.task_id, models.TaskComment.parent_comment_id).where(
+                models.TaskComment.comment_id == parent_comment_id
+            )
+        ).first()
+        if not parent or parent.task_id != task_id:
+            not_found("답글을 달 댓글을 찾을 수 없습니다.")
+        # 답글의 답글 → 같은 스레드(최상위 댓글)에 연결
+        parent_comment_id = parent.parent_comment_id or parent_comment_id
 
     try:
-        db.add(new_comment)
-        db.commit()
-        db.refresh(new_comment)
-
-        # ✅ 작성자 로드
-        author = db.query(models.Employee).filter(models.Employee.emp_id == emp_id).first()
-
-        # ✅ 응답 데이터 구성
-        response_data = {
-            "comment_id": new_comment.comment_id,
-            "project_id": new_comment.project_id,
-            "task_id": new_comment.task_id,
-            "emp_id": new_comment.emp_id,
-            "author_name": author.name if author else None,
-            "content": new_comment.content,
-            "created_at": new_comment.created_at,
-            "updated_at": new_comment.updated_at,
-        }
-
-        # 멘션 및 알림
-        mentioned_users = extract_mentions(content)
-        if mentioned_users:
-            create_notifications(
-                db=db,
-                recipients=mentioned_users,
-                actor_emp_id=emp_id,
-                project_id=task.project_id,
-                task_id=task_id,
-                notif_type="mention",
-                payload={"content": content},
+        with UnitOfWork(db) as uow:
+            new_comment = uow.add(
+                models.TaskComment(
+                    project_id=task.project_id,
+                    task_id=task_id,
+                    emp_id=emp_id,
+                    parent_comment_id=parent_comment_id,
+                    content=content.strip(),
+                    created_at=datetime.utcnow(),
+                )
             )
+            uow.flush()  # comment_id 확보
+
+            # ✅ 작성자 로드
+            author = db.query(models.Employee).filter(models.Employee.emp_id == emp_id).first()
+
+            # ✅ 응답 데이터 구성
+            response_data = {
+                "comment_id": new_comment.comment_id,
+                "project_id": new_comment.project_id,
+                "task_id": new_comment.task_id,
+                "parent_comment_id": new_comment.parent_comment_id,
+                "emp_id": new_comment.emp_id,
+                "author_name": author.name if author else None,
+                "content": new_comment.content,
+                "created_at": new_comment.created_at,
+                "updated_at": new_comment.updated_at,
+            }
+
+            # 멘션 및 알림 (@사번·이메일·이름 → emp_id, 인메모리 디렉터리)
+            # ORM 경로 유지 → 실시간 푸시에 notification_id 포함 (바로 읽음 처리 가능)
+            mentioned_ids = resolve_mentions(db, content)
+            if mentioned_ids:
+                uow.notify(
+                    recipients=mentioned_ids,
+                    actor_emp_id=emp_id,
+                    project_id=task.project_id,
+                    task_id=task_id,
+                    ntype=NotificationType.mention,
+                    payload={"comment_id": new_comment.comment_id, "content": content},
+                )
+
+            # 로그 기록
+            uow.log(emp_id, task.project_id, task_id, "commented", f"'{content[:30]}...'")
 
-        # 로그 기록
-        log_task_action(
-            db=db,
-            emp_id=emp_id,
-            project_id=task.project_id,
-            task_id=task_id,
-            action="commented",
-            detail=f"'{content[:30]}...'",
-        )
+            uow.change(task.project_id, ChangeEntityType.comment, new_comment.comment_id)
+            uow.event(
+                task.project_id,
+                ProjectEventType.comment_created,
+                response_data,
+                actor_emp_id=emp_id,
+            )
 
         return response_data
 
     except Exception as e:
-        db.rollback()
         bad_request(f"댓글 등록 중 오류 발생: {str(e)}")
 
 
@@ -110,7 +207,7 @@ def create_comment(db: Session, task_id: int, emp_id: int, content: str):
 # ✏️ 댓글 수정
 # --------------------------------
 def update_comment(db: Session, comment_id: int, emp_id: int, content: str):
-    """댓글 수정 + 로그 기록"""
+    """댓글 수정 + 로그 기록 (단일 커밋)"""
     comment = (
         db.query(models.TaskComment)
         .options(joinedload(models.TaskComment.employee))
@@ -122,36 +219,42 @@ def update_comment(db: Session, comment_id: int, emp_id: int, content: str):
     if comment.emp_id != emp_id:
         forbidden("본인이 작성한 댓글만 수정할 수 있습니다.")
 
-    comment.content = content.strip()
-    comment.updated_at = datetime.utcnow()
-
     try:
-        db.commit()
-        db.refresh(comment)
-
-        log_task_action(
-            db=db,
-            emp_id=emp_id,
-            project_id=comment.project_id,
-            task_id=comment.task_id,
-            action="comment_edited",
-            detail=f"댓글 {comment.comment_id} 수정됨",
-        )
-
-        # ✅ 명시적으로 직렬화 가능한 dict 리턴
-        return {
-            "comment_id": comment.comment_id,
-            "project_id": comment.project_id,
-            "task_id": comment.task_id,
-            "emp_id": comment.emp_id,
-            "author_name": comment.employee.name if comment.employee else None,
-            "content": comment.content,
-            "created_at": comment.created_at,
-            "updated_at": comment.updated_at,
-        }
+        with UnitOfWork(db) as uow:
+            comment.content = content.strip()
+            comment.updated_at = datetime.utcnow()
+
+            uow.log(
+                emp_id,
+                comment.project_id,
+                comment.task_id,
+                "comment_edited",
+                f"댓글 {comment.comment_id} 수정됨",
+            )
+
+            # ✅ 명시적으로 직렬화 가능한 dict 리턴
+            response_data = {
+                "comment_id": comment.comment_id,
+                "project_id": comment.project_id,
+                "task_id": comment.task_id,
+                "parent_comment_id": comment.parent_comment_id,
+                "emp_id": comment.emp_id,
+                "author_name": comment.employee.name if comment.employee else None,
+                "content": comment.content,
+                "created_at": comment.created_at,
+                "updated_at": comment.updated_at,
+            }
+            uow.change(comment.project_id, ChangeEntityType.comment, comment.comment_id)
+            uow.event(
+                comment.project_id,
+                ProjectEventType.comment_updated,
+                response_data,
+                actor_emp_id=emp_id,
+            )
+
+        return response_data
 
     except Exception as e:
-        db.rollback()
         bad_request(f"댓글 수정 중 오류 발생: {str(e)}")
 
 
@@ -159,28 +262,51 @@ def update_comment(db: Session, comment_id: int, emp_id: int, content: str):
 # 🗑️ 댓글 삭제
 # --------------------------------
 def delete_comment(db: Session, comment_id: int, emp_id: int):
-    """댓글 삭제 + 로그 기록"""
+    """댓글 삭제 + 로그 기록 (단일 커밋)"""
     comment = db.query(models.TaskComment).filter(models.TaskComment.comment_id == comment_id).first()
     if not comment:
         not_found("댓글을 찾을 수 없습니다.")
     if comment.emp_id != emp_id:
         forbidden("본인이 작성한 댓글만 삭제할 수 있습니다.")
 
+    Comment = models.TaskComment
     try:
-        db.delete(comment)
-        db.commit()
-
-        log_task_action(
-            db=db,
-            emp_id=emp_id,
-            project_id=comment.project_id,
-            task_id=comment.task_id,
-            action="comment_deleted",
-            detail=f"댓글 {comment.comment_id} 삭제됨",
-        )
+        with UnitOfWork(db) as uow:
+            uow.log(
+                emp_id,
+                comment.project_id,
+                comment.task_id,
+                "comment_deleted",
+                f"댓글 {comment_id} 삭제됨",
+            )
+            # 최상위 댓글이면 스레드 답글도 함께 삭제 (FK ON DELETE CASCADE와 같은 결과를 명시적으로)
+            reply_ids = db.execute(
+                select(Comment.comment_id).where(Comment.parent_comment_id == comment_id)
+            ).scalars().all()
+            if reply_ids:
+                db.query(Comment).filter(Comment.comment_id.in_(reply_ids)).delete(
+                    synchronize_session=False
+                )
+            uow.change(
+                comment.project_id,
+                ChangeEntityType.comment,
+                [comment_id, *reply_ids],
+                deleted=True,
+            )
+            uow.event(
+                comment.project_id,
+                ProjectEventType.comment_deleted,
+                {
+                    "comment_id": comment_id,
+                    "task_id": comment.task_id,
+                    "parent_comment_id": comment.parent_comment_id,
+                    "reply_ids": reply_ids,
+                },
+                actor_emp_id=emp_id,
+            )
+            uow.delete(comment)
 
-        return {"success": True, "message": f"댓글 {comment.comment_id} 삭제 완료"}
+        return {"success": True, "message": f"댓글 {comment_id} 삭제 완료"}
 
     except Exception as e:
-        db.rollback()
         bad_request(f"댓글 삭제 중 오류 발생: {str(e)}")
@@ -0,0 +1,339 @@
+# app/services/flow_service.py
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Iterable
+
+from sqlalchemy import Integer, and_, case, cast, func, select
+from sqlalchemy.orm import Session
+
+from app import models
+from app.models.enums import TaskStatus
+
+# 상태 → 누적 컬럼
+_STATUS_COLUMNS = {
+    TaskStatus.TODO: "todo_seconds",
+    TaskStatus.IN_PROGRESS: "in_progress_seconds",
+    TaskStatus.REVIEW: "review_seconds",
+    TaskStatus.DONE: "done_seconds",
+}
+# cycle time 분포 구간(일)
+CYCLE_BUCKET_DAYS = (1, 2, 3, 5, 8, 13, 21)
+PERCENTILES = (50, 75, 85, 95)
+# 백분위 계산에 읽는 최대 태스크 수 (최근 생성순, 나머지 지표는 전체 집계)
+FLOW_PERCENTILE_SAMPLE = int(os.getenv("FLOW_PERCENTILE_SAMPLE", "5000"))
+
+
+# =====================================================
+# 🧮 상태 변경 → 누적 갱신 (이력 기록과 같은 트랜잭션)
+# =====================================================
+def _db_now(db: Session) -> datetime:
+    """DB 서버 시각 — task.created_at(server_default=now())과 같은 시계로 구간 계산"""
+    return db.execute(select(func.now())).scalar()
+
+
+def _insert_missing_flows(db: Session, rows: list[dict]):
+    """누적 행이 없는 태스크만 생성 (이미 있으면 무시) — 동시에 첫 상태 변경이 와도 충돌 없음"""
+    dialect = db.get_bind().dialect.name
+    Flow = models.TaskFlow
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert
+
+        stmt = upsert(Flow).values(rows).on_duplicate_key_update(task_id=Flow.task_id)
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+
+        stmt = upsert(Flow).values(rows).on_conflict_do_nothing(index_elements=[Flow.task_id])
+    db.execute(stmt)
+
+
+def record_status_transitions(
+    db: Session,
+    transitions: Iterable[tuple[int, int, TaskStatus, TaskStatus]],
+):
+    """
+    (task_id, project_id, 이전 상태, 새 상태) 순서대로 누적 행 갱신.
+    - 행이 없는 태스크(첫 상태 변경)는 생성 시각부터 이전 상태였던 것으로 시작
+    - 대상 행은 FOR UPDATE로 잠근 뒤 읽고 수정 → 동시 상태 변경 간 누적 시간 유실 없음
+    - 시각은 DB 서버 기준 (task.created_at과 같은 시계)
+    """
+    transitions = [t for t in transitions if t[2] != t[3]]
+    if not transitions:
+        return
+    at = _db_now(db)
+    Flow = models.TaskFlow
+    ids = {task_id for task_id, *_ in transitions}
+    created = dict(
+        db.execute(
+            select(models.Task.task_id, models.Task.created_at).where(models.Task.task_id.in_(ids))
+        ).all()
+    )
+
+    initial = {}
+    for task_id, project_id, old_status, _ in transitions:
+        initial.setdefault(
+            task_id,
+            {
+                "task_id": task_id,
+                "project_id": project_id,
+                "status": TaskStatus(old_status),
+                "status_since": created.get(task_id) or at,
+                "transitions": 0,
+                **{column: 0 for column in _STATUS_COLUMNS.values()},
+            },
+        )
+    _insert_missing_flows(db, list(initial.values()))
+    flows = {
+        f.task_id: f
+        for f in db.query(Flow).filter(Flow.task_id.in_(ids)).with_for_update().populate_existing()
+    }
+
+    for task_id, _, _, new_status in transitions:
+        flow = flows[task_id]
+        column = _STATUS_COLUMNS[TaskStatus(flow.status)]
+        elapsed = max(int((at - flow.status_since).total_seconds()), 0)
+        setattr(flow, column, (getattr(flow, column) or 0) + elapsed)
+
+        new_status = TaskStatus(new_status)
+        if new_status != TaskStatus.TODO and flow.started_at is None:
+            flow.started_at = at
+        if new_status == TaskStatus.DONE:
+            created_at = created.get(task_id) or at
+            flow.done_at = at
+            flow.lead_seconds = max(int((at - created_at).total_seconds()), 0)
+            flow.cycle_seconds = max(int((at - (flow.started_at or at)).total_seconds()), 0)
+        elif flow.done_at is not None:  # 재오픈
+            flow.done_at = flow.lead_seconds = flow.cycle_seconds = None
+
+        flow.status = new_status
+        flow.status_since = at
+        flow.transitions = (flow.transitions or 0) + 1
+
+
+# =====================================================
+# 📊 흐름 지표 조회 (누적 행을 SQL로 집계)
+# =====================================================
+def _flow_stmt(project_id: int, task_id: int | None = None):
+    """태스크 + 누적 행 (상태를 한 번도 바꾸지 않은 태스크는 누적 행 없음 → LEFT JOIN)"""
+    Task, Flow = models.Task, models.TaskFlow
+    stmt = (
+        select(
+            Task.task_id,
+            Task.status,
+            Task.created_at,
+            Flow.status.label("flow_status"),
+            Flow.status_since,
+            Flow.started_at,
+            Flow.done_at,
+            Flow.lead_seconds,
+            Flow.cycle_seconds,
+            Flow.transitions,
+            *(getattr(Flow, column) for column in _STATUS_COLUMNS.values()),
+        )
+        .outerjoin(Flow, Flow.task_id == Task.task_id)
+        .where(Task.project_id == project_id)
+    )
+    if task_id is not None:
+        stmt = stmt.where(Task.task_id == task_id)
+    return stmt
+
+
+def _time_in_status(row, now: datetime) -> dict[TaskStatus, int]:
+    """상태별 체류 시간(초) — 현재 상태는 진행 중인 구간까지 포함"""
+    seconds = {status: int(row[column] or 0) for status, column in _STATUS_COLUMNS.items()}
+    current = TaskStatus(row["flow_status"] or row["status"] or TaskStatus.TODO)
+    since = row["status_since"] or row["created_at"]
+    if since is not None:
+        seconds[current] += max(int((now - since).total_seconds()), 0)
+    return seconds
+
+
+def _hours(seconds: float) -> float:
+    return round(seconds / 3600, 2)
+
+
+def _percentile(values: list[float], p: float) -> float:
+    """정렬된 값의 p 백분위 (선형 보간)"""
+    if len(values) == 1:
+        return values[0]
+    rank = (len(values) - 1) * p / 100
+    low = int(rank)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (rank - low)
+
+
+def _summary(count, total, maximum, sample: list) -> dict:
+    """
+    초 단위 집계 → 시간 단위 요약.
+    - 건수·평균·최대는 SQL 집계값 (전체), 백분위는 표본 값으로 계산
+    """
+    if not count:
+        return {"count": 0}
+    summary = {
+        "count": int(count),
+        "mean_hours": _hours(float(total) / int(count)),
+        "max_hours": _hours(float(maximum)),
+    }
+    values = sorted(sample)
+    if values:
+        for p in PERCENTILES:
+            summary[f"p{p}_hours"] = _hours(_percentile(values, p))
+    return summary
+
+
+def _epoch(db: Session, column):
+    """DATETIME → epoch 초 (방언별 함수)"""
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        return func.unix_timestamp(column)
+    if dialect == "postgresql":
+        return func.extract("epoch", column)
+    return cast(func.strftime("%s", column), Integer)
+
+
+def _flow_columns(db: Session, done_from: date | None, done_to: date | None) -> dict:
+    """
+    태스크 행 단위 지표식 (SQL) — 경과 시간은 DB 시계(now()) 기준
+    - done / wip: 완료(기간 내) · 진행 중 여부 조건
+    - lead / cycle / wip_age / 상태별 체류 시간(초): 해당하지 않으면 NULL
+    """
+    Task, Flow = models.Task, models.TaskFlow
+    now = _epoch(db, func.now())
+
+    def elapsed(since):
+        seconds = now - _epoch(db, since)
+        return case((seconds > 0, seconds), else_=0)
+
+    done = and_(Task.status == TaskStatus.DONE, Flow.lead_seconds.is_not(None))
+    if done_from:
+        done = and_(done, Flow.done_at >= datetime.combine(done_from, time.min))
+    if done_to:
+        done = and_(done, Flow.done_at < datetime.combine(done_to + timedelta(days=1), time.min))
+    wip = Task.status.in_([TaskStatus.IN_PROGRESS, TaskStatus.REVIEW])
+    started = func.coalesce(Flow.started_at, Flow.status_since, Task.created_at)
+    current = func.coalesce(Flow.status, Task.status, TaskStatus.TODO)
+    open_seconds = elapsed(func.coalesce(Flow.status_since, Task.created_at))
+
+    columns = {
+        "done": done,
+        "wip": wip,
+        "lead": case((done, Flow.lead_seconds)),
+        "cycle": case((done, Flow.cycle_seconds)),
+        "wip_age": case((and_(wip, started.is_not(None)), elapsed(started))),
+    }
+    for status, column in _STATUS_COLUMNS.items():
+        seconds = func.coalesce(getattr(Flow, column), 0) + case(
+            (current == status, open_seconds), else_=0
+        )
+        columns[status.value] = case((seconds > 0, seconds))
+    return columns
+
+
+def get_project_flow(
+    db: Session, project_id: int, done_from: date | None = None, done_to: date | None = None
+) -> dict:
+    """
+    프로젝트 흐름 지표
+    - lead / cycle time: 완료 태스크 (done_from ~ done_to 완료분만 선택 가능)
+    - 상태별 체류 시간: 전체 태스크 (진행 중 구간 포함)
+    - WIP: 진행/검토 중 태스크 수와 착수 후 경과 시간
+    - 건수·평균·최대·합계·분포는 SQL 집계 한 번 (행을 메모리로 읽지 않음)
+    - 백분위는 지표별 최근 FLOW_PERCENTILE_SAMPLE건 표본 기준 (그 이하면 전체와 동일)
+    """
+    Task, Flow = models.Task, models.TaskFlow
+    columns = _flow_columns(db, done_from, done_to)
+    statuses = tuple(status.value for status in _STATUS_COLUMNS)
+    metrics = ("lead", "cycle", "wip_age", *statuses)
+
+    aggregates = [
+        func.count().label("task_count"),
+        func.sum(case((columns["done"], 1), else_=0)).label("completed_count"),
+        func.sum(case((columns["wip"], 1), else_=0)).label("wip_count"),
+    ]
+    for name in metrics:
+        aggregates += [
+            func.count(columns[name]).label(f"{name}_count"),
+            func.sum(columns[name]).label(f"{name}_sum"),
+            func.max(columns[name]).label(f"{name}_max"),
+        ]
+    # cycle time 분포: 구간 상한 이하 누적 건수 → 아래에서 구간별 건수로 변환
+    for days in CYCLE_BUCKET_DAYS:
+        aggregates.append(
+            func.sum(case((columns["cycle"] <= days * 86400, 1), else_=0)).label(f"le_{days}")
+        )
+
+    def project_rows(stmt):
+        """태스크 + 누적 행 LEFT JOIN (상태를 바꾼 적 없는 태스크 포함)"""
+        return (
+            stmt.select_from(Task)
+            .outerjoin(Flow, Flow.task_id == Task.task_id)
+            .where(Task.project_id == project_id)
+        )
+
+    totals = db.execute(project_rows(select(*aggregates))).mappings().one()
+
+    # 백분위 표본: 지표별 대상 행만 최근순으로 최대 FLOW_PERCENTILE_SAMPLE개
+    sample_groups = (
+        (("lead", "cycle"), columns["done"], Flow.done_at.desc()),
+        (("wip_age",), columns["wip"], Task.task_id.desc()),
+        (statuses, None, Task.task_id.desc()),
+    )
+    samples = {name: [] for name in metrics}
+    for names, condition, order in sample_groups:
+        stmt = project_rows(select(*(columns[name].label(name) for name in names)))
+        if condition is not None:
+            stmt = stmt.where(condition)
+        for row in db.execute(stmt.order_by(order).limit(FLOW_PERCENTILE_SAMPLE)).mappings():
+            for name in names:
+                if row[name] is not None:
+                    samples[name].append(int(row[name]))
+
+    def summary(name):
+        return _summary(
+            totals[f"{name}_count"], totals[f"{name}_sum"], totals[f"{name}_max"], samples[name]
+        )
+
+    histogram, below = [], 0
+    for days in CYCLE_BUCKET_DAYS:
+        cumulative = int(totals[f"le_{days}"] or 0)
+        histogram.append({"le_days": days, "count": cumulative - below})
+        below = cumulative
+    histogram.append({"le_days": None, "count": int(totals["cycle_count"] or 0) - below})
+
+    return {
+        "project_id": project_id,
+        "task_count": totals["task_count"],
+        "completed_count": int(totals["completed_count"] or 0),
+        "wip_count": int(totals["wip_count"] or 0),
+        "lead_time": summary("lead"),
+        "cycle_time": summary("cycle"),
+        "cycle_time_histogram": histogram,
+        "wip_age": summary("wip_age"),
+        "time_in_status": {
+            status.value: {
+                **summary(status.value),
+                "total_hours": _hours(float(totals[f"{status.value}_sum"] or 0)),
+            }
+            for status in _STATUS_COLUMNS
+        },
+    }
+
+
+def get_task_flow(db: Session, project_id: int, task_id: int) -> dict | None:
+    """태스크 하나의 상태별 체류 시간 + lead / cycle time (태스크가 없으면 None)"""
+    row = db.execute(_flow_stmt(project_id, task_id)).mappings().first()
+    if row is None:
+        return None
+    seconds = _time_in_status(row, _db_now(db))
+    return {
+        "task_id": row["task_id"],
+        "status": row["status"],
+        "started_at": row["started_at"],
+        "done_at": row["done_at"],
+        "transitions": row["transitions"] or 0,
+        "lead_time_hours": None if row["lead_seconds"] is None else _hours(row["lead_seconds"]),
+        "cycle_time_hours": None if row["cycle_seconds"] is None else _hours(row["cycle_seconds"]),
+        "time_in_status_hours": {status.value: _hours(v) for status, v in seconds.items()},
+    }
@@ -1,55 +1,139 @@
 # app/services/history_service.py
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
 
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session
 
 from app import models
-from app.core.exceptions import not_found
+from app.core.exceptions import bad_request
 from app.models.project import TaskStatus
+from app.services.activity_logger import is_project_member as _is_member
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
+
+
+# -------------------------------
+# 🧾 필드 변경 내역 (JSON: {"필드": [이전 값, 새 값]})
+# -------------------------------
+def _json_value(value):
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def field_diff(before: dict, after: dict) -> dict:
+    """after에 있는 필드 중 실제로 값이 바뀐 것만 {필드: [이전, 새 값]} (JSON 직렬화 가능한 값)"""
+    diff = {}
+    for key, new in after.items():
+        old, new = _json_value(before.get(key)), _json_value(new)
+        if old != new:
+            diff[key] = [old, new]
+    return diff
 
 
 def create_task_history(
     db: Session,
     task_id: int,
-    old_status: TaskStatus,
-    new_status: TaskStatus,
+    project_id: int,
+    old_status: TaskStatus | None,
+    new_status: TaskStatus | None,
     changed_by: int,
+    changes: dict | None = None,
+    auto_commit: bool = True,
 ):
-    """태스크 상태 변경 시 자동 이력 기록"""
+    """태스크 변경 이력 기록 (auto_commit=False면 세션에만 적재)"""
     history = models.TaskHistory(
         task_id=task_id,
+        project_id=project_id,
         old_status=old_status,
         new_status=new_status,
+        changes=changes or None,
         changed_by=changed_by,
         changed_at=datetime.utcnow(),
     )
     db.add(history)
-    db.commit()
+    if auto_commit:
+        db.commit()
     return history
 
 
-def get_task_history(db: Session, task_id: int, limit: int = 50):
-    """태스크별 이력 조회"""
-    return (
-        db.query(models.TaskHistory)
-        .filter(models.TaskHistory.task_id == task_id)
-        .order_by(models.TaskHistory.changed_at.desc())
-        .limit(limit)
-        .all()
+# -------------------------------
+# 📜 이력 조회 (최신순 키셋 페이지)
+# -------------------------------
+def _history_page_stmt(filter_, limit: int, cursor: str | None):
+    """
+    (changed_at, history_id) 내림차순 키셋.
+    project_id / task_id 등호 + (…, changed_at, history_id) 인덱스 → 범위 스캔 한 번
+    """
+    H = models.TaskHistory
+    stmt = (
+        select(
+            H.history_id,
+            H.task_id,
+            H.project_id,
+            H.old_status,
+            H.new_status,
+            H.changes,
+            H.changed_by,
+            models.Employee.name.label("changed_by_name"),
+            H.changed_at,
+        )
+        .outerjoin(models.Employee, models.Employee.emp_id == H.changed_by)
+        .where(filter_)
     )
+    if cursor:
+        last_at, last_id = decode_cursor(cursor, 2)
+        last_at = decode_datetime(last_at)
+        if not isinstance(last_id, int):
+            bad_request("잘못된 커서 값입니다.")
+        stmt = stmt.where(
+            or_(
+                H.changed_at < last_at,
+                and_(H.changed_at == last_at, H.history_id < last_id),
+            )
+        )
+    return stmt.order_by(H.changed_at.desc(), H.history_id.desc()).limit(limit + 1)
 
 
-def get_project_history(db: Session, project_id: int, limit: int = 100):
-    """프로젝트 전체 이력 조회"""
-    task_ids = (
-        db.query(models.Task.task_id)
-        .filter(models.Task.project_id == project_id)
-        .subquery()
-    )
-    return (
-        db.query(models.TaskHistory)
-        .filter(models.TaskHistory.task_id.in_(task_ids))
-        .order_by(models.TaskHistory.changed_at.desc())
-        .limit(limit)
-        .all()
-    )
+def _to_history_page(rows, limit: int):
+    """limit+1 행 → (이력 dict 리스트, 다음 페이지 커서 | None)"""
+    rows = [dict(row) for row in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]["changed_at"], rows[-1]["history_id"])
+    return rows, next_cursor
+
+
+def get_task_history(db: Session, task_id: int, limit: int = 50, cursor: str | None = None):
+    """태스크별 이력 조회 → (목록, 다음 커서)"""
+    stmt = _history_page_stmt(models.TaskHistory.task_id == task_id, limit, cursor)
+    return _to_history_page(db.execute(stmt).mappings(), limit)
+
+
+def get_project_history(
+    db: Session, project_id: int, limit: int = 100, cursor: str | None = None
+):
+    """프로젝트 전체 이력 조회 (task_history.project_id 인덱스 범위 스캔) → (목록, 다음 커서)"""
+    stmt = _history_page_stmt(models.TaskHistory.project_id == project_id, limit, cursor)
+    return _to_history_page(db.execute(stmt).mappings(), limit)
+
+
+# -------------------------------
+# ✅ 권한 확인
+# -------------------------------
+def is_project_member(db: Session, task_id: int, emp_id: int) -> bool:
+    """태스크가 속한 프로젝트의 멤버인지"""
+    project_id = db.execute(
+        select(models.Task.project_id).where(models.Task.task_id == task_id)
+    ).scalar()
+    return project_id is not None and _is_member(db, project_id, emp_id)
+
+
+def is_project_member_by_project(db: Session, project_id: int, emp_id: int) -> bool:
+    return _is_member(db, project_id, emp_id)
@@ -1,11 +1,26 @@
 # app/services/milestone_service.py
 from datetime import date
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core.exceptions import conflict, forbidden, not_found
+from app.models.enums import ChangeEntityType
 from app.models.project import MilestoneStatus
+from app.schemas.event import ProjectEventType
+from app.utils.change_feed import stage_change
+from app.utils.event_bus import stage_project_event
+
+
+def _milestone_event_payload(milestone: models.Milestone) -> dict:
+    """실시간 이벤트용 마일스톤 요약"""
+    return {
+        "milestone_id": milestone.milestone_id,
+        "name": milestone.name,
+        "due_date": milestone.due_date,
+        "status": milestone.status,
+    }
 
 
 # -------------------------------
@@ -14,17 +29,28 @@ from app.models.project import MilestoneStatus
 def auto_update_missed_milestones(db: Session, project_id: int | None = None) -> int:
     """기한이 지난 마일스톤을 자동으로 MISSED로 변경."""
     today = date.today()
-    query = db.query(models.Milestone).filter(
+    filters = [
         models.Milestone.status == MilestoneStatus.PLANNED,
         models.Milestone.due_date < today,
-    )
-
+    ]
     if project_id:
-        query = query.filter(models.Milestone.project_id == project_id)
+        filters.append(models.Milestone.project_id == project_id)
+
+    # 변경 피드 기록용 대상 ID (프로젝트별)
+    targets = db.execute(
+        select(models.Milestone.project_id, models.Milestone.milestone_id).where(*filters)
+    ).all()
+    if not targets:
+        return 0
 
-    count = query.update({models.Milestone.status: MilestoneStatus.MISSED})
-    if count > 0:
-        db.commit()
+    count = (
+        db.query(models.Milestone)
+        .filter(models.Milestone.milestone_id.in_([mid for _, mid in targets]), *filters)
+        .update({models.Milestone.status: MilestoneStatus.MISSED}, synchronize_session=False)
+    )
+    for pid, mid in targets:
+        stage_change(db, pid, ChangeEntityType.milestone, mid)
+    db.commit()
     return count
 
 
@@ -78,6 +104,14 @@ def create_milestone(
         status=request.status,
     )
     db.add(milestone)
+    stage_change(db, project_id, ChangeEntityType.milestone, lambda: milestone.milestone_id)
+    stage_project_event(
+        db,
+        project_id,
+        ProjectEventType.milestone_created,
+        lambda: _milestone_event_payload(milestone),
+        actor_emp_id=current_user.emp_id,
+    )
     db.commit()
     db.refresh(milestone)
     return milestone
@@ -106,6 +140,13 @@ def update_milestone(
     for key, value in request.model_dump(exclude_unset=True).items():
         setattr(milestone, key, value)
 
+    stage_change(db, project_id, ChangeEntityType.milestone, milestone_id)
+    stage_project_event(
+        db,
+        project_id,
+        ProjectEventType.milestone_updated,
+        lambda: _milestone_event_payload(milestone),
+    )
     db.commit()
     db.refresh(milestone)
     return milestone
@@ -129,6 +170,13 @@ def change_status(
         not_found("마일스톤을 찾을 수 없습니다.")
 
     milestone.status = status
+    stage_change(db, project_id, ChangeEntityType.milestone, milestone_id)
+    stage_project_event(
+        db,
+        project_id,
+        ProjectEventType.milestone_updated,
+        lambda: _milestone_event_payload(milestone),
+    )
     db.commit()
     db.refresh(milestone)
     return milestone
@@ -149,5 +197,12 @@ def delete_milestone(db: Session, project_id: int, milestone_id: int):
     if not milestone:
         not_found("삭제할 마일스톤을 찾을 수 없습니다.")
 
+    stage_change(db, project_id, ChangeEntityType.milestone, milestone_id, deleted=True)
+    stage_project_event(
+        db,
+        project_id,
+        ProjectEventType.milestone_deleted,
+        {"milestone_id": milestone_id},
+    )
     db.delete(milestone)
     db.commit()
@@ -0,0 +1,238 @@
+# app/services/notification_service.py
+import asyncio
+import logging
+import os
+from datetime import datetime
+
+from sqlalchemy import case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.exceptions import not_found
+from app.schemas.event import NotificationEventType
+from app.utils.event_bus import stage_user_event
+from app.utils.notifier import apply_counter_deltas
+
+# 카운터 재계산 주기 (초, 0이면 비활성화)
+NOTIFICATION_RECONCILE_INTERVAL = int(os.getenv("NOTIFICATION_RECONCILE_INTERVAL", "600"))
+
+logger = logging.getLogger(__name__)
+
+
+def _recipient_filters(emp_id: int, is_read: bool | None = None, ntype: str | None = None):
+    Notification = models.Notification
+    filters = [Notification.recipient_emp_id == emp_id]
+    if is_read is not None:
+        filters.append(Notification.is_read == is_read)
+    if ntype:
+        filters.append(Notification.type == ntype)
+    return filters
+
+
+def _count_stmt(filters: list):
+    return select(func.count()).select_from(models.Notification).where(*filters)
+
+
+def _counter_values(counter) -> tuple[int, int]:
+    """(total, unread) — 카운터 행이 없으면 알림 없음"""
+    if counter is None:
+        return 0, 0
+    return max(counter.total_count, 0), max(counter.unread_count, 0)
+
+
+# -------------------------------
+# 📬 내 알림 목록 (비동기)
+# -------------------------------
+async def get_notifications_async(
+    db: AsyncSession,
+    emp_id: int,
+    is_read: bool | None = None,
+    ntype: str | None = None,
+    limit: int = 50,
+):
+    """
+    최신순 알림 목록 + 필터 기준 전체 개수 + 안 읽은 개수.
+    - 개수는 카운터 테이블 PK 조회로 계산 (유형 필터가 있을 때만 COUNT)
+    반환값: (알림 리스트, total, unread_count)
+    """
+    filters = _recipient_filters(emp_id, is_read, ntype)
+    items = (
+        (
+            await db.execute(
+                select(models.Notification)
+                .where(*filters)
+                .order_by(models.Notification.created_at.desc())
+                .limit(limit)
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+    total_all, unread_count = _counter_values(await db.get(models.NotificationCounter, emp_id))
+    if ntype:
+        total = (await db.execute(_count_stmt(filters))).scalar_one()
+    elif is_read is None:
+        total = total_all
+    elif is_read:
+        total = max(total_all - unread_count, 0)
+    else:
+        total = unread_count
+    return items, total, unread_count
+
+
+# -------------------------------
+# 🔢 안 읽은 알림 개수 (비동기, PK 단건 조회)
+# -------------------------------
+async def get_unread_count_async(db: AsyncSession, emp_id: int) -> int:
+    counter = await db.get(models.NotificationCounter, emp_id)
+    return _counter_values(counter)[1]
+
+
+# -------------------------------
+# ✅ 읽음 처리 / 삭제 (카운터 함께 갱신)
+# -------------------------------
+def _get_own_notification(db: Session, notification_id: int, emp_id: int, for_update: bool = False):
+    query = db.query(models.Notification).filter(
+        models.Notification.notification_id == notification_id,
+        models.Notification.recipient_emp_id == emp_id,
+    )
+    if for_update:
+        query = query.with_for_update()
+    return query.first()
+
+
+def mark_as_read(db: Session, notification_id: int, emp_id: int):
+    notif = _get_own_notification(db, notification_id, emp_id)
+    if not notif:
+        not_found(f"알림 ID {notification_id}를 찾을 수 없습니다.")
+
+    # 조건부 UPDATE → 동시에 읽음 처리해도 실제로 바꾼 요청만 카운터를 차감
+    changed = db.execute(
+        update(models.Notification)
+        .where(
+            models.Notification.notification_id == notification_id,
+            models.Notification.is_read.is_(False),
+        )
+        .values(is_read=True)
+    ).rowcount
+    if changed:
+        apply_counter_deltas(db, {emp_id: (0, -1)})
+        stage_user_event(
+            db,
+            emp_id,
+            NotificationEventType.read,
+            {"notification_id": notification_id},
+            unread_delta=-1,
+        )
+    db.commit()
+    return notif
+
+
+def mark_all_as_read(db: Session, emp_id: int) -> int:
+    updated_count = (
+        db.query(models.Notification)
+        .filter(
+            models.Notification.recipient_emp_id == emp_id,
+            models.Notification.is_read == False,
+        )
+        .update({"is_read": True}, synchronize_session=False)
+    )
+    # 모두 읽었으므로 unread는 차감이 아니라 0으로 맞춤 (드리프트도 함께 보정)
+    db.execute(
+        update(models.NotificationCounter)
+        .where(models.NotificationCounter.recipient_emp_id == emp_id)
+        .values(unread_count=0, updated_at=datetime.utcnow())
+    )
+    stage_user_event(
+        db,
+        emp_id,
+        NotificationEventType.read_all,
+        {"updated": updated_count},
+        unread_delta=-updated_count,
+        unread_count=0,
+    )
+    db.commit()
+    return updated_count
+
+
+def delete_notification(db: Session, notification_id: int, emp_id: int):
+    # 행 잠금 후 is_read 확인 → 동시 삭제·읽음 처리와 카운터를 이중 차감하지 않음
+    notif = _get_own_notification(db, notification_id, emp_id, for_update=True)
+    if not notif:
+        not_found("삭제할 알림을 찾을 수 없습니다.")
+
+    unread_delta = 0 if notif.is_read else -1
+    apply_counter_deltas(db, {emp_id: (-1, unread_delta)})
+    stage_user_event(
+        db,
+        emp_id,
+        NotificationEventType.deleted,
+        {"notification_id": notification_id},
+        unread_delta=unread_delta,
+    )
+    db.delete(notif)
+    db.commit()
+
+
+# -------------------------------
+# 🔧 카운터 재계산 (드리프트 보정)
+# -------------------------------
+def reconcile_notification_counters(db: Session) -> int:
+    """
+    notification 테이블 기준 GROUP BY 한 번으로 카운터 재계산.
+    (연쇄 삭제 등 카운터를 거치지 않은 변경 보정) 반환값: 수정된 수신자 수
+    """
+    Notification = models.Notification
+    Counter = models.NotificationCounter
+    actual = {
+        rid: (total, int(unread or 0))
+        for rid, total, unread in db.execute(
+            select(
+                Notification.recipient_emp_id,
+                func.count(Notification.notification_id),
+                func.sum(case((Notification.is_read.is_(True), 0), else_=1)),
+            ).group_by(Notification.recipient_emp_id)
+        )
+    }
+    stored = {
+        rid: (total, unread)
+        for rid, total, unread in db.execute(
+            select(Counter.recipient_emp_id, Counter.total_count, Counter.unread_count)
+        )
+    }
+
+    # 같은 트랜잭션 스냅샷 기준 차이만 증감 → 재계산 중 들어온 동시 변경을 덮어쓰지 않음
+    deltas = {}
+    for rid in actual.keys() | stored.keys():
+        want_total, want_unread = actual.get(rid, (0, 0))
+        have_total, have_unread = stored.get(rid, (0, 0))
+        if (want_total, want_unread) != (have_total, have_unread):
+            deltas[rid] = (want_total - have_total, want_unread - have_unread)
+
+    apply_counter_deltas(db, deltas)
+    db.commit()
+    return len(deltas)
+
+
+async def run_counter_reconciler(session_factory, interval: int = NOTIFICATION_RECONCILE_INTERVAL):
+    """앱 수명주기 동안 주기적으로 카운터 재계산 (스레드에서 동기 세션 사용)"""
+
+    def reconcile_once():
+        db = session_factory()
+        try:
+            fixed = reconcile_notification_counters(db)
+            if fixed:
+                logger.info("🔧 알림 카운터 보정: %d명", fixed)
+        finally:
+            db.close()
+
+    while True:
+        try:
+            await asyncio.to_thread(reconcile_once)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("알림 카운터 재계산 실패")
+        await asyncio.sleep(interval)
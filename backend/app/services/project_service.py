@@ -1,17 +1,125 @@
 # app/services/project_service.py
+from datetime import date
+
+from sqlalchemy import and_, case, exists, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core.exceptions import bad_request, conflict, forbidden, not_found
-from app.models.enums import MemberRole, ProjectStatus
+from app.models.enums import MemberRole, ProjectStatus, TaskStatus
+from app.services.unit_of_work import UnitOfWork
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
 
 
 # -------------------------------
-# ✅ 전체 프로젝트 조회
+# ✅ 프로젝트 요약 목록 (키셋 페이지 + 집계)
 # -------------------------------
-def get_all_projects(db: Session):
-    """모든 프로젝트 목록을 최신순으로 조회"""
-    return db.query(models.Project).order_by(models.Project.created_at.desc()).all()
+def _project_summary_stmt(
+    statuses: list[ProjectStatus] | None,
+    owner_emp_id: int | None,
+    member_emp_id: int | None,
+    limit: int,
+    cursor: str | None,
+):
+    """
+    최신순(created_at, project_id) 키셋 페이지 SQL.
+    목록에 필요한 컬럼 + 멤버 수만 조회 (tasks/comments 등 하위 객체 로딩 없음)
+    """
+    P = models.Project
+    PM = models.ProjectMember
+    member_count = (
+        select(func.count(PM.emp_id)).where(PM.project_id == P.project_id).scalar_subquery()
+    )
+    stmt = select(
+        P.project_id,
+        P.project_name,
+        P.description,
+        P.start_date,
+        P.end_date,
+        P.status,
+        P.owner_emp_id,
+        models.Employee.name.label("owner_name"),
+        P.created_at,
+        member_count.label("member_count"),
+    ).outerjoin(models.Employee, models.Employee.emp_id == P.owner_emp_id)
+
+    if statuses:
+        stmt = stmt.where(P.status.in_(statuses))
+    if owner_emp_id is not None:
+        stmt = stmt.where(P.owner_emp_id == owner_emp_id)
+    if member_emp_id is not None:
+        stmt = stmt.where(
+            exists().where(PM.project_id == P.project_id, PM.emp_id == member_emp_id)
+        )
+    if cursor:
+        created_at, project_id = decode_cursor(cursor, 2)
+        created_at = decode_datetime(created_at)
+        stmt = stmt.where(
+            or_(
+                P.created_at < created_at,
+                and_(P.created_at == created_at, P.project_id < project_id),
+            )
+        )
+    return stmt.order_by(P.created_at.desc(), P.project_id.desc()).limit(limit + 1)
+
+
+def _task_counts_stmt(project_ids: list[int]):
+    """페이지 내 프로젝트들의 상태별/지연 업무 수 (GROUP BY 한 번)"""
+    T = models.Task
+    status_counts = [
+        func.sum(case((T.status == s, 1), else_=0)).label(s.value) for s in TaskStatus
+    ]
+    overdue = func.sum(
+        case((and_(T.due_date < date.today(), T.status != TaskStatus.DONE), 1), else_=0)
+    )
+    return (
+        select(
+            T.project_id,
+            func.count(T.task_id).label("task_count"),
+            overdue.label("overdue_count"),
+            *status_counts,
+        )
+        .where(T.project_id.in_(project_ids))
+        .group_by(T.project_id)
+    )
+
+
+def _to_summary_page(project_rows, count_rows, limit: int):
+    """limit+1 행 + 집계 행 → (ProjectSummary dict 리스트, 다음 페이지 커서 | None)"""
+    counts = {row["project_id"]: row for row in count_rows}
+    items = []
+    for row in project_rows[:limit]:
+        agg = counts.get(row["project_id"], {})
+        items.append(
+            {
+                **row,
+                "task_count": agg.get("task_count", 0),
+                "overdue_count": int(agg.get("overdue_count") or 0),
+                "task_status_counts": {s.value: int(agg.get(s.value) or 0) for s in TaskStatus},
+            }
+        )
+    next_cursor = None
+    if len(project_rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last["created_at"], last["project_id"])
+    return items, next_cursor
+
+
+async def get_project_summaries_async(
+    db: AsyncSession,
+    statuses: list[ProjectStatus] | None = None,
+    owner_emp_id: int | None = None,
+    member_emp_id: int | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+):
+    """프로젝트 요약 목록 (최신순 키셋 페이지 + 태스크 집계) → (목록, 다음 커서)"""
+    stmt = _project_summary_stmt(statuses, owner_emp_id, member_emp_id, limit, cursor)
+    rows = [dict(r) for r in (await db.execute(stmt)).mappings()]
+    ids = [r["project_id"] for r in rows[:limit]]
+    counts = (await db.execute(_task_counts_stmt(ids))).mappings().all() if ids else []
+    return _to_summary_page(rows, counts, limit)
 
 
 # -------------------------------
@@ -30,33 +138,40 @@ def get_project_by_id(db: Session, project_id: int):
 def create_project(
     db: Session, request: schemas.project.ProjectCreate, owner_emp_id: int
 ):
-    """새 프로젝트 생성 (생성자 자동 OWNER 등록)"""
+    """새 프로젝트 생성 (생성자 자동 OWNER 등록, 단일 커밋)"""
     try:
-        new_project = models.Project(
-            project_name=request.project_name.strip(),
-            description=request.description,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            status=request.status or ProjectStatus.PLANNED,
-            owner_emp_id=owner_emp_id,
-        )
-        db.add(new_project)
-        db.commit()
-        db.refresh(new_project)
-
-        # OWNER 자동 등록
-        owner_member = models.ProjectMember(
-            project_id=new_project.project_id,
-            emp_id=owner_emp_id,
-            role=MemberRole.OWNER,
-        )
-        db.add(owner_member)
-        db.commit()
+        with UnitOfWork(db) as uow:
+            new_project = uow.add(
+                models.Project(
+                    project_name=request.project_name.strip(),
+                    description=request.description,
+                    start_date=request.start_date,
+                    end_date=request.end_date,
+                    status=request.status or ProjectStatus.PLANNED,
+                    owner_emp_id=owner_emp_id,
+                )
+            )
+            uow.flush()  # project_id 확보
+
+            # OWNER 자동 등록
+            uow.add(
+                models.ProjectMember(
+                    project_id=new_project.project_id,
+                    emp_id=owner_emp_id,
+                    role=MemberRole.OWNER,
+                )
+            )
+            uow.log(
+                owner_emp_id,
+                new_project.project_id,
+                None,
+                "project_created",
+                f"'{new_project.project_name}' 프로젝트 생성",
+            )
 
         return new_project
 
     except Exception as e:
-        db.rollback()
         bad_request(f"프로젝트 생성 중 오류: {str(e)}")
 
 
@@ -68,14 +183,12 @@ def update_project(
 ):
     """기존 프로젝트 수정"""
     try:
-        update_data = request.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(project, key, value)
-        db.commit()
-        db.refresh(project)
+        with UnitOfWork(db):
+            update_data = request.model_dump(exclude_unset=True)
+            for key, value in update_data.items():
+                setattr(project, key, value)
         return project
     except Exception as e:
-        db.rollback()
         bad_request(f"프로젝트 수정 중 오류: {str(e)}")
 
 
@@ -85,20 +198,19 @@ def update_project(
 def delete_project(db: Session, project: models.Project):
     """프로젝트 및 관련 데이터 삭제"""
     try:
-        # 명시적 삭제 (Cascade 설정 없는 경우 대비)
-        db.query(models.ProjectMember).filter(
-            models.ProjectMember.project_id == project.project_id
-        ).delete()
-        db.query(models.Task).filter(
-            models.Task.project_id == project.project_id
-        ).delete()
-
-        db.delete(project)
-        db.commit()
+        with UnitOfWork(db) as uow:
+            # 명시적 삭제 (Cascade 설정 없는 경우 대비)
+            db.query(models.ProjectMember).filter(
+                models.ProjectMember.project_id == project.project_id
+            ).delete()
+            db.query(models.Task).filter(
+                models.Task.project_id == project.project_id
+            ).delete()
+
+            uow.delete(project)
         return True
 
     except Exception as e:
-        db.rollback()
         bad_request(f"프로젝트 삭제 중 오류: {str(e)}")
 
 
@@ -119,18 +231,17 @@ def add_member(db: Session, project_id: int, member: schemas.project.ProjectMemb
         conflict("이미 프로젝트에 등록된 멤버입니다.")
 
     try:
-        new_member = models.ProjectMember(
-            project_id=project_id,
-            emp_id=member.emp_id,
-            role=member.role or MemberRole.MEMBER,
-        )
-        db.add(new_member)
-        db.commit()
-        db.refresh(new_member)
+        with UnitOfWork(db) as uow:
+            new_member = uow.add(
+                models.ProjectMember(
+                    project_id=project_id,
+                    emp_id=member.emp_id,
+                    role=member.role or MemberRole.MEMBER,
+                )
+            )
         return new_member
 
     except Exception as e:
-        db.rollback()
         bad_request(f"멤버 추가 중 오류: {str(e)}")
 
 
@@ -154,11 +265,10 @@ def remove_member(db: Session, project_id: int, emp_id: int):
         forbidden("프로젝트 소유자는 제거할 수 없습니다.")
 
     try:
-        db.delete(member)
-        db.commit()
+        with UnitOfWork(db) as uow:
+            uow.delete(member)
         return True
     except Exception as e:
-        db.rollback()
         bad_request(f"멤버 제거 중 오류: {str(e)}")
 
 
@@ -0,0 +1,184 @@
+# app/services/rollup_service.py
+from decimal import Decimal
+
+from sqlalchemy import bindparam, case, func, select, update
+from sqlalchemy.orm import Session
+
+from app import models
+from app.models.enums import TaskStatus
+
+# 예상 시간이 없는 업무의 가중치(시간)
+DEFAULT_WEIGHT = Decimal("1.00")
+ROLLUP_COLUMNS = (
+    "rollup_task_count",
+    "rollup_done_count",
+    "rollup_weight",
+    "rollup_weighted_progress",
+)
+EMPTY_ROLLUP = (0, 0, Decimal(0), Decimal(0))
+
+
+# =====================================================
+# 🧮 기여값 (개수, 완료 수, 가중치, 가중치 × 진행률)
+# =====================================================
+def own_contribution(status, progress, estimate_hours) -> tuple:
+    """업무 하나가 상위 업무 롤업에 더하는 값 (완료 업무는 진행률 100으로 계산)"""
+    weight = DEFAULT_WEIGHT
+    if estimate_hours and estimate_hours > 0:
+        weight = Decimal(str(estimate_hours)).quantize(Decimal("0.01"))
+    done = TaskStatus(status or TaskStatus.TODO) == TaskStatus.DONE
+    return (1, int(done), weight, weight * (100 if done else progress or 0))
+
+
+def task_contribution(task: models.Task) -> tuple:
+    return own_contribution(task.status, task.progress, task.estimate_hours)
+
+
+def subtree_contribution(task: models.Task) -> tuple:
+    """업무 + 모든 하위 업무 (삭제 / 이동 시 상위 경로에서 빼거나 더할 값)"""
+    own = task_contribution(task)
+    return tuple(a + (getattr(task, c) or 0) for a, c in zip(own, ROLLUP_COLUMNS))
+
+
+def diff(after: tuple, before: tuple) -> tuple:
+    return tuple(a - b for a, b in zip(after, before))
+
+
+def rollup_progress_column():
+    """조회용 롤업 진행률 (가중 평균 %, 하위 업무가 없으면 NULL) — 저장된 합계로 행 단위 계산"""
+    Task = models.Task
+    return case(
+        (
+            Task.rollup_weight > 0,
+            func.round(Task.rollup_weighted_progress / Task.rollup_weight, 1),
+        ),
+        else_=None,
+    ).label("rollup_progress")
+
+
+# =====================================================
+# ⬆️ 증분 반영 (변경된 업무의 상위 경로만)
+# =====================================================
+def _ancestor_ids(db: Session, task_id: int) -> list[int]:
+    """task_id 자신 + 루트까지의 상위 업무 (재귀 CTE 한 번)"""
+    Task = models.Task
+    path = (
+        select(Task.task_id, Task.parent_task_id)
+        .where(Task.task_id == task_id)
+        .cte("ancestors", recursive=True)
+    )
+    path = path.union_all(
+        select(Task.task_id, Task.parent_task_id).join(path, Task.task_id == path.c.parent_task_id)
+    )
+    return db.execute(select(path.c.task_id)).scalars().all()
+
+
+def propagate(db: Session, parent_task_id: int | None, delta: tuple) -> list[int]:
+    """
+    parent_task_id부터 루트까지 롤업 합계에 delta를 더함 (UPDATE 한 번).
+    반환값: 롤업이 바뀐 업무 ID 목록 (변경 피드 기록용)
+    """
+    if parent_task_id is None or not any(delta):
+        return []
+    Task = models.Task
+    ids = _ancestor_ids(db, parent_task_id)
+    db.execute(
+        update(Task)
+        .where(Task.task_id.in_(ids))
+        .values(
+            {
+                **{c: getattr(Task, c) + d for c, d in zip(ROLLUP_COLUMNS, delta)},
+                # 파생 값만 바뀐 것 → 상위 업무의 updated_at은 유지
+                "updated_at": Task.updated_at,
+            }
+        )
+        .execution_options(synchronize_session="fetch")
+    )
+    return ids
+
+
+def rollup_deltas(
+    before: dict[int, tuple[int | None, tuple]], after: dict[int, tuple[int | None, tuple]]
+) -> dict[int, tuple]:
+    """
+    같은 스냅샷으로 만든 변경 전/후 트리 → 업무별 롤업 증감 (0이 아닌 것만).
+    변경된 업무의 상위 경로에만 값이 생기며, 저장된 합계를 읽지 않으므로
+    동시에 커밋된 다른 증분 갱신을 덮어쓰지 않음
+    """
+    old, new = compute_rollups(before), compute_rollups(after)
+    deltas = {}
+    for task_id, values in new.items():
+        delta = diff(values, old.get(task_id, EMPTY_ROLLUP))
+        if any(delta):
+            deltas[task_id] = delta
+    return deltas
+
+
+def apply_rollup_deltas(db: Session, deltas: dict[int, tuple]):
+    """업무별 증감을 col = col + delta로 반영 (executemany UPDATE 한 번)"""
+    if not deltas:
+        return
+    # ORM bulk update는 PK 값 대입만 지원 → 증감식은 Core 테이블로 executemany
+    T = models.Task.__table__
+    db.execute(
+        update(T)
+        .where(T.c.task_id == bindparam("b_task_id"))
+        .values(
+            {
+                **{c: T.c[c] + bindparam(f"d_{c}") for c in ROLLUP_COLUMNS},
+                "updated_at": T.c.updated_at,
+            }
+        ),
+        [
+            {"b_task_id": task_id, **{f"d_{c}": d for c, d in zip(ROLLUP_COLUMNS, delta)}}
+            for task_id, delta in deltas.items()
+        ],
+    )
+
+
+# =====================================================
+# 🔁 메모리 합산 (일괄 작업 증감 / 기존 데이터 이관)
+# =====================================================
+def compute_rollups(nodes: dict[int, tuple[int | None, tuple]]) -> dict[int, tuple]:
+    """{task_id: (parent_task_id, 자기 기여값)} → {task_id: 롤업} (메모리, 각 업무를 상위 경로에 더함)"""
+    rollups = {task_id: EMPTY_ROLLUP for task_id in nodes}
+    for task_id, (parent_id, own) in nodes.items():
+        seen = {task_id}
+        while parent_id is not None and parent_id in nodes and parent_id not in seen:
+            seen.add(parent_id)
+            rollups[parent_id] = tuple(a + b for a, b in zip(rollups[parent_id], own))
+            parent_id = nodes[parent_id][0]
+    return rollups
+
+
+def changed_rollup_rows(rollups: dict[int, tuple], current: dict[int, tuple]) -> list[dict]:
+    """저장된 값과 다른 롤업만 bulk UPDATE 행으로"""
+    return [
+        {"task_id": task_id, **dict(zip(ROLLUP_COLUMNS, values))}
+        for task_id, values in rollups.items()
+        if diff(values, current.get(task_id, EMPTY_ROLLUP)) != (0, 0, 0, 0)
+    ]
+
+
+def rebuild_rollups(db: Session, project_id: int | None = None) -> int:
+    """프로젝트(생략 시 전체) 롤업 재계산 후 커밋 → 갱신된 업무 수"""
+    Task = models.Task
+    stmt = select(
+        Task.task_id,
+        Task.parent_task_id,
+        Task.status,
+        Task.progress,
+        Task.estimate_hours,
+        *(getattr(Task, c) for c in ROLLUP_COLUMNS),
+    )
+    if project_id is not None:
+        stmt = stmt.where(Task.project_id == project_id)
+    nodes, current = {}, {}
+    for row in db.execute(stmt).all():
+        nodes[row[0]] = (row[1], own_contribution(row[2], row[3], row[4]))
+        current[row[0]] = tuple(row[5:])
+    rows = changed_rollup_rows(compute_rollups(nodes), current)
+    if rows:
+        db.execute(update(Task), rows)
+    db.commit()
+    return len(rows)
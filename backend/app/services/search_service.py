@@ -0,0 +1,188 @@
+# app/services/search_service.py
+import re
+
+from sqlalchemy import Float, and_, case, literal, or_, select, type_coerce, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import models
+from app.core.exceptions import bad_request
+from app.models.enums import SearchTarget
+from app.utils.pagination import decode_cursor, encode_cursor
+
+# ngram_token_size (MySQL 기본 2) 보다 짧은 검색어는 인덱스에 없음
+MIN_TERM_LENGTH = 2
+MAX_TERMS = 8
+SNIPPET_WIDTH = 120
+
+# 불리언 모드 연산자 → 검색어에서 제거 (사용자 입력은 항상 구문 검색으로 감쌈)
+_OPERATORS = re.compile(r'[+\-<>()~*"@]')
+
+
+# --------------------------------
+# 🔤 검색어 처리
+# --------------------------------
+def _search_terms(q: str) -> list[str]:
+    """공백 기준 분리 + 연산자 제거 + 짧은 단어 제외 (중복 제거, 최대 MAX_TERMS개)"""
+    terms = []
+    for word in _OPERATORS.sub(" ", q).split():
+        if len(word) >= MIN_TERM_LENGTH and word not in terms:
+            terms.append(word)
+    if not terms:
+        bad_request(f"검색어는 {MIN_TERM_LENGTH}자 이상 입력하세요.")
+    return terms[:MAX_TERMS]
+
+
+def _snippet(text: str | None, terms: list[str]) -> str | None:
+    """첫 번째로 일치하는 검색어 주변 SNIPPET_WIDTH자 (없으면 앞부분)"""
+    if not text:
+        return None
+    lowered = text.lower()
+    hits = [i for i in (lowered.find(t.lower()) for t in terms) if i >= 0]
+    start = max(min(hits) - SNIPPET_WIDTH // 4, 0) if hits else 0
+    snippet = text[start : start + SNIPPET_WIDTH].strip()
+    if start > 0:
+        snippet = "…" + snippet
+    if start + SNIPPET_WIDTH < len(text):
+        snippet += "…"
+    return snippet
+
+
+# --------------------------------
+# 📊 일치 조건 + 점수 (MySQL: ngram FULLTEXT / 그 외: LIKE)
+# --------------------------------
+def _fulltext(dialect: str, terms: list[str], title, body=None):
+    """
+    (WHERE 조건, 점수 식)
+    - MySQL: MATCH ... AGAINST 불리언 모드, 모든 검색어를 구문(+"...")으로 필수 일치
+      → ngram 파서가 구문을 연속된 2-gram으로 나눠 한국어 부분 일치를 인덱스로 처리
+    - 그 외(개발용 SQLite 등): 검색어별 LIKE, 제목 일치 2점 / 본문 일치 1점
+    """
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import match
+
+        columns = [title] if body is None else [title, body]
+        against = " ".join(f'+"{t}"' for t in terms)
+        expr = match(*columns, against=against).in_boolean_mode()
+        return expr, type_coerce(expr, Float)
+
+    conditions, score = [], []
+    for t in terms:
+        if body is None:
+            conditions.append(title.contains(t, autoescape=True))
+            score.append(case((title.contains(t, autoescape=True), 1.0), else_=0.0))
+        else:
+            conditions.append(
+                or_(title.contains(t, autoescape=True), body.contains(t, autoescape=True))
+            )
+            score.append(
+                case((title.contains(t, autoescape=True), 2.0), else_=0.0)
+                + case((body.contains(t, autoescape=True), 1.0), else_=0.0)
+            )
+    return and_(*conditions), sum(score[1:], score[0])
+
+
+# --------------------------------
+# 🔍 검색 SQL (업무 + 댓글 UNION, 점수순 키셋 페이지)
+# --------------------------------
+def _search_stmt(
+    dialect: str,
+    emp_id: int,
+    terms: list[str],
+    targets: list[SearchTarget] | None = None,
+    project_id: int | None = None,
+    limit: int = 20,
+    cursor: str | None = None,
+):
+    """
+    호출자가 멤버인 프로젝트 안에서만 검색.
+    정렬: 점수 내림차순 → 종류 → ID 내림차순 (커서: 마지막 행의 세 값)
+    """
+    Task, Comment = models.Task, models.TaskComment
+    targets = set(targets or SearchTarget)
+    projects = select(models.ProjectMember.project_id).where(models.ProjectMember.emp_id == emp_id)
+    if project_id is not None:
+        projects = projects.where(models.ProjectMember.project_id == project_id)
+
+    parts = []
+    if SearchTarget.task in targets:
+        matched, score = _fulltext(dialect, terms, Task.title, Task.description)
+        parts.append(
+            select(
+                literal(SearchTarget.task.value).label("type"),
+                Task.task_id.label("entity_id"),
+                Task.project_id,
+                Task.task_id,
+                Task.title.label("task_title"),
+                Task.description.label("body"),
+                score.label("score"),
+                Task.updated_at,
+            ).where(matched, Task.project_id.in_(projects))
+        )
+    if SearchTarget.comment in targets:
+        matched, score = _fulltext(dialect, terms, Comment.content)
+        parts.append(
+            select(
+                literal(SearchTarget.comment.value).label("type"),
+                Comment.comment_id.label("entity_id"),
+                Comment.project_id,
+                Comment.task_id,
+                Task.title.label("task_title"),
+                Comment.content.label("body"),
+                score.label("score"),
+                Comment.updated_at,
+            )
+            .join(Task, Task.task_id == Comment.task_id)
+            .where(matched, Comment.project_id.in_(projects))
+        )
+
+    hits = (parts[0] if len(parts) == 1 else union_all(*parts)).subquery("hits")
+    stmt = select(hits)
+    if cursor:
+        last_score, last_type, last_id = decode_cursor(cursor, 3)
+        try:
+            last_score, last_id = float(last_score), int(last_id)
+        except (TypeError, ValueError):
+            bad_request("잘못된 커서 값입니다.")
+        stmt = stmt.where(
+            or_(
+                hits.c.score < last_score,
+                and_(hits.c.score == last_score, hits.c.type > last_type),
+                and_(
+                    hits.c.score == last_score,
+                    hits.c.type == last_type,
+                    hits.c.entity_id < last_id,
+                ),
+            )
+        )
+    return stmt.order_by(hits.c.score.desc(), hits.c.type, hits.c.entity_id.desc()).limit(limit + 1)
+
+
+def _to_search_page(rows, terms: list[str], limit: int):
+    """limit+1 행 → (SearchResult dict 리스트, 다음 페이지 커서 | None)"""
+    items = []
+    for row in rows:
+        item = dict(row)
+        item["score"] = float(item["score"] or 0)
+        item["snippet"] = _snippet(item.pop("body"), terms)
+        items.append(item)
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(last["score"], last["type"], last["entity_id"])
+    return items, next_cursor
+
+
+def search(db: Session, emp_id: int, q: str, limit: int = 20, **filters):
+    """업무 제목·설명 + 댓글 내용 검색 (필터: targets, project_id / 커서: cursor)"""
+    terms = _search_terms(q)
+    stmt = _search_stmt(db.get_bind().dialect.name, emp_id, terms, limit=limit, **filters)
+    return _to_search_page(db.execute(stmt).mappings(), terms, limit)
+
+
+async def search_async(db: AsyncSession, emp_id: int, q: str, limit: int = 20, **filters):
+    """search 비동기 버전 (같은 SQL)"""
+    terms = _search_terms(q)
+    stmt = _search_stmt(db.get_bind().dialect.name, emp_id, terms, limit=limit, **filters)
+    return _to_search_page((await db.execute(stmt)).mappings(), terms, limit)
@@ -1,29 +1,317 @@
 # app/services/task_service.py
+from collections import defaultdict
+from datetime import date, datetime
+
+from sqlalchemy import and_, delete, func, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import models, schemas
 from app.core.exceptions import bad_request, forbidden, not_found
-from app.models.enums import TaskStatus
+from app.models.enums import ActivityAction, ChangeEntityType, MemberRole, TaskStatus
 from app.models.notification import NotificationType
-from app.routers.ws_router import notify_project
-from app.services import history_service
-from app.utils.activity_logger import log_task_action
-from app.utils.notifier import create_notifications
+from app.schemas.event import ProjectEventType
+from app.services import rollup_service
+from app.services.flow_service import record_status_transitions
+from app.services.history_service import field_diff
+from app.services.unit_of_work import UnitOfWork
+from app.utils.blob_store import drop_released_blobs, release_blobs
+from app.utils.notifier import build_notification_rows, remove_task_notifications
+from app.utils.pagination import decode_cursor, decode_datetime, encode_cursor
+
+
+def _task_event_payload(task: models.Task) -> dict:
+    """실시간 이벤트용 태스크 요약"""
+    return {
+        "task_id": task.task_id,
+        "parent_task_id": task.parent_task_id,
+        "title": task.title,
+        "status": task.status,
+        "priority": task.priority,
+        "assignee_emp_id": task.assignee_emp_id,
+        "start_date": task.start_date,
+        "due_date": task.due_date,
+        "progress": task.progress,
+    }
+
+
+# =====================================================
+# ✅ 프로젝트별 태스크 조회 (필터 + 정렬 + 키셋 페이지)
+# =====================================================
+# 정렬 키 → (컬럼명, 커서 값 복원 함수). "-" 접두어는 내림차순
+TASK_SORT_KEYS = {
+    "due_date": ("due_date", date.fromisoformat),
+    "start_date": ("start_date", date.fromisoformat),
+    "created_at": ("created_at", decode_datetime),
+    "updated_at": ("updated_at", decode_datetime),
+    "task_id": ("task_id", int),
+}
+
+
+def _keyset_after(col, id_col, value, last_id: int, desc: bool):
+    """
+    (col, task_id) 정렬에서 커서 다음 행 조건.
+    MySQL/SQLite 기본 순서(NULL이 오름차순 맨 앞, 내림차순 맨 뒤)를 그대로 따라 인덱스 순서 유지
+    """
+    if desc:
+        if value is None:
+            return and_(col.is_(None), id_col < last_id)
+        return or_(col < value, col.is_(None), and_(col == value, id_col < last_id))
+    if value is None:
+        return or_(col.is_not(None), and_(col.is_(None), id_col > last_id))
+    return or_(col > value, and_(col == value, id_col > last_id))
+
+
+def task_summary_select():
+    """TaskSummary 컬럼 + 담당자 이름 (조건 없음, 목록·변경 피드 공용)"""
+    Task = models.Task
+    return select(
+        Task.task_id,
+        Task.project_id,
+        Task.parent_task_id,
+        Task.title,
+        Task.status,
+        Task.priority,
+        Task.assignee_emp_id,
+        models.Employee.name.label("assignee_name"),
+        Task.start_date,
+        Task.due_date,
+        Task.estimate_hours,
+        Task.progress,
+        Task.rollup_task_count,
+        Task.rollup_done_count,
+        rollup_service.rollup_progress_column(),
+        Task.created_at,
+        Task.updated_at,
+    ).outerjoin(models.Employee, models.Employee.emp_id == Task.assignee_emp_id)
+
+
+def _task_list_stmt(
+    project_id: int,
+    statuses=None,
+    priorities=None,
+    assignee_emp_id: int | None = None,
+    parent_task_id: int | None = None,
+    top_level: bool = False,
+    due_from: date | None = None,
+    due_to: date | None = None,
+    sort: str = "due_date",
+    limit: int = 200,
+    cursor: str | None = None,
+):
+    """TaskSummary 컬럼만 조회 (댓글 등 관계 로딩 없음), limit+1행으로 다음 페이지 여부 판단"""
+    Task = models.Task
+    desc = sort.startswith("-")
+    key = sort.lstrip("-")
+    if key not in TASK_SORT_KEYS:
+        bad_request(f"지원하지 않는 정렬 키입니다: {sort}")
+    column_name, parse = TASK_SORT_KEYS[key]
+    col = getattr(Task, column_name)
+
+    stmt = task_summary_select().where(Task.project_id == project_id)
+    if statuses:
+        stmt = stmt.where(Task.status.in_(statuses))
+    if priorities:
+        stmt = stmt.where(Task.priority.in_(priorities))
+    if assignee_emp_id is not None:
+        stmt = stmt.where(Task.assignee_emp_id == assignee_emp_id)
+    if parent_task_id is not None:
+        stmt = stmt.where(Task.parent_task_id == parent_task_id)
+    elif top_level:
+        stmt = stmt.where(Task.parent_task_id.is_(None))
+    if due_from is not None:
+        stmt = stmt.where(Task.due_date >= due_from)
+    if due_to is not None:
+        stmt = stmt.where(Task.due_date <= due_to)
+
+    if cursor:
+        value, last_id = decode_cursor(cursor, 2)
+        if value is not None:
+            try:
+                value = parse(value)
+            except (TypeError, ValueError):
+                bad_request("잘못된 커서 값입니다.")
+        stmt = stmt.where(_keyset_after(col, Task.task_id, value, last_id, desc))
+
+    if key == "task_id":
+        order = [Task.task_id.desc() if desc else Task.task_id.asc()]
+    elif desc:
+        order = [col.desc(), Task.task_id.desc()]
+    else:
+        order = [col.asc(), Task.task_id.asc()]
+    return stmt.order_by(*order).limit(limit + 1), column_name
+
+
+def _to_task_page(rows, limit: int, column_name: str):
+    """limit+1 행 → (TaskSummary dict 리스트, 다음 페이지 커서 | None)"""
+    rows = [dict(row) for row in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][column_name], rows[-1]["task_id"])
+    return rows, next_cursor
+
+
+def get_tasks_by_project(db: Session, project_id: int, limit: int = 200, **filters):
+    """특정 프로젝트의 태스크 요약 목록 (필터/정렬/커서는 _task_list_stmt 참고)"""
+    stmt, column_name = _task_list_stmt(project_id, limit=limit, **filters)
+    return _to_task_page(db.execute(stmt).mappings(), limit, column_name)
+
+
+async def get_tasks_by_project_async(
+    db: AsyncSession, project_id: int, limit: int = 200, **filters
+):
+    """get_tasks_by_project 비동기 버전 (같은 SQL)"""
+    stmt, column_name = _task_list_stmt(project_id, limit=limit, **filters)
+    return _to_task_page((await db.execute(stmt)).mappings(), limit, column_name)
 
 
 # =====================================================
-# ✅ 프로젝트별 태스크 조회
+# 🌳 트리형 태스크 조회
 # =====================================================
-def get_tasks_by_project(db: Session, project_id: int):
-    """특정 프로젝트의 모든 태스크 조회"""
+def _task_tree_stmt(project_id: int, root_task_id: int | None, max_depth: int | None):
+    """트리 노드 평면 조회 SQL (전체: 프로젝트 단위 / 하위 트리·깊이 제한: 재귀 CTE)"""
+    Task = models.Task
+    columns = (
+        Task.task_id,
+        Task.project_id,
+        Task.parent_task_id,
+        Task.title,
+        Task.description,
+        Task.status,
+        Task.priority,
+        Task.start_date,
+        Task.due_date,
+        Task.assignee_emp_id,
+        Task.progress,
+        Task.rollup_task_count,
+        Task.rollup_done_count,
+        rollup_service.rollup_progress_column(),
+        models.Employee.name.label("assignee_name"),
+    )
+    stmt = select(*columns).outerjoin(
+        models.Employee, models.Employee.emp_id == Task.assignee_emp_id
+    )
+
+    if root_task_id is None and max_depth is None:
+        # 전체 트리: 프로젝트 단위 평면 조회 한 번
+        stmt = stmt.where(Task.project_id == project_id)
+    else:
+        # 하위 트리 / 깊이 제한: 재귀 CTE로 필요한 노드만 조회
+        if root_task_id is not None:
+            anchor = Task.task_id == root_task_id
+        else:
+            anchor = Task.parent_task_id.is_(None)
+        tree = (
+            select(Task.task_id, literal(1).label("depth"))
+            .where(Task.project_id == project_id, anchor)
+            .cte("task_tree", recursive=True)
+        )
+        step = select(Task.task_id, (tree.c.depth + 1).label("depth")).join(
+            tree, Task.parent_task_id == tree.c.task_id
+        )
+        if max_depth is not None:
+            step = step.where(tree.c.depth < max_depth)
+        tree = tree.union_all(step)
+        stmt = stmt.where(Task.task_id.in_(select(tree.c.task_id)))
+
+    return stmt.order_by(Task.task_id.asc())
+
+
+def _build_task_tree(rows, root_task_id: int | None, max_depth: int | None):
+    """
+    평면 행 → 트리 구성 (메모리).
+    반환값: (루트 노드 리스트 | None, {깊이 제한으로 잘린 task_id: 노드})
+    """
+    # parent_task_id → 자식 목록 인덱스
+    nodes: dict[int, dict] = {}
+    children: dict[int | None, list[int]] = defaultdict(list)
+    for row in rows:
+        nodes[row["task_id"]] = dict(row)
+        children[row["parent_task_id"]].append(row["task_id"])
+
+    if root_task_id is not None:
+        if root_task_id not in nodes:
+            return None, {}
+        root_ids = [root_task_id]
+    else:
+        root_ids = children.get(None, [])
+    if not root_ids:
+        return None, {}
+
+    visited: set[int] = set()
+    leaves: dict[int, dict] = {}
+
+    def build(task_id: int, depth: int) -> dict:
+        visited.add(task_id)
+        node = nodes[task_id]
+        if max_depth is not None and depth >= max_depth:
+            node["subtasks"] = []
+            leaves[task_id] = node
+        else:
+            node["subtasks"] = [
+                build(cid, depth + 1)
+                for cid in children.get(task_id, [])
+                if cid not in visited
+            ]
+        node["subtask_count"] = len(node["subtasks"])
+        return node
+
+    return [build(tid, 1) for tid in root_ids], leaves
+
+
+def _subtask_count_stmt(parent_ids):
+    Task = models.Task
     return (
-        db.query(models.Task)
-        .filter(models.Task.project_id == project_id)
-        .order_by(models.Task.due_date.asc())
-        .all()
+        select(Task.parent_task_id, func.count(Task.task_id))
+        .where(Task.parent_task_id.in_(parent_ids))
+        .group_by(Task.parent_task_id)
     )
 
 
+def get_task_tree(
+    db: Session,
+    project_id: int,
+    root_task_id: int | None = None,
+    max_depth: int | None = None,
+):
+    """
+    프로젝트 태스크를 set 단위 쿼리(1~2회)로 가져와 메모리에서 트리 구성.
+    - root_task_id: 지정 시 재귀 CTE로 해당 하위 트리만 조회
+    - max_depth: 최대 깊이 (1 = 루트만), 잘린 노드는 subtask_count로 하위 존재 여부 표시
+    반환값: 루트 노드 dict 리스트 (루트가 없거나 root_task_id가 없으면 None)
+    """
+    rows = db.execute(_task_tree_stmt(project_id, root_task_id, max_depth)).mappings()
+    result, leaves = _build_task_tree(rows, root_task_id, max_depth)
+
+    # 깊이 제한으로 잘린 노드의 하위 업무 수는 GROUP BY 한 번으로 채움
+    if leaves:
+        for parent_id, count in db.execute(_subtask_count_stmt(list(leaves))).all():
+            leaves[parent_id]["subtask_count"] = count
+
+    return result
+
+
+async def get_task_tree_async(
+    db: AsyncSession,
+    project_id: int,
+    root_task_id: int | None = None,
+    max_depth: int | None = None,
+):
+    """get_task_tree 비동기 버전 (같은 SQL, 같은 트리 구성)"""
+    rows = (
+        await db.execute(_task_tree_stmt(project_id, root_task_id, max_depth))
+    ).mappings().all()
+    result, leaves = _build_task_tree(rows, root_task_id, max_depth)
+
+    if leaves:
+        counts = (await db.execute(_subtask_count_stmt(list(leaves)))).all()
+        for parent_id, count in counts:
+            leaves[parent_id]["subtask_count"] = count
+
+    return result
+
+
 # =====================================================
 # ✅ 단일 태스크 조회
 # =====================================================
@@ -32,6 +320,11 @@ def get_task_by_id(db: Session, task_id: int):
     return db.query(models.Task).filter(models.Task.task_id == task_id).first()
 
 
+async def get_task_by_id_async(db: AsyncSession, task_id: int):
+    """태스크 ID로 조회 (비동기)"""
+    return await db.get(models.Task, task_id)
+
+
 # =====================================================
 # ✅ 태스크 생성
 # =====================================================
@@ -41,52 +334,62 @@ def create_task(
     creator_emp_id: int,
     project_id: int,
 ):
-    """태스크 생성 + 로그 기록 + 담당자 알림"""
+    """태스크 생성 + 로그 기록 + 담당자 알림 (단일 커밋)"""
     try:
-        new_task = models.Task(
-            project_id=project_id,
-            title=request.title.strip(),
-            description=request.description,
-            assignee_emp_id=request.assignee_emp_id,
-            priority=request.priority,
-            status=request.status or TaskStatus.TODO,
-            parent_task_id=request.parent_task_id,
-            start_date=request.start_date,
-            due_date=request.due_date,
-            estimate_hours=request.estimate_hours,
-            progress=request.progress or 0,  # ✅ 진행률 반영
-        )
+        with UnitOfWork(db) as uow:
+            new_task = uow.add(
+                models.Task(
+                    project_id=project_id,
+                    title=request.title.strip(),
+                    description=request.description,
+                    assignee_emp_id=request.assignee_emp_id,
+                    priority=request.priority,
+                    status=request.status or TaskStatus.TODO,
+                    parent_task_id=request.parent_task_id,
+                    start_date=request.start_date,
+                    due_date=request.due_date,
+                    estimate_hours=request.estimate_hours,
+                    progress=request.progress or 0,  # ✅ 진행률 반영
+                )
+            )
+            uow.flush()  # task_id 확보
+            # 🌳 상위 업무 롤업 (상위 경로만)
+            ancestors = rollup_service.propagate(
+                db, new_task.parent_task_id, rollup_service.task_contribution(new_task)
+            )
 
-        db.add(new_task)
-        db.commit()
-        db.refresh(new_task)
-
-        # 🕓 활동 로그
-        log_task_action(
-            db=db,
-            emp_id=creator_emp_id,
-            project_id=project_id,
-            task_id=new_task.task_id,
-            action="task_created",
-            detail=f"'{new_task.title}' 태스크 생성",
-        )
+            # 🕓 활동 로그
+            uow.log(
+                creator_emp_id,
+                project_id,
+                new_task.task_id,
+                "task_created",
+                f"'{new_task.title}' 태스크 생성",
+            )
 
-        # 🔔 담당자 알림
-        if new_task.assignee_emp_id:
-            create_notifications(
-                db=db,
-                recipients=[new_task.assignee_emp_id],
+            # 🔔 담당자 알림
+            if new_task.assignee_emp_id:
+                uow.notify(
+                    recipients=[new_task.assignee_emp_id],
+                    actor_emp_id=creator_emp_id,
+                    project_id=project_id,
+                    task_id=new_task.task_id,
+                    ntype=NotificationType.assignment,
+                    payload={"title": new_task.title},
+                )
+
+            # 📡 실시간 이벤트 (커밋 이후 발행) + 🔄 변경 피드
+            uow.change(project_id, ChangeEntityType.task, [new_task.task_id, *ancestors])
+            uow.event(
+                project_id,
+                ProjectEventType.task_created,
+                lambda: _task_event_payload(new_task),
                 actor_emp_id=creator_emp_id,
-                project_id=project_id,
-                task_id=new_task.task_id,
-                ntype=NotificationType.assignment,
-                payload={"title": new_task.title},
             )
 
         return new_task
 
     except Exception as e:
-        db.rollback()
         bad_request(f"태스크 생성 중 오류 발생: {str(e)}")
 
 
@@ -99,58 +402,77 @@ def update_task(
     request: schemas.project.TaskUpdate,
     updater_emp_id: int,
 ):
-    """태스크 수정 + 로그 기록"""
+    """태스크 수정 + 로그 기록 (단일 커밋)"""
+    # 권한 확인
+    if updater_emp_id not in [task.assignee_emp_id, task.project.owner_emp_id]:
+        forbidden("태스크 담당자 또는 프로젝트 소유자만 수정할 수 있습니다.")
+
     try:
-        # 권한 확인
-        if updater_emp_id not in [task.assignee_emp_id, task.project.owner_emp_id]:
-            forbidden("태스크 담당자 또는 프로젝트 소유자만 수정할 수 있습니다.")
-
-        update_data = request.model_dump(exclude_unset=True)
-
-        # ✅ 변경 내역 추적용
-        before_progress = task.progress
-        before_status = task.status
-
-        for key, value in update_data.items():
-            setattr(task, key, value)
-
-        db.commit()
-        db.refresh(task)
-
-        # ✅ 로그 메시지
-        detail_msg = f"'{task.title}' 수정됨"
-        if "progress" in update_data:
-            detail_msg += f" (진행률: {update_data['progress']}%)"
-
-        log_task_action(
-            db=db,
-            emp_id=updater_emp_id,
-            project_id=task.project_id,
-            task_id=task.task_id,
-            action="task_updated",
-            detail=detail_msg,
-        )
+        with UnitOfWork(db) as uow:
+            update_data = request.model_dump(exclude_unset=True)
+            before = {key: getattr(task, key) for key in update_data}
+            contribution = rollup_service.task_contribution(task)
+
+            for key, value in update_data.items():
+                setattr(task, key, value)
+
+            ancestors = rollup_service.propagate(
+                db,
+                task.parent_task_id,
+                rollup_service.diff(rollup_service.task_contribution(task), contribution),
+            )
+
+            # 🧾 바뀐 필드만 이력에 기록
+            changes = field_diff(before, update_data)
+            if changes:
+                uow.history(
+                    task.task_id,
+                    task.project_id,
+                    before["status"] if "status" in changes else None,
+                    task.status if "status" in changes else None,
+                    updater_emp_id,
+                    changes,
+                )
+            if "status" in changes:
+                record_status_transitions(
+                    db, [(task.task_id, task.project_id, before["status"], task.status)]
+                )
+
+            # ✅ 로그 메시지
+            detail_msg = f"'{task.title}' 수정됨"
+            if "progress" in update_data:
+                detail_msg += f" (진행률: {update_data['progress']}%)"
+
+            uow.log(
+                updater_emp_id, task.project_id, task.task_id, "task_updated", detail_msg
+            )
 
-        # ✅ 진행률 변경 시 담당자에게 알림 (필요시 제거 가능)
-        if (
-            "progress" in update_data
-            and task.assignee_emp_id
-            and task.assignee_emp_id != updater_emp_id
-        ):
-            create_notifications(
-                db=db,
-                recipients=[task.assignee_emp_id],
+            # ✅ 진행률 변경 시 담당자에게 알림 (필요시 제거 가능)
+            if (
+                "progress" in update_data
+                and task.assignee_emp_id
+                and task.assignee_emp_id != updater_emp_id
+            ):
+                uow.notify(
+                    recipients=[task.assignee_emp_id],
+                    actor_emp_id=updater_emp_id,
+                    project_id=task.project_id,
+                    task_id=task.task_id,
+                    ntype=NotificationType.status_change,
+                    payload={"progress": update_data["progress"]},
+                )
+
+            uow.change(task.project_id, ChangeEntityType.task, [task.task_id, *ancestors])
+            uow.event(
+                task.project_id,
+                ProjectEventType.task_updated,
+                lambda: _task_event_payload(task),
                 actor_emp_id=updater_emp_id,
-                project_id=task.project_id,
-                task_id=task.task_id,
-                ntype=NotificationType.status_change,
-                payload={"progress": update_data["progress"]},
             )
 
         return task
 
     except Exception as e:
-        db.rollback()
         bad_request(f"태스크 수정 중 오류: {str(e)}")
 
 
@@ -160,49 +482,64 @@ def update_task(
 def change_task_status(
     db: Session, task: models.Task, new_status: TaskStatus, actor_emp_id: int
 ):
-    """상태 변경 + 로그 + 이력 + 알림"""
+    """상태 변경 + 이력 + 알림 + 로그를 한 트랜잭션으로 반영"""
     old_status = task.status
-    task.status = new_status
 
     try:
-        db.commit()
-        db.refresh(task)
-
-        # 🧾 상태 변경 이력 저장
-        history_service.create_task_history(
-            db=db,
-            task_id=task.task_id,
-            old_status=old_status,
-            new_status=new_status,
-            changed_by=actor_emp_id,
-        )
+        with UnitOfWork(db) as uow:
+            contribution = rollup_service.task_contribution(task)
+            task.status = new_status
+            ancestors = rollup_service.propagate(
+                db,
+                task.parent_task_id,
+                rollup_service.diff(rollup_service.task_contribution(task), contribution),
+            )
+
+            # 🧾 상태 변경 이력 저장
+            uow.history(
+                task.task_id,
+                task.project_id,
+                old_status,
+                new_status,
+                actor_emp_id,
+                field_diff({"status": old_status}, {"status": new_status}),
+            )
+            # ⏱️ 상태별 체류 시간 누적
+            record_status_transitions(
+                db, [(task.task_id, task.project_id, old_status, new_status)]
+            )
 
-        # 🔔 담당자에게 알림 (필요시 제거 가능)
-        if task.assignee_emp_id and task.assignee_emp_id != actor_emp_id:
-            create_notifications(
-                db=db,
-                recipients=[task.assignee_emp_id],
+            # 🔔 담당자에게 알림 (필요시 제거 가능)
+            if task.assignee_emp_id and task.assignee_emp_id != actor_emp_id:
+                uow.notify(
+                    recipients=[task.assignee_emp_id],
+                    actor_emp_id=actor_emp_id,
+                    project_id=task.project_id,
+                    task_id=task.task_id,
+                    ntype=NotificationType.status_change,
+                    payload={"old_status": old_status, "new_status": new_status},
+                )
+
+            # 🕓 로그 기록
+            uow.log(
+                actor_emp_id,
+                task.project_id,
+                task.task_id,
+                "status_changed",
+                f"{old_status} → {new_status}",
+            )
+
+            uow.change(task.project_id, ChangeEntityType.task, [task.task_id, *ancestors])
+            uow.event(
+                task.project_id,
+                ProjectEventType.task_status_changed,
+                lambda: {**_task_event_payload(task), "old_status": old_status},
                 actor_emp_id=actor_emp_id,
-                project_id=task.project_id,
-                task_id=task.task_id,
-                ntype=NotificationType.status_change,
-                payload={"old_status": old_status, "new_status": new_status},
-            )
-
-        # 🕓 로그 기록
-        log_task_action(
-            db=db,
-            emp_id=actor_emp_id,
-            project_id=task.project_id,
-            task_id=task.task_id,
-            action="status_changed",
-            detail=f"{old_status} → {new_status}",
-        )
+            )
 
         return task
 
     except Exception as e:
-        db.rollback()
         bad_request(f"태스크 상태 변경 중 오류: {str(e)}")
 
 
@@ -210,41 +547,463 @@ def change_task_status(
 # ✅ 태스크 삭제
 # =====================================================
 def delete_task(db: Session, task: models.Task, actor_emp_id: int):
-    """태스크 삭제 + 로그 기록"""
+    """태스크 삭제 + 로그 기록 (단일 커밋)"""
+    # 권한 확인
+    if actor_emp_id not in [task.assignee_emp_id, task.project.owner_emp_id]:
+        forbidden("태스크 담당자 또는 프로젝트 소유자만 삭제할 수 있습니다.")
+
     try:
-        title = task.title
-
-        # 권한 확인
-        if actor_emp_id not in [task.assignee_emp_id, task.project.owner_emp_id]:
-            forbidden("태스크 담당자 또는 프로젝트 소유자만 삭제할 수 있습니다.")
-
-        # 🕓 삭제 로그 (삭제 전에 기록)
-        log_task_action(
-            db=db,
-            emp_id=actor_emp_id,
-            project_id=task.project_id,
-            task_id=task.task_id,
-            action="task_deleted",
-            detail=f"'{title}' 삭제됨",
-        )
+        with UnitOfWork(db) as uow:
+            # 🕓 삭제 로그 (task_id는 FK ON DELETE SET NULL로 정리됨)
+            uow.log(
+                actor_emp_id,
+                task.project_id,
+                task.task_id,
+                "task_deleted",
+                f"'{task.title}' 삭제됨",
+            )
+            uow.event(
+                task.project_id,
+                ProjectEventType.task_deleted,
+                {"task_id": task.task_id, "parent_task_id": task.parent_task_id},
+                actor_emp_id=actor_emp_id,
+            )
 
-        # 실제 삭제
-        db.delete(task)
-        db.commit()
+            # 🔔 하위 업무 포함 연결 알림 정리 (수신자별 카운터 차감)
+            subtree_ids = (
+                db.execute(_task_tree_stmt(task.project_id, task.task_id, None)).scalars().all()
+            )
+            remove_task_notifications(db, subtree_ids)
+            # 📎 하위 업무 포함 첨부파일 blob 참조 해제
+            attachments = _attachment_refs(db, subtree_ids)
+            released = release_blobs(db, [(h, path) for _, h, path in attachments])
+            # 🔄 변경 피드: 하위 업무·댓글·첨부 툼스톤
+            _stage_task_tombstones(db, uow, task.project_id, subtree_ids, attachments)
+            db.execute(delete(models.TaskFlow).where(models.TaskFlow.task_id.in_(subtree_ids)))
+            # 🌳 상위 업무 롤업에서 하위 트리 전체 제외
+            ancestors = rollup_service.propagate(
+                db,
+                task.parent_task_id,
+                rollup_service.diff(
+                    rollup_service.EMPTY_ROLLUP, rollup_service.subtree_contribution(task)
+                ),
+            )
+            uow.change(task.project_id, ChangeEntityType.task, ancestors)
+
+            # 실제 삭제
+            uow.delete(task)
 
+        # 마지막 참조였던 blob 정리 (DB 반영 이후)
+        drop_released_blobs(db, released)
         return True
 
     except Exception as e:
-        db.rollback()
         bad_request(f"태스크 삭제 중 오류: {str(e)}")
 
 
-async def update_task_status(project_id: int, task_id: int, new_status: str):
-    # DB 업데이트 후
-    await notify_project(
-        project_id,
-        {
-            "event": "task_updated",
-            "payload": {"task_id": task_id, "status": new_status},
-        },
+def _attachment_refs(db: Session, task_ids) -> list[tuple[int, str | None, str]]:
+    """태스크들의 첨부파일 (attachment_id, content_hash, file_path) — blob 참조 해제용"""
+    if not task_ids:
+        return []
+    A = models.Attachment
+    return db.execute(
+        select(A.attachment_id, A.content_hash, A.file_path).where(A.task_id.in_(task_ids))
+    ).all()
+
+
+def _stage_task_tombstones(db: Session, uow: UnitOfWork, project_id: int, task_ids, attachments):
+    """삭제되는 태스크와 딸린 댓글·첨부파일을 변경 피드에 삭제로 기록"""
+    C = models.TaskComment
+    comment_ids = db.execute(select(C.comment_id).where(C.task_id.in_(task_ids))).scalars().all()
+    uow.change(project_id, ChangeEntityType.task, task_ids, deleted=True)
+    uow.change(project_id, ChangeEntityType.comment, comment_ids, deleted=True)
+    uow.change(
+        project_id, ChangeEntityType.attachment, [a[0] for a in attachments], deleted=True
     )
+
+
+# =====================================================
+# 📦 태스크 일괄 작업 (create / update / status / delete)
+# =====================================================
+_BATCH_TASK_COLUMNS = (
+    "task_id",
+    "project_id",
+    "parent_task_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "assignee_emp_id",
+    "start_date",
+    "due_date",
+    "estimate_hours",
+    "progress",
+)
+
+
+class _BatchItemError(Exception):
+    """일괄 작업 항목 하나의 실패 (나머지 항목은 계속 처리)"""
+
+
+def apply_task_batch(
+    db: Session,
+    project_id: int,
+    operations: list[schemas.project.TaskBatchOperation],
+    actor_emp_id: int,
+) -> dict:
+    """
+    여러 태스크 작업을 한 트랜잭션으로 처리하고 항목별 결과 반환.
+    - 프로젝트/멤버 권한은 요청당 한 번만 확인
+    - 대상 태스크는 한 번의 IN 조회로 적재, 같은 태스크에 대한 연속 작업은 메모리에서 병합
+    - UPDATE / 이력 / 활동 로그 / 알림은 executemany 일괄 문장으로 기록
+    - 유효하지 않은 항목은 success=False로 표시하고 나머지만 반영 (DB 오류 시 전체 롤백)
+    """
+    Task = models.Task
+
+    # 🔐 프로젝트 / 멤버 권한 (요청당 1회)
+    project = db.get(models.Project, project_id)
+    if not project:
+        not_found("프로젝트를 찾을 수 없습니다.")
+    role = db.execute(
+        select(models.ProjectMember.role).where(
+            models.ProjectMember.project_id == project_id,
+            models.ProjectMember.emp_id == actor_emp_id,
+        )
+    ).scalar_one_or_none()
+    is_owner = project.owner_emp_id == actor_emp_id or role == MemberRole.OWNER
+    if role is None and not is_owner:
+        forbidden("프로젝트 멤버만 태스크를 일괄 처리할 수 있습니다.")
+
+    # 📥 프로젝트 트리 구조(task_id → parent, 롤업 입력값) + 대상 태스크 상세를 각각 한 번에 조회
+    tree_rows = db.execute(
+        select(
+            Task.task_id,
+            Task.parent_task_id,
+            Task.status,
+            Task.progress,
+            Task.estimate_hours,
+        ).where(Task.project_id == project_id)
+    ).all()
+    parent_of: dict[int, int | None] = {row[0]: row[1] for row in tree_rows}
+    ref_ids = {op.task_id for op in operations if op.task_id is not None}
+    ref_ids &= parent_of.keys()
+    tasks: dict[int, dict] = {}
+    if ref_ids:
+        rows = db.execute(
+            select(*(getattr(Task, c) for c in _BATCH_TASK_COLUMNS)).where(
+                Task.task_id.in_(ref_ids)
+            )
+        ).mappings()
+        tasks = {row["task_id"]: dict(row) for row in rows}
+
+    children: dict[int | None, set[int]] = defaultdict(set)
+    for tid, pid in parent_of.items():
+        children[pid].add(tid)
+    deleted: set[int] = set()
+    created_under: set[int] = set()  # 이번 요청에서 생성한 업무의 상위 업무
+
+    def target(op) -> dict:
+        if op.task_id is None:
+            raise _BatchItemError("task_id가 필요합니다.")
+        if op.task_id not in tasks or op.task_id in deleted:
+            raise _BatchItemError("해당 프로젝트 내에서 태스크를 찾을 수 없습니다.")
+        return tasks[op.task_id]
+
+    def check_parent(task_id: int | None, parent_id: int | None):
+        if parent_id is None:
+            return
+        if parent_id not in parent_of or parent_id in deleted:
+            raise _BatchItemError("상위 업무를 찾을 수 없습니다.")
+        node = parent_id
+        while node is not None:  # 자기 자신/하위 업무 밑으로 이동 방지
+            if node == task_id:
+                raise _BatchItemError("하위 업무를 상위 업무로 지정할 수 없습니다.")
+            node = parent_of.get(node)
+
+    results: list[dict] = []
+    new_tasks: list[tuple[int, models.Task]] = []
+    changes: dict[int, dict] = {}  # task_id → 병합된 UPDATE 값
+    history_rows: list[dict] = []
+    logs: list[tuple] = []  # (task_id | Task, action, detail)
+    notices: list[tuple] = []  # (recipient, task_id | Task, ntype, payload)
+    events: list[tuple] = []  # (event_type, task_id | Task, extra)
+    delete_roots: list[int] = []
+
+    for index, op in enumerate(operations):
+        result = {"index": index, "op": op.op, "success": True, "task_id": op.task_id}
+        try:
+            if op.op == "create":
+                fields = op.fields.model_dump(exclude_unset=True) if op.fields else {}
+                title = (fields.get("title") or "").strip()
+                if not title:
+                    raise _BatchItemError("title이 필요합니다.")
+                check_parent(None, fields.get("parent_task_id"))
+                # 지정하지 않은 값은 모델 기본값(priority=MEDIUM 등) 사용
+                values = {k: v for k, v in fields.items() if v is not None}
+                values.update(title=title, status=values.get("status") or TaskStatus.TODO)
+                task = Task(project_id=project_id, **values)
+                new_tasks.append((index, task))
+                if task.parent_task_id is not None:
+                    created_under.add(task.parent_task_id)
+                logs.append((task, ActivityAction.task_created, f"'{title}' 태스크 생성"))
+                if task.assignee_emp_id:
+                    notices.append(
+                        (task.assignee_emp_id, task, NotificationType.assignment, {"title": title})
+                    )
+                events.append((ProjectEventType.task_created, task, None))
+
+            elif op.op == "update":
+                task = target(op)
+                if not is_owner and actor_emp_id != task["assignee_emp_id"]:
+                    raise _BatchItemError("태스크 담당자 또는 프로젝트 소유자만 수정할 수 있습니다.")
+                fields = op.fields.model_dump(exclude_unset=True) if op.fields else {}
+                if not fields:
+                    raise _BatchItemError("수정할 값이 없습니다.")
+                if "parent_task_id" in fields:
+                    check_parent(task["task_id"], fields["parent_task_id"])
+                    children[parent_of[task["task_id"]]].discard(task["task_id"])
+                    children[fields["parent_task_id"]].add(task["task_id"])
+                    parent_of[task["task_id"]] = fields["parent_task_id"]
+                diff = field_diff(task, fields)
+                old_status = task["status"]
+                task.update({k: v for k, v in fields.items() if k in task})
+                changes.setdefault(task["task_id"], {}).update(fields)
+                if diff:
+                    history_rows.append(
+                        {
+                            "task_id": task["task_id"],
+                            "project_id": project_id,
+                            "old_status": old_status if "status" in diff else None,
+                            "new_status": task["status"] if "status" in diff else None,
+                            "changes": diff,
+                            "changed_by": actor_emp_id,
+                        }
+                    )
+
+                detail_msg = f"'{task['title']}' 수정됨"
+                if "progress" in fields:
+                    detail_msg += f" (진행률: {fields['progress']}%)"
+                    if task["assignee_emp_id"]:
+                        notices.append(
+                            (
+                                task["assignee_emp_id"],
+                                task["task_id"],
+                                NotificationType.status_change,
+                                {"progress": fields["progress"]},
+                            )
+                        )
+                logs.append((task["task_id"], ActivityAction.task_updated, detail_msg))
+                events.append((ProjectEventType.task_updated, dict(task), None))
+
+            elif op.op == "status":
+                task = target(op)
+                if not is_owner and actor_emp_id != task["assignee_emp_id"]:
+                    raise _BatchItemError(
+                        "태스크 담당자 또는 프로젝트 소유자만 상태를 변경할 수 있습니다."
+                    )
+                if op.status is None:
+                    raise _BatchItemError("status가 필요합니다.")
+                old_status = task["status"]
+                task["status"] = op.status
+                changes.setdefault(task["task_id"], {})["status"] = op.status
+                history_rows.append(
+                    {
+                        "task_id": task["task_id"],
+                        "project_id": project_id,
+                        "old_status": old_status,
+                        "new_status": op.status,
+                        "changes": field_diff({"status": old_status}, {"status": op.status}),
+                        "changed_by": actor_emp_id,
+                    }
+                )
+                if task["assignee_emp_id"]:
+                    notices.append(
+                        (
+                            task["assignee_emp_id"],
+                            task["task_id"],
+                            NotificationType.status_change,
+                            {"old_status": old_status, "new_status": op.status},
+                        )
+                    )
+                logs.append(
+                    (task["task_id"], ActivityAction.status_changed, f"{old_status} → {op.status}")
+                )
+                events.append(
+                    (ProjectEventType.task_status_changed, dict(task), {"old_status": old_status})
+                )
+
+            elif op.op == "delete":
+                task = target(op)
+                if not is_owner and actor_emp_id != task["assignee_emp_id"]:
+                    raise _BatchItemError("태스크 담당자 또는 프로젝트 소유자만 삭제할 수 있습니다.")
+                # 하위 업무까지 함께 삭제 (트리 구조는 이미 메모리에 있음)
+                subtree, stack = set(), [task["task_id"]]
+                while stack:
+                    tid = stack.pop()
+                    if tid in deleted or tid in subtree:
+                        continue
+                    subtree.add(tid)
+                    stack.extend(children.get(tid, ()))
+                # 같은 요청에서 만든 하위 업무가 있으면 생성 결과를 지키고 삭제 항목만 실패
+                if subtree & created_under:
+                    raise _BatchItemError(
+                        "이번 요청에서 생성한 하위 업무가 있어 삭제할 수 없습니다. 별도 요청으로 삭제하세요."
+                    )
+                deleted |= subtree
+                for tid in subtree:
+                    changes.pop(tid, None)
+                delete_roots.append(task["task_id"])
+                logs.append((task["task_id"], ActivityAction.task_deleted, f"'{task['title']}' 삭제됨"))
+                events.append(
+                    (
+                        ProjectEventType.task_deleted,
+                        {"task_id": task["task_id"], "parent_task_id": task["parent_task_id"]},
+                        None,
+                    )
+                )
+
+        except _BatchItemError as e:
+            result.update(success=False, detail=str(e))
+        results.append(result)
+
+    try:
+        with UnitOfWork(db) as uow:
+            # ➕ 생성: PK가 필요하므로 ORM add_all + flush
+            if new_tasks:
+                db.add_all([task for _, task in new_tasks])
+                uow.flush()
+                for index, task in new_tasks:
+                    results[index]["task_id"] = task.task_id
+
+            # ✏️ 수정 / 상태 변경: 태스크당 한 행으로 병합된 executemany UPDATE
+            uow.bulk_update(
+                Task, [{"task_id": tid, **values} for tid, values in changes.items()]
+            )
+
+            # 🔄 변경 피드 (생성 + 수정/상태 변경, 삭제는 아래에서 툼스톤)
+            uow.change(
+                project_id,
+                ChangeEntityType.task,
+                [task.task_id for _, task in new_tasks] + list(changes),
+            )
+
+            # 🗑️ 삭제: 의존 행 → 부모 참조 해제 → 태스크 순으로 일괄 삭제
+            released = []
+            if deleted:
+                ids = list(deleted)
+                attachments = _attachment_refs(db, ids)
+                released = release_blobs(db, [(h, path) for _, h, path in attachments])
+                _stage_task_tombstones(db, uow, project_id, ids, attachments)
+                for model in (
+                    models.TaskHistory,
+                    models.TaskFlow,
+                    models.TaskComment,
+                    models.Attachment,
+                ):
+                    db.execute(delete(model).where(model.task_id.in_(ids)))
+                remove_task_notifications(db, ids)
+                db.execute(update(Task).where(Task.task_id.in_(ids)).values(parent_task_id=None))
+                db.execute(delete(Task).where(Task.task_id.in_(ids)))
+
+            # 🌳 상위 업무 롤업: 같은 스냅샷의 변경 전/후 트리 차이만 col + delta로 반영
+            # (저장된 합계를 덮어쓰지 않으므로 동시에 커밋된 단건 갱신과 충돌 없음)
+            before, after = {}, {}
+            for task_id, parent_id, status, progress, estimate in tree_rows:
+                before[task_id] = (
+                    parent_id,
+                    rollup_service.own_contribution(status, progress, estimate),
+                )
+                if task_id in deleted:
+                    continue
+                task = tasks.get(task_id)  # 이번 요청에서 수정된 값 우선
+                if task:
+                    status, progress, estimate = (
+                        task["status"],
+                        task["progress"],
+                        task["estimate_hours"],
+                    )
+                after[task_id] = (
+                    parent_of[task_id],
+                    rollup_service.own_contribution(status, progress, estimate),
+                )
+            for _, task in new_tasks:
+                after[task.task_id] = (
+                    task.parent_task_id,
+                    rollup_service.task_contribution(task),
+                )
+            deltas = {
+                task_id: delta
+                for task_id, delta in rollup_service.rollup_deltas(before, after).items()
+                if task_id not in deleted
+            }
+            rollup_service.apply_rollup_deltas(db, deltas)
+            uow.change(project_id, ChangeEntityType.task, list(deltas))
+
+            # 🧾 이력 / 🕓 활동 로그 / 🔔 알림: 각각 INSERT 한 번
+            now = datetime.utcnow()
+
+            def task_id_of(ref) -> int:
+                return ref.task_id if isinstance(ref, models.Task) else ref
+
+            uow.bulk_insert(
+                models.TaskHistory,
+                [
+                    {**row, "changed_at": now}
+                    for row in history_rows
+                    if row["task_id"] not in deleted
+                ],
+            )
+            # ⏱️ 상태별 체류 시간 누적 (op 순서대로, 삭제된 태스크 제외)
+            record_status_transitions(
+                db,
+                [
+                    (row["task_id"], project_id, row["old_status"], row["new_status"])
+                    for row in history_rows
+                    if row["new_status"] is not None and row["task_id"] not in deleted
+                ],
+            )
+            uow.bulk_insert(
+                models.ActivityLog,
+                [
+                    {
+                        "emp_id": actor_emp_id,
+                        "project_id": project_id,
+                        # 삭제된 태스크는 FK ON DELETE SET NULL과 동일하게 NULL
+                        "task_id": None if task_id_of(ref) in deleted else task_id_of(ref),
+                        "action": action,
+                        "detail": detail,
+                        "created_at": now,
+                    }
+                    for ref, action, detail in logs
+                ],
+            )
+            notification_rows = []
+            for recipient, ref, ntype, payload in notices:
+                if task_id_of(ref) in deleted:
+                    continue
+                notification_rows += build_notification_rows(
+                    recipients=[recipient],
+                    actor_emp_id=actor_emp_id,
+                    project_id=project_id,
+                    task_id=task_id_of(ref),
+                    ntype=ntype,
+                    payload=payload,
+                )
+            uow.bulk_notify(notification_rows)
+
+            # 📡 실시간 이벤트 (항목별, 커밋 이후 발행)
+            for event_type, ref, extra in events:
+                if event_type is ProjectEventType.task_deleted:
+                    payload = ref
+                elif isinstance(ref, models.Task):
+                    payload = _task_event_payload(ref)
+                else:
+                    payload = {k: ref[k] for k in _BATCH_TASK_COLUMNS if k != "project_id"}
+                uow.event(project_id, event_type, {**payload, **(extra or {})}, actor_emp_id)
+
+    except Exception as e:
+        bad_request(f"태스크 일괄 처리 중 오류: {str(e)}")
+
+    drop_released_blobs(db, released)
+    succeeded = sum(1 for r in results if r["success"])
+    return {"succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
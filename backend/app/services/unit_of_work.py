@@ -0,0 +1,151 @@
+# app/services/unit_of_work.py
+from typing import Any, Callable, Iterable, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session
+
+from app.models.enums import ChangeEntityType, TaskStatus
+from app.models.notification import NotificationType
+from app.schemas.event import ProjectEventType
+from app.services import history_service
+from app.utils.activity_logger import log_task_action
+from app.utils.change_feed import EntityRef, stage_change
+from app.utils.event_bus import stage_project_event
+from app.utils.notifier import create_notifications, insert_notification_rows
+
+
+class UnitOfWork:
+    """
+    요청 하나의 변경 사항(엔티티 + 이력 + 활동 로그 + 알림 + 실시간 이벤트)을
+    세션에 적재한 뒤 한 트랜잭션, 한 번의 커밋으로 반영.
+
+        with UnitOfWork(db) as uow:
+            task.status = new_status
+            uow.history(task.task_id, task.project_id, old_status, new_status, actor_emp_id)
+            uow.log(actor_emp_id, task.project_id, task.task_id, "status_changed")
+
+    - with 블록이 정상 종료되면 commit, 예외가 발생하면 rollback 후 예외 전파
+    - 중간 단계에서 PK가 필요하면 uow.flush() (커밋 아님)
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.db.rollback()
+            return False
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return False
+
+    # ---------- 엔티티 ----------
+    def add(self, entity):
+        self.db.add(entity)
+        return entity
+
+    def delete(self, entity):
+        self.db.delete(entity)
+
+    def flush(self):
+        self.db.flush()
+
+    # ---------- 일괄 처리 (executemany) ----------
+    def bulk_insert(self, model, rows: list[dict]):
+        """dict 행 목록을 INSERT 한 번(executemany)으로 적재"""
+        if rows:
+            self.db.execute(insert(model), rows)
+
+    def bulk_notify(self, rows: list[dict]):
+        """build_notification_rows 결과 일괄 INSERT + 수신자별 카운터 반영"""
+        insert_notification_rows(self.db, rows)
+
+    def bulk_update(self, model, rows: list[dict]):
+        """PK가 포함된 dict 행 목록으로 UPDATE (ORM bulk update by primary key)"""
+        if rows:
+            self.db.execute(update(model), rows)
+
+    # ---------- 부가 기록 ----------
+    def history(
+        self,
+        task_id: int,
+        project_id: int,
+        old_status: Optional[TaskStatus],
+        new_status: Optional[TaskStatus],
+        changed_by: int,
+        changes: Optional[dict] = None,
+    ):
+        """태스크 변경 이력 (changes: history_service.field_diff 결과)"""
+        return history_service.create_task_history(
+            self.db,
+            task_id=task_id,
+            project_id=project_id,
+            old_status=old_status,
+            new_status=new_status,
+            changed_by=changed_by,
+            changes=changes,
+            auto_commit=False,
+        )
+
+    def log(
+        self,
+        emp_id: int,
+        project_id: int | None,
+        task_id: int | None,
+        action: str,
+        detail: str | None = None,
+    ):
+        log_task_action(
+            db=self.db,
+            emp_id=emp_id,
+            project_id=project_id,
+            task_id=task_id,
+            action=action,
+            detail=detail,
+            auto_commit=False,
+        )
+
+    def notify(
+        self,
+        recipients: Iterable[int],
+        actor_emp_id: int,
+        project_id: Optional[int] = None,
+        task_id: Optional[int] = None,
+        ntype: NotificationType = NotificationType.comment,
+        payload: Optional[dict] = None,
+    ):
+        return create_notifications(
+            db=self.db,
+            recipients=recipients,
+            actor_emp_id=actor_emp_id,
+            project_id=project_id,
+            task_id=task_id,
+            ntype=ntype,
+            payload=payload,
+            auto_commit=False,
+        )
+
+    def change(
+        self,
+        project_id: int,
+        entity_type: ChangeEntityType,
+        entity_ids: EntityRef | Iterable[EntityRef],
+        deleted: bool = False,
+    ):
+        """변경 피드 기록 (커밋 시 프로젝트 버전 +1, GET /projects/{id}/changes 로 조회)"""
+        stage_change(self.db, project_id, entity_type, entity_ids, deleted)
+
+    def event(
+        self,
+        project_id: int,
+        event_type: ProjectEventType,
+        payload: dict[str, Any] | Callable[[], dict[str, Any]] | None = None,
+        actor_emp_id: int | None = None,
+    ):
+        stage_project_event(self.db, project_id, event_type, payload, actor_emp_id)
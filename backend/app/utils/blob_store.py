@@ -0,0 +1,236 @@
+# app/utils/blob_store.py
+import logging
+import os
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Iterable
+
+from dotenv import load_dotenv
+from sqlalchemy import bindparam, delete, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.attachment import Attachment, AttachmentBlob
+
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# -------------------------------
+# 🧭 저장 경로: uploads/blobs/ab/cd/<sha256>
+# -------------------------------
+BLOB_DIR = os.path.join("uploads", "blobs")  # 루트 경로 기준
+BLOB_TMP_DIR = os.path.join(BLOB_DIR, "tmp")  # 같은 파일시스템 → os.replace 원자적 이동
+os.makedirs(BLOB_TMP_DIR, exist_ok=True)
+
+# 참조가 0이 된 blob / 행이 없는 파일을 GC가 지우기까지의 유예 시간(초)
+BLOB_GC_GRACE = int(os.getenv("BLOB_GC_GRACE", "3600"))
+
+logger = logging.getLogger(__name__)
+
+
+def blob_path(content_hash: str) -> str:
+    """해시 앞 2+2자리로 디렉터리 분산 (한 디렉터리에 파일이 몰리지 않도록)"""
+    return os.path.join(BLOB_DIR, content_hash[:2], content_hash[2:4], content_hash)
+
+
+def is_blob_path(content_hash: str | None, file_path: str | None) -> bool:
+    """저장소 도입 이전 첨부파일(개별 파일)과 구분"""
+    return bool(content_hash) and file_path == blob_path(content_hash)
+
+
+# -------------------------------
+# ➕ 참조 획득 (업로드)
+# -------------------------------
+def _upsert_ref(db: Session, content_hash: str, file_size: int):
+    """ref_count + 1 (행이 없으면 생성) — 같은 트랜잭션에서 행 잠금"""
+    dialect = db.get_bind().dialect.name
+    B = AttachmentBlob
+    row = {
+        "content_hash": content_hash,
+        "file_size": file_size,
+        "ref_count": 1,
+        "updated_at": datetime.utcnow(),
+    }
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert
+
+        stmt = upsert(B).values(row)
+        stmt = stmt.on_duplicate_key_update(
+            ref_count=B.ref_count + 1, updated_at=stmt.inserted.updated_at
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+
+        stmt = upsert(B).values(row)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[B.content_hash],
+            set_={"ref_count": B.ref_count + 1, "updated_at": stmt.excluded.updated_at},
+        )
+    db.execute(stmt)
+
+
+def acquire_blob(db: Session, content_hash: str, file_size: int, tmp_path: str) -> str:
+    """
+    임시 파일(해시 계산 완료)을 저장소에 등록하고 blob 경로 반환.
+    - 참조 수를 먼저 올려(행 잠금) 동시에 도는 GC가 같은 blob을 지우지 못하게 한 뒤 파일 배치
+    - 같은 내용이 이미 있으면 임시 파일만 삭제 (중복 저장 없음) + 수정 시각 갱신
+      → 롤백된 업로드가 남긴 오래된 파일이어도 고아 파일 GC의 유예 시간이 다시 시작됨
+    - 커밋 전에 호출 → 롤백되면 새로 배치된 파일은 GC가 고아 파일로 정리
+    """
+    _upsert_ref(db, content_hash, file_size)
+    path = blob_path(content_hash)
+    if os.path.exists(path):
+        os.remove(tmp_path)
+        os.utime(path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return path
+
+
+# -------------------------------
+# ➖ 참조 해제 (첨부파일 / 태스크 삭제)
+# -------------------------------
+def release_blobs(db: Session, attachments: Iterable[tuple[str | None, str | None]]) -> list[str]:
+    """
+    (content_hash, file_path) 목록의 참조 수를 UPDATE 한 번(executemany)으로 차감.
+    저장소 밖의 개별 파일은 제외. 반환: 차감된 해시 목록 (커밋 후 sweep_blobs 대상)
+    """
+    released = Counter(h for h, path in attachments if is_blob_path(h, path))
+    if not released:
+        return []
+    # ORM bulk update는 PK 값 대입만 지원 → 증감식은 Core 테이블로 executemany
+    B = AttachmentBlob.__table__
+    db.execute(
+        update(B)
+        .where(B.c.content_hash == bindparam("h"))
+        .values(ref_count=B.c.ref_count - bindparam("n"), updated_at=datetime.utcnow()),
+        [{"h": h, "n": n} for h, n in released.items()],
+    )
+    return list(released)
+
+
+def sweep_blobs(db: Session, hashes: Iterable[str] | None = None, grace: int = 0) -> int:
+    """
+    참조가 0 이하인 blob 파일과 행 삭제 후 커밋. 반환: 삭제한 blob 수
+    - hashes 지정: 방금 참조를 해제한 blob만 즉시 정리 (마지막 참조 삭제 시)
+    - grace: 마지막 변경 후 이 시간(초)이 지난 blob만 대상 (GC)
+    - FOR UPDATE로 잠근 상태에서 파일 삭제 → 같은 blob을 다시 올리는 업로드는 커밋 후 재배치
+    """
+    B = AttachmentBlob
+    stmt = select(B.content_hash).where(B.ref_count <= 0)
+    if hashes is not None:
+        hashes = list(hashes)
+        if not hashes:
+            return 0
+        stmt = stmt.where(B.content_hash.in_(hashes))
+    if grace > 0:
+        stmt = stmt.where(B.updated_at < datetime.utcnow() - timedelta(seconds=grace))
+    try:
+        dead = db.execute(stmt.with_for_update()).scalars().all()
+        for h in dead:
+            path = blob_path(h)
+            if os.path.exists(path):
+                os.remove(path)
+        if dead:
+            db.execute(delete(B).where(B.content_hash.in_(dead)))
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(dead)
+
+
+def drop_released_blobs(db: Session, hashes: list[str]):
+    """커밋 후 마지막 참조였던 blob 즉시 정리 (실패해도 GC가 다시 처리하므로 로그만)"""
+    if not hashes:
+        return
+    try:
+        sweep_blobs(db, hashes)
+    except Exception:
+        logger.exception("첨부파일 blob 정리 실패: %s", hashes)
+
+
+# -------------------------------
+# 🧹 GC: 참조 수 보정 + 미참조 blob + 고아 파일
+# -------------------------------
+def reconcile_blob_refs(db: Session) -> int:
+    """
+    attachment 기준으로 ref_count 재계산 (UPDATE 한 번, 어긋난 행만).
+    프로젝트 삭제 등 FK ON DELETE CASCADE로 지워진 첨부파일 보정. 반환: 수정된 blob 수
+    """
+    B = AttachmentBlob
+    actual = (
+        select(func.count(Attachment.attachment_id))
+        .where(Attachment.content_hash == B.content_hash)
+        .scalar_subquery()
+    )
+    result = db.execute(
+        update(B)
+        .where(B.ref_count != actual)
+        .values(ref_count=actual, updated_at=datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount or 0
+
+
+def sweep_orphan_files(db: Session, grace: int = BLOB_GC_GRACE) -> int:
+    """
+    attachment_blob 행이 없는 파일(롤백된 업로드 등)과 오래된 임시 파일 삭제.
+    유예 시간 이전 파일은 진행 중인 업로드일 수 있으므로 건너뜀. 반환: 삭제한 파일 수
+    - 삭제 직전 파일별로 행을 FOR UPDATE 재조회 (없는 키는 간격 잠금 → 같은 해시 업로드의
+      참조 upsert는 GC 커밋까지 대기) + 수정 시각 재확인 (중복 업로드가 방금 갱신했으면 유지)
+    """
+    cutoff = time.time() - grace
+    candidates = []
+    for root, _, files in os.walk(BLOB_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    candidates.append((name, path))
+            except FileNotFoundError:
+                continue
+    if not candidates:
+        return 0
+
+    known = set()
+    names = [name for name, path in candidates if path != os.path.join(BLOB_TMP_DIR, name)]
+    for i in range(0, len(names), 1000):
+        chunk = names[i : i + 1000]
+        known.update(
+            db.execute(
+                select(AttachmentBlob.content_hash).where(AttachmentBlob.content_hash.in_(chunk))
+            ).scalars()
+        )
+    db.rollback()  # 읽기 전용 트랜잭션 종료
+
+    removed = 0
+    for name, path in candidates:
+        if name in known:
+            continue
+        is_tmp = path == os.path.join(BLOB_TMP_DIR, name)
+        try:
+            if not is_tmp:
+                # 삭제 직전 행 잠금 재확인 → 그 사이 같은 해시가 등록됐으면 유지
+                referenced = db.execute(
+                    select(AttachmentBlob.content_hash)
+                    .where(AttachmentBlob.content_hash == name)
+                    .with_for_update()
+                ).first()
+                if referenced:
+                    continue
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                removed += 1
+        except FileNotFoundError:
+            pass
+        finally:
+            db.rollback()  # 잠금 해제 (파일당 짧은 트랜잭션)
+    return removed
@@ -0,0 +1,116 @@
+# app/utils/change_feed.py
+from datetime import datetime
+from typing import Callable, Iterable
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.models.enums import ChangeEntityType
+from app.models.project import Project
+from app.models.project_change import ProjectChange
+
+EntityRef = int | Callable[[], int]
+
+
+# ----------------------------------------
+# 변경 적재 (세션 단위, 커밋 직전 반영)
+# ----------------------------------------
+def stage_change(
+    db: Session,
+    project_id: int,
+    entity_type: ChangeEntityType,
+    entity_ids: EntityRef | Iterable[EntityRef],
+    deleted: bool = False,
+):
+    """
+    엔티티 변경을 세션에 적재 → 커밋 직전에 프로젝트 버전 +1 후 같은 트랜잭션으로 기록.
+    - entity_ids가 callable이면 flush 이후 평가 (신규 엔티티 ID)
+    - 롤백 시 적재된 변경은 폐기
+    """
+    if isinstance(entity_ids, int) or callable(entity_ids):
+        entity_ids = [entity_ids]
+    staged = db.info.setdefault("staged_changes", [])
+    staged.extend((project_id, entity_type, ref, deleted) for ref in entity_ids)
+
+
+def _upsert_changes(db: Session, rows: list[dict]):
+    """(project_id, entity_type, entity_id) 기준 upsert — 엔티티당 마지막 변경 1행 유지"""
+    dialect = db.get_bind().dialect.name
+    C = ProjectChange
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert
+
+        stmt = upsert(C).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            version=stmt.inserted.version,
+            deleted=stmt.inserted.deleted,
+            changed_at=stmt.inserted.changed_at,
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+
+        stmt = upsert(C).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[C.project_id, C.entity_type, C.entity_id],
+            set_={
+                "version": stmt.excluded.version,
+                "deleted": stmt.excluded.deleted,
+                "changed_at": stmt.excluded.changed_at,
+            },
+        )
+    db.execute(stmt)
+
+
+@event.listens_for(Session, "before_commit")
+def _apply_staged_changes(session: Session):
+    staged = session.info.pop("staged_changes", None)
+    if not staged:
+        return
+    session.flush()
+
+    # 프로젝트별로 엔티티당 마지막 상태만 남김 (생성 후 삭제 → 툼스톤 1건)
+    per_project: dict[int, dict[tuple, bool]] = {}
+    for project_id, entity_type, ref, deleted in staged:
+        entity_id = ref() if callable(ref) else ref
+        if entity_id is None:
+            continue
+        per_project.setdefault(project_id, {})[(entity_type, entity_id)] = deleted
+
+    now = datetime.utcnow()
+    # 프로젝트 ID 순으로 잠금 → 여러 프로젝트를 건드리는 트랜잭션 간 교착 방지
+    for project_id in sorted(per_project):
+        session.execute(
+            update(Project)
+            .where(Project.project_id == project_id)
+            # updated_at 그대로 대입 → onupdate / ON UPDATE CURRENT_TIMESTAMP 미적용
+            # (버전 증가는 프로젝트 자체 수정이 아님)
+            .values(change_version=Project.change_version + 1, updated_at=Project.updated_at)
+            .execution_options(synchronize_session=False)
+        )
+        version = session.execute(
+            select(Project.change_version).where(Project.project_id == project_id)
+        ).scalar()
+        if version is None:  # 같은 트랜잭션에서 삭제된 프로젝트
+            continue
+        _upsert_changes(
+            session,
+            [
+                {
+                    "project_id": project_id,
+                    "entity_type": entity_type,
+                    "entity_id": entity_id,
+                    "version": version,
+                    "deleted": deleted,
+                    "changed_at": now,
+                }
+                for (entity_type, entity_id), deleted in per_project[project_id].items()
+            ],
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged_changes(session: Session):
+    session.info.pop("staged_changes", None)
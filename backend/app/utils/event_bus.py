@@ -0,0 +1,286 @@
+# app/utils/event_bus.py
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+from dotenv import load_dotenv
+from fastapi import WebSocket
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.schemas.event import (
+    NotificationEvent,
+    NotificationEventType,
+    ProjectEvent,
+    ProjectEventType,
+)
+
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# memory:// (단일 프로세스) 또는 redis://host:port/db (여러 uvicorn 워커 공유)
+EVENT_BUS_URL = os.getenv("EVENT_BUS_URL", "memory://")
+# 소켓별 송신 대기열 크기 (가득 차면 느린 소비자로 보고 연결 종료)
+EVENT_BUS_QUEUE_SIZE = int(os.getenv("EVENT_BUS_QUEUE_SIZE", "100"))
+REDIS_CHANNEL_PREFIX = "events:"
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[str, str], None]
+
+
+def project_channel(project_id: int) -> str:
+    return f"project:{project_id}"
+
+
+def user_channel(emp_id: int) -> str:
+    return f"user:{emp_id}"
+
+
+# ----------------------------------------
+# 백엔드: 단일 프로세스 (기본값)
+# ----------------------------------------
+class InProcessBackend:
+    def __init__(self):
+        self._handler: Handler | None = None
+
+    async def start(self, handler: Handler):
+        self._handler = handler
+
+    async def stop(self):
+        self._handler = None
+
+    async def publish(self, channel: str, data: str):
+        if self._handler:
+            self._handler(channel, data)
+
+
+# ----------------------------------------
+# 백엔드: Redis 호환 pub/sub (워커 간 공유)
+# ----------------------------------------
+class RedisBackend:
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as aioredis
+        except ImportError as e:  # 선택 의존성
+            raise RuntimeError("EVENT_BUS_URL=redis:// 사용 시 redis 패키지가 필요합니다.") from e
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._listener: asyncio.Task | None = None
+
+    async def start(self, handler: Handler):
+        pubsub = self._redis.pubsub()
+        await pubsub.psubscribe(f"{REDIS_CHANNEL_PREFIX}*")
+
+        async def listen():
+            async for message in pubsub.listen():
+                if message.get("type") != "pmessage":
+                    continue
+                channel = message["channel"][len(REDIS_CHANNEL_PREFIX) :]
+                handler(channel, message["data"])
+
+        self._listener = asyncio.create_task(listen())
+
+    async def stop(self):
+        if self._listener:
+            self._listener.cancel()
+        await self._redis.aclose()
+
+    async def publish(self, channel: str, data: str):
+        await self._redis.publish(f"{REDIS_CHANNEL_PREFIX}{channel}", data)
+
+
+# ----------------------------------------
+# 구독자: 소켓 1개 = 대기열 1개 + 송신 태스크 1개
+# ----------------------------------------
+class _Subscriber:
+    def __init__(self, channel: str, websocket: WebSocket):
+        self.channel = channel
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=EVENT_BUS_QUEUE_SIZE)
+        self.sender: asyncio.Task | None = None
+
+
+class EventBus:
+    """
+    채널(project:{id} 등) 단위 WebSocket 팬아웃.
+    - 발행은 구독자별 대기열에 put_nowait 만 하므로 느린 소켓이 다른 소켓을 막지 않음
+    - 송신 실패(끊긴 소켓)나 대기열 초과(느린 소비자)는 구독 해제
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._subscribers: dict[str, set[_Subscriber]] = {}
+
+    async def start(self):
+        self.loop = asyncio.get_running_loop()
+        await self.backend.start(self._deliver)
+
+    async def stop(self):
+        await self.backend.stop()
+        for subs in list(self._subscribers.values()):
+            for sub in list(subs):
+                self._drop(sub)
+        self.loop = None
+
+    # ---------- 구독 ----------
+    def subscribe(self, channel: str, websocket: WebSocket) -> _Subscriber:
+        sub = _Subscriber(channel, websocket)
+        sub.sender = asyncio.create_task(self._send_loop(sub))
+        self._subscribers.setdefault(channel, set()).add(sub)
+        return sub
+
+    def unsubscribe(self, sub: _Subscriber):
+        self._drop(sub)
+
+    def send_to(self, sub: _Subscriber, data: str):
+        """특정 구독자 한 명에게만 전송 (연결 직후 초기 상태 등)"""
+        try:
+            sub.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            self._drop(sub, close_code=1013)
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+    # ---------- 발행 ----------
+    async def publish(self, channel: str, data: str):
+        await self.backend.publish(channel, data)
+
+    def publish_threadsafe(self, channel: str, data: str):
+        """동기 코드(스레드풀)에서 호출 가능한 발행"""
+        loop = self.loop
+        if loop is None or loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.publish(channel, data), loop)
+
+    # ---------- 내부 ----------
+    def _deliver(self, channel: str, data: str):
+        for sub in list(self._subscribers.get(channel, ())):
+            try:
+                sub.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                logger.warning("느린 WebSocket 소비자 연결 종료: %s", channel)
+                self._drop(sub, close_code=1013)
+
+    async def _send_loop(self, sub: _Subscriber):
+        try:
+            while True:
+                data = await sub.queue.get()
+                await sub.websocket.send_text(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # 끊긴 소켓 정리
+            self._drop(sub)
+
+    def _drop(self, sub: _Subscriber, close_code: int | None = None):
+        subs = self._subscribers.get(sub.channel)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                self._subscribers.pop(sub.channel, None)
+        if sub.sender and sub.sender is not asyncio.current_task():
+            sub.sender.cancel()
+        if close_code is not None:
+            asyncio.create_task(_close_quietly(sub.websocket, close_code))
+
+
+async def _close_quietly(websocket: WebSocket, code: int):
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        pass
+
+
+def _create_backend(url: str):
+    if url.startswith("redis://") or url.startswith("rediss://"):
+        return RedisBackend(url)
+    return InProcessBackend()
+
+
+event_bus = EventBus(_create_backend(EVENT_BUS_URL))
+
+
+# ----------------------------------------
+# 커밋 이후 발행 (세션 단위 스테이징)
+# ----------------------------------------
+def _stage(db: Session, channel: str, build: Callable[[], str]):
+    """(채널, 직렬화 함수)를 세션에 적재 → 커밋 직전 직렬화, 커밋 후 발행"""
+    db.info.setdefault("staged_events", []).append((channel, build))
+
+
+def _resolve(payload):
+    return (payload() if callable(payload) else payload) or {}
+
+
+def stage_project_event(
+    db: Session,
+    project_id: int,
+    event_type: ProjectEventType,
+    payload: dict[str, Any] | Callable[[], dict[str, Any]] | None = None,
+    actor_emp_id: int | None = None,
+):
+    """
+    이벤트를 세션에 적재하고 트랜잭션이 커밋된 뒤에만 발행.
+    - payload가 callable이면 커밋 직전(flush 이후)에 평가 → 신규 엔티티 ID 사용 가능
+    - 롤백 시 적재된 이벤트는 폐기
+    """
+    _stage(
+        db,
+        project_channel(project_id),
+        lambda: ProjectEvent(
+            event=event_type,
+            project_id=project_id,
+            actor_emp_id=actor_emp_id,
+            payload=_resolve(payload),
+        ).model_dump_json(),
+    )
+
+
+def stage_user_event(
+    db: Session,
+    emp_id: int,
+    event_type: NotificationEventType,
+    payload: dict[str, Any] | Callable[[], dict[str, Any]] | None = None,
+    unread_delta: int = 0,
+    unread_count: int | None = None,
+):
+    """개인 알림 스트림(user:{emp_id}) 이벤트 적재 (stage_project_event와 같은 커밋 규칙)"""
+    _stage(
+        db,
+        user_channel(emp_id),
+        lambda: NotificationEvent(
+            event=event_type,
+            recipient_emp_id=emp_id,
+            unread_delta=unread_delta,
+            unread_count=unread_count,
+            payload=_resolve(payload),
+        ).model_dump_json(),
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def _serialize_staged_events(session: Session):
+    staged = session.info.pop("staged_events", None)
+    if not staged:
+        return
+    session.flush()
+    ready = session.info.setdefault("ready_events", [])
+    for channel, build in staged:
+        ready.append((channel, build()))
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_ready_events(session: Session):
+    for channel, data in session.info.pop("ready_events", ()):
+        event_bus.publish_threadsafe(channel, data)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_staged_events(session: Session):
+    session.info.pop("staged_events", None)
+    session.info.pop("ready_events", None)
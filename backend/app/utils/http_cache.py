@@ -0,0 +1,84 @@
+# app/utils/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+
+
+def http_date(value: datetime) -> str:
+    """datetime → HTTP-date (naive 값은 UTC로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두어 무시, * 허용)"""
+    if header.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in header.split(","))
+
+
+def is_not_modified(
+    request: Request, etag: str | None = None, last_modified: datetime | None = None
+) -> bool:
+    """
+    조건부 요청이 현재 표현과 같은지 판단 (RFC 9110 13.2.2).
+    If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since 비교
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        # HTTP-date는 초 단위
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    """304 응답 (본문 없음, 검증자 헤더만)"""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+# ----------------------------------------
+# 변경 버전 기반 ETag (목록·상세 조회)
+# ----------------------------------------
+def version_etag(request: Request, version: int | None, *parts) -> str | None:
+    """
+    project.change_version + 경로 + 쿼리 → 약한 ETag (버전이 None이면 None).
+    필터·정렬·커서가 다르면 다른 ETag (같은 버전이라도 응답 본문이 다름)
+    """
+    if version is None:
+        return None
+    key = "|".join(
+        [request.url.path, *sorted(f"{k}={v}" for k, v in request.query_params.multi_items())]
+        + [str(part) for part in parts]
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return f'W/"v{version}-{digest}"'
+
+
+def check_etag(request: Request, response: Response, etag: str | None) -> Response | None:
+    """
+    If-None-Match가 일치하면 304 응답 반환, 아니면 응답에 검증자 헤더만 설정하고 None.
+    etag가 None(프로젝트 없음 등)이면 아무것도 하지 않음 → 라우터가 평소대로 처리
+    """
+    if etag is None:
+        return None
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if is_not_modified(request, etag):
+        return not_modified(headers)
+    response.headers.update(headers)
+    return None
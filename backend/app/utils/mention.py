@@ -1,51 +1,180 @@
 # app/utils/mention.py
+import os
 import re
-from typing import List
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List
 
+from dotenv import load_dotenv
+from sqlalchemy import event, inspect, select
 from sqlalchemy.orm import Session
 
 from app.models.employee import Employee
 
-# ✅ @username, @홍길동, @lee_hs 등 다양한 케이스 지원
-MENTION_PATTERN = re.compile(r"@([A-Za-z0-9가-힣._-]+)")
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# 직원 디렉터리 전체 재적재 주기(초) — 다른 워커 프로세스에서 바뀐 직원 반영용
+MENTION_DIRECTORY_TTL = int(os.getenv("MENTION_DIRECTORY_TTL", "600"))
+
+# ✅ @username, @홍길동, @lee_hs, @hong@company.com 등 다양한 케이스 지원
+MENTION_PATTERN = re.compile(r"@([A-Za-z0-9가-힣._-]+(?:@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)+)?)")
 
 
 def extract_mentions(text: str) -> List[str]:
     """
-    본문에서 '@멘션' 문자열 추출
+    본문에서 '@멘션' 문자열 추출 (문장 끝 마침표 제외, 중복 제거)
     예시: "@lee_hs 프로젝트 확인해주세요" → ["lee_hs"]
     """
     if not text:
         return []
-    return MENTION_PATTERN.findall(text)
+    mentions = []
+    for mention in MENTION_PATTERN.findall(text):
+        mention = mention.rstrip(".")
+        if mention and mention not in mentions:
+            mentions.append(mention)
+    return mentions
+
 
+# ----------------------------------------
+# 직원 디렉터리 (사번 / 이메일 / 이름 → emp_id, 프로세스 메모리)
+# ----------------------------------------
+_KINDS = ("emp_no", "email", "name")  # 해석 우선순위
 
-def resolve_recipients(
-    db: Session, identifiers: List[str], by: str = "emp_no"
-) -> List[int]:
+
+class EmployeeDirectory:
     """
-    멘션 문자열(@아이디)을 Employee.emp_id 리스트로 변환
-    - by: 매핑 기준 ('emp_no', 'name', 'email')
+    멘션 해석용 인메모리 색인.
+    - 최초 사용 또는 TTL 경과 시 직원 전체를 한 번에 적재, 그 사이에는 DB 조회 없음
+    - 같은 프로세스의 직원 생성/수정/삭제는 커밋 직후 해당 직원만 갱신
+    - 동명이인처럼 여러 명에 걸리는 값은 잘못된 사람에게 알림이 가지 않도록 해석하지 않음
     """
-    if not identifiers:
-        return []
 
-    query = None
-    if by == "name":
-        query = db.query(Employee.emp_id).filter(Employee.name.in_(identifiers))
-    elif by == "email":
-        query = db.query(Employee.emp_id).filter(Employee.email.in_(identifiers))
-    else:
-        query = db.query(Employee.emp_id).filter(Employee.emp_no.in_(identifiers))
+    def __init__(self, ttl: int = MENTION_DIRECTORY_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._index: dict[tuple[str, str], set[int]] = {}
+        self._keys: dict[int, tuple[tuple[str, str], ...]] = {}
+        self._loaded_at: float | None = None
+
+    @staticmethod
+    def _keys_of(emp_no, email, name) -> tuple[tuple[str, str], ...]:
+        keys = []
+        for kind, value in zip(_KINDS, (emp_no, email, name)):
+            if value:
+                value = str(value).strip()
+                keys.append((kind, value.lower() if kind == "email" else value))
+        return tuple(keys)
+
+    def _put(self, emp_id: int, keys: tuple[tuple[str, str], ...]):
+        self._keys[emp_id] = keys
+        for key in keys:
+            self._index.setdefault(key, set()).add(emp_id)
+
+    def _drop(self, emp_id: int):
+        for key in self._keys.pop(emp_id, ()):
+            ids = self._index.get(key)
+            if ids is not None:
+                ids.discard(emp_id)
+                if not ids:
+                    del self._index[key]
+
+    def load(self, db: Session):
+        """직원 전체 재적재 (SELECT 한 번)"""
+        rows = db.execute(
+            select(Employee.emp_id, Employee.emp_no, Employee.email, Employee.name)
+        ).all()
+        with self._lock:
+            self._index, self._keys = {}, {}
+            for emp_id, emp_no, email, name in rows:
+                self._put(emp_id, self._keys_of(emp_no, email, name))
+            self._loaded_at = time.monotonic()
+
+    def ensure_loaded(self, db: Session):
+        loaded_at = self._loaded_at
+        if loaded_at is None or time.monotonic() - loaded_at > self.ttl:
+            self.load(db)
+
+    def resolve(self, identifiers: Iterable[str]) -> List[int]:
+        """멘션 문자열 → emp_id (사번 → 이메일 → 이름 순, 중복 제거·입력 순서 유지)"""
+        resolved = []
+        with self._lock:
+            for identifier in identifiers:
+                for kind in _KINDS:
+                    value = identifier.lower() if kind == "email" else identifier
+                    ids = self._index.get((kind, value))
+                    if ids:
+                        if len(ids) == 1:
+                            emp_id = next(iter(ids))
+                            if emp_id not in resolved:
+                                resolved.append(emp_id)
+                        break
+        return resolved
 
-    return [row.emp_id for row in query.all()]
+    def apply(self, changes: dict[int, tuple | None]):
+        """{emp_id: (emp_no, email, name) | None(삭제)} 반영 (적재 전이면 다음 적재 때 반영됨)"""
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            for emp_id, values in changes.items():
+                self._drop(emp_id)
+                if values is not None:
+                    self._put(emp_id, self._keys_of(*values))
 
+    def clear(self):
+        with self._lock:
+            self._index, self._keys = {}, {}
+            self._loaded_at = None
 
-def resolve_mentions(db: Session, text: str, by: str = "emp_no") -> List[int]:
+
+employee_directory = EmployeeDirectory()
+
+
+def resolve_mentions(db: Session, text: str) -> List[int]:
     """
     본문에서 '@멘션' → 실제 직원 emp_id 리스트로 변환
+    (디렉터리가 적재된 뒤에는 DB 조회 없음)
     """
     mentions = extract_mentions(text)
     if not mentions:
         return []
-    return resolve_recipients(db, mentions, by)
+    employee_directory.ensure_loaded(db)
+    return employee_directory.resolve(mentions)
+
+
+# ----------------------------------------
+# 갱신: 직원 생성·삭제, 사번/이메일/이름 변경 (커밋 직후 반영)
+# ----------------------------------------
+_DIRECTORY_FIELDS = ("emp_no", "email", "name")
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_directory_changes(session: Session, flush_context):
+    changes = {}
+    for obj in session.new:
+        if isinstance(obj, Employee):
+            changes[obj.emp_id] = (obj.emp_no, obj.email, obj.name)
+    for obj in session.dirty:
+        if isinstance(obj, Employee):
+            attrs = inspect(obj).attrs
+            if any(attrs[name].history.has_changes() for name in _DIRECTORY_FIELDS):
+                changes[obj.emp_id] = (obj.emp_no, obj.email, obj.name)
+    for obj in session.deleted:
+        if isinstance(obj, Employee):
+            changes[obj.emp_id] = None
+    if changes:
+        session.info.setdefault("employee_directory_changes", {}).update(changes)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_directory_changes(session: Session):
+    changes = session.info.pop("employee_directory_changes", None)
+    if changes:
+        employee_directory.apply(changes)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_directory_changes(session: Session):
+    session.info.pop("employee_directory_changes", None)
@@ -1,11 +1,157 @@
 # app/utils/notifier.py
 import json
-from typing import Iterable, List, Optional
+from collections import Counter
+from datetime import datetime
+from typing import Iterable, List, Mapping, Optional
 
+from sqlalchemy import case, func, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationCounter, NotificationType
+from app.schemas.event import NotificationEventType
+from app.utils.event_bus import stage_user_event
+
+
+# ----------------------------------------
+# 🔢 수신자별 알림 개수 (notification_counter)
+# ----------------------------------------
+def apply_counter_deltas(db: Session, deltas: Mapping[int, tuple[int, int]]):
+    """
+    수신자별 (total 증감, unread 증감)을 카운터 테이블에 원자적으로 반영.
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE / SQLite·PostgreSQL: ON CONFLICT
+    - 같은 트랜잭션에서 실행되므로 알림 변경과 함께 커밋/롤백됨
+    """
+    rows = [
+        {
+            "recipient_emp_id": emp_id,
+            "total_count": total,
+            "unread_count": unread,
+            "updated_at": datetime.utcnow(),
+        }
+        for emp_id, (total, unread) in deltas.items()
+        if emp_id and (total or unread)
+    ]
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    C = NotificationCounter
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert as upsert
+
+        stmt = upsert(C).values(rows)
+        stmt = stmt.on_duplicate_key_update(
+            total_count=C.total_count + stmt.inserted.total_count,
+            unread_count=C.unread_count + stmt.inserted.unread_count,
+            updated_at=stmt.inserted.updated_at,
+        )
+    else:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as upsert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as upsert
+
+        stmt = upsert(C).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[C.recipient_emp_id],
+            set_={
+                "total_count": C.total_count + stmt.excluded.total_count,
+                "unread_count": C.unread_count + stmt.excluded.unread_count,
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+    db.execute(stmt)
+
+
+def insert_notification_rows(db: Session, rows: List[dict]):
+    """build_notification_rows 결과를 INSERT 한 번(executemany)으로 적재 + 카운터 반영"""
+    if not rows:
+        return
+    now = datetime.utcnow()
+    db.execute(
+        insert(Notification),
+        [{"is_read": False, "created_at": now, **row} for row in rows],
+    )
+    per_recipient = Counter(row["recipient_emp_id"] for row in rows)
+    apply_counter_deltas(db, {rid: (n, n) for rid, n in per_recipient.items()})
+
+    # 📡 수신자 실시간 푸시 (executemany라 notification_id 없음 → 클라이언트는 목록 재조회)
+    for row in rows:
+        stage_user_event(
+            db,
+            row["recipient_emp_id"],
+            NotificationEventType.created,
+            {**row, "created_at": now},
+            unread_delta=1,
+        )
+
+
+def remove_task_notifications(db: Session, task_ids: Iterable[int]):
+    """태스크 삭제 시 연결된 알림 삭제 + 수신자별 카운터 차감"""
+    task_ids = list(task_ids)
+    if not task_ids:
+        return
+    counts = (
+        db.query(
+            Notification.recipient_emp_id,
+            func.count(Notification.notification_id),
+            func.sum(case((Notification.is_read.is_(True), 0), else_=1)),
+        )
+        .filter(Notification.task_id.in_(task_ids))
+        .group_by(Notification.recipient_emp_id)
+    )
+    deltas = {rid: (-total, -int(unread or 0)) for rid, total, unread in counts}
+    db.query(Notification).filter(Notification.task_id.in_(task_ids)).delete(
+        synchronize_session=False
+    )
+    apply_counter_deltas(db, deltas)
+    for rid, (_, unread_delta) in deltas.items():
+        stage_user_event(
+            db,
+            rid,
+            NotificationEventType.deleted,
+            {"task_ids": task_ids},
+            unread_delta=unread_delta,
+        )
+
+
+def _serialize_payload(payload):
+    """JSON 직렬화 안전 처리"""
+    if payload and not isinstance(payload, str):
+        try:
+            return json.dumps(payload, ensure_ascii=False)
+        except Exception:
+            return None
+    return payload
+
+
+def build_notification_rows(
+    *,
+    recipients: Iterable[int],
+    actor_emp_id: int,
+    project_id: Optional[int] = None,
+    task_id: Optional[int] = None,
+    ntype: NotificationType = NotificationType.comment,
+    payload: Optional[dict] = None,
+) -> List[dict]:
+    """
+    일괄 INSERT(executemany)용 알림 행(dict) 목록 생성.
+    - create_notifications와 같은 규칙 (중복 수신자 제거, 자기 자신 제외)
+    """
+    payload = _serialize_payload(payload)
+    return [
+        {
+            "recipient_emp_id": rid,
+            "actor_emp_id": actor_emp_id,
+            "project_id": project_id,
+            "task_id": task_id,
+            "type": ntype,
+            "payload": payload,
+        }
+        for rid in set(recipients)
+        if rid and rid != actor_emp_id
+    ]
 
 
 def create_notifications(
@@ -29,11 +175,7 @@ def create_notifications(
     notifications: list[Notification] = []
 
     # JSON 직렬화 안전 처리
-    if payload and not isinstance(payload, str):
-        try:
-            payload = json.dumps(payload, ensure_ascii=False)
-        except Exception:
-            payload = None
+    payload = _serialize_payload(payload)
 
     for rid in set(recipients):
         if rid == actor_emp_id:
@@ -55,6 +197,16 @@ def create_notifications(
 
     try:
         db.add_all(notifications)
+        apply_counter_deltas(db, {n.recipient_emp_id: (1, 1) for n in notifications})
+        # 📡 커밋 후 수신자에게 실시간 푸시 (flush 이후 평가 → notification_id 포함)
+        for n in notifications:
+            stage_user_event(
+                db,
+                n.recipient_emp_id,
+                NotificationEventType.created,
+                n.to_dict,
+                unread_delta=1,
+            )
         if auto_commit:
             db.commit()
         return notifications
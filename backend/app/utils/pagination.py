@@ -0,0 +1,48 @@
+# app/utils/pagination.py
+import base64
+import json
+from datetime import date, datetime
+
+from fastapi import Response
+
+from app.core.exceptions import bad_request
+
+# 다음 페이지 커서를 내려주는 응답 헤더 (본문은 기존처럼 리스트 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _json_default(v):
+    if isinstance(v, (datetime, date)):
+        return v.isoformat()
+    raise TypeError(f"커서에 넣을 수 없는 값: {v!r}")
+
+
+def encode_cursor(*values) -> str:
+    """정렬 키 값들을 불투명(opaque) 커서 문자열로 인코딩"""
+    raw = json.dumps(list(values), default=_json_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    """커서 문자열 → 정렬 키 값 리스트 (형식이 맞지 않으면 400)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError):
+        bad_request("잘못된 커서 값입니다.")
+    if not isinstance(values, list) or len(values) != size:
+        bad_request("잘못된 커서 값입니다.")
+    return values
+
+
+def decode_datetime(value) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        bad_request("잘못된 커서 값입니다.")
+
+
+def set_next_cursor(response: Response, next_cursor: str | None):
+    """다음 페이지가 있으면 X-Next-Cursor 헤더 설정"""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,159 @@
+# app/utils/password_hasher.py
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from dotenv import load_dotenv
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.utils.pool_metrics import PoolMetrics
+
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# bcrypt 비용 (변경 시 기존 해시는 다음 로그인 때 자동 재해시)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# 해시 전용 프로세스 수 (0이면 호출 스레드에서 직접 계산 — 개발/테스트용)
+PASSWORD_POOL_WORKERS = int(os.getenv("PASSWORD_POOL_WORKERS", str(min(2, os.cpu_count() or 1))))
+# 동시에 처리(대기 포함)할 수 있는 해시 작업 수 / 슬롯 대기 한도(초)
+PASSWORD_MAX_CONCURRENCY = int(
+    os.getenv("PASSWORD_MAX_CONCURRENCY", str(max(PASSWORD_POOL_WORKERS, 1) * 2))
+)
+PASSWORD_QUEUE_TIMEOUT = float(os.getenv("PASSWORD_QUEUE_TIMEOUT", "10"))
+
+
+# ----------------------------------------
+# 워커 프로세스에서 실행되는 함수 (pickle 가능한 모듈 수준 함수)
+# ----------------------------------------
+_contexts: dict[int, CryptContext] = {}
+
+
+def _context(rounds: int) -> CryptContext:
+    """rounds가 다른 해시는 needs_update 대상 (min = max = default)"""
+    ctx = _contexts.get(rounds)
+    if ctx is None:
+        ctx = CryptContext(
+            schemes=["bcrypt"],
+            deprecated="auto",
+            bcrypt__default_rounds=rounds,
+            bcrypt__min_rounds=rounds,
+            bcrypt__max_rounds=rounds,
+        )
+        _contexts[rounds] = ctx
+    return ctx
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> tuple[bool, str | None]:
+    try:
+        return _context(rounds).verify_and_update(password, hashed)
+    except ValueError:  # 형식이 잘못된 해시
+        return False, None
+
+
+# ----------------------------------------
+# 프로세스 풀 + 동시성 제한 + 대기 시간 지표
+# ----------------------------------------
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 전용 프로세스 풀에서 실행.
+    - 요청 스레드는 결과만 기다리므로 GIL·CPU를 점유하지 않음
+    - 슬롯(세마포어)을 PASSWORD_QUEUE_TIMEOUT 안에 얻지 못하면 503 (로그인 폭주 시 무한 대기 방지)
+    - metrics: 슬롯 대기 시간 히스토그램 + 타임아웃(거절) 횟수
+    """
+
+    def __init__(
+        self,
+        workers: int = PASSWORD_POOL_WORKERS,
+        max_concurrency: int = PASSWORD_MAX_CONCURRENCY,
+        queue_timeout: float = PASSWORD_QUEUE_TIMEOUT,
+        rounds: int = BCRYPT_ROUNDS,
+    ):
+        self.workers = workers
+        self.queue_timeout = queue_timeout
+        self.rounds = rounds
+        self.max_concurrency = max(max_concurrency, 1)
+        self.metrics = PoolMetrics()
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor | None:
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    # spawn: 스레드/이벤트 루프가 있는 서버 프로세스를 fork하지 않음
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _run(self, fn, *args):
+        started = time.perf_counter()
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            self.metrics.observe((time.perf_counter() - started) * 1000, timed_out=True)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="로그인 요청이 많습니다. 잠시 후 다시 시도하세요.",
+            )
+        self.metrics.observe((time.perf_counter() - started) * 1000)
+        with self._lock:
+            self._in_flight += 1
+        try:
+            executor = self._get_executor()
+            if executor is None:
+                return fn(*args)
+            try:
+                return executor.submit(fn, *args).result()
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되면 다음 요청에서 풀을 새로 만듦
+                self.shutdown()
+                raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+            self._slots.release()
+
+    # ---------- 공개 API ----------
+    def hash(self, password: str) -> str:
+        return self._run(_hash, password, self.rounds)
+
+    def verify_and_update(self, password: str, hashed: str) -> tuple[bool, str | None]:
+        """(일치 여부, 새 해시 | None) — rounds가 바뀐 해시는 새 해시를 함께 반환"""
+        return self._run(_verify_and_update, password, hashed, self.rounds)
+
+    def status(self) -> dict:
+        snap = self.metrics.snapshot()
+        return {
+            "workers": self.workers,
+            "max_concurrency": self.max_concurrency,
+            "bcrypt_rounds": self.rounds,
+            "in_flight": self._in_flight,
+            "requests": snap["checkouts"],
+            "rejected": snap["pool_timeouts"],
+            "queue_wait_ms_sum": snap["wait_ms_sum"],
+            "queue_wait_ms_max": snap["wait_ms_max"],
+            "queue_wait_ms_buckets": snap["wait_ms_buckets"],
+        }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,95 @@
+# app/utils/pool_metrics.py
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 체크아웃 대기 시간 히스토그램 버킷 (ms, 누적 카운트)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class PoolMetrics:
+    """풀 하나의 체크아웃 대기 시간 히스토그램 + 타임아웃 횟수 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.bucket_counts = [0] * len(WAIT_BUCKETS_MS)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.timeouts = 0
+
+    def observe(self, wait_ms: float, timed_out: bool = False):
+        with self._lock:
+            self.count += 1
+            self.sum_ms += wait_ms
+            self.max_ms = max(self.max_ms, wait_ms)
+            if timed_out:
+                self.timeouts += 1
+            for i, bound in enumerate(WAIT_BUCKETS_MS):
+                if wait_ms <= bound:
+                    self.bucket_counts[i] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            buckets = {f"le_{b}ms": c for b, c in zip(WAIT_BUCKETS_MS, self.bucket_counts)}
+            buckets["le_inf"] = self.count
+            return {
+                "checkouts": self.count,
+                "wait_ms_sum": round(self.sum_ms, 3),
+                "wait_ms_max": round(self.max_ms, 3),
+                "wait_ms_buckets": buckets,
+                "pool_timeouts": self.timeouts,
+            }
+
+
+class _InstrumentedMixin:
+    """
+    QueuePool._do_get을 감싸 체크아웃 대기 시간을 기록.
+    - 대기 시간 = 풀 큐 대기 + (오버플로 시) 새 연결 생성 시간
+    - pool_timeout 초과(TimeoutError)는 별도 카운트
+    """
+
+    metrics: PoolMetrics
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.observe((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        self.metrics.observe((time.perf_counter() - started) * 1000)
+        return conn
+
+
+class InstrumentedQueuePool(_InstrumentedMixin, QueuePool):
+    # engine.dispose() 등으로 풀이 재생성되어도 누적값 유지 (클래스 단위 보관)
+    metrics = PoolMetrics()
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedMixin, AsyncAdaptedQueuePool):
+    metrics = PoolMetrics()
+
+
+def pool_status(pool) -> dict:
+    """현재 풀 상태 + (계측 풀이면) 대기 시간 통계"""
+    status = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        getter = getattr(pool, name, None)
+        if callable(getter):
+            status[name] = getter()
+    if "overflow" in status:
+        # QueuePool은 아직 열지 않은 기본 연결을 음수로 표시 → 초과 연결 수만 노출
+        status["overflow"] = max(status["overflow"], 0)
+    timeout = getattr(pool, "timeout", None)
+    if callable(timeout):
+        status["timeout"] = timeout()
+    metrics = getattr(pool, "metrics", None)
+    if isinstance(metrics, PoolMetrics):
+        status.update(metrics.snapshot())
+    return status
@@ -0,0 +1,185 @@
+# app/utils/principal.py
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from dotenv import load_dotenv
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.employee import Employee
+from app.models.member import Member
+
+# .env 로드 (utils/token.py와 동일한 방식)
+BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
+load_dotenv(BASE_DIR / ".env")
+
+# 최대 보관 토큰 수 (LRU) / 최대 보관 시간(초, 토큰 exp보다 길어지지 않음)
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "2048"))
+PRINCIPAL_CACHE_TTL = int(os.getenv("PRINCIPAL_CACHE_TTL", "300"))
+
+
+# ----------------------------------------
+# 인증된 사용자 (요청 간 공유 가능한 불변 값 — ORM 객체 아님)
+# ----------------------------------------
+@dataclass(frozen=True)
+class Principal:
+    member_id: int
+    login_id: str
+    user_type: str
+    emp_id: Optional[int] = None
+    ext_id: Optional[int] = None
+    role_id: Optional[int] = None
+    dept_id: Optional[int] = None
+    claims: dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+def principal_stmt(login_id: str):
+    """login_id → 멤버 + 직원(역할/부서) 한 번에 조회"""
+    return (
+        select(
+            Member.member_id,
+            Member.login_id,
+            Member.user_type,
+            Member.emp_id,
+            Member.ext_id,
+            Employee.role_id,
+            Employee.dept_id,
+        )
+        .outerjoin(Employee, Employee.emp_id == Member.emp_id)
+        .where(Member.login_id == login_id)
+    )
+
+
+def principal_from_row(row, claims: dict) -> Principal:
+    return Principal(
+        member_id=row.member_id,
+        login_id=row.login_id,
+        user_type=getattr(row.user_type, "value", row.user_type),
+        emp_id=row.emp_id,
+        ext_id=row.ext_id,
+        role_id=row.role_id,
+        dept_id=row.dept_id,
+        claims=claims,
+    )
+
+
+# ----------------------------------------
+# 토큰 해시 → Principal (LRU + TTL)
+# ----------------------------------------
+class PrincipalCache:
+    """
+    검증이 끝난 토큰의 SHA-256 → Principal.
+    - 만료 시각 = min(현재 + TTL, 토큰 exp) → 만료된 토큰은 캐시로도 통과 불가
+    - 직원 삭제/역할 변경 시 login_id·emp_id 기준으로 무효화 (프로세스 단위)
+    """
+
+    def __init__(self, maxsize: int = PRINCIPAL_CACHE_SIZE, ttl: int = PRINCIPAL_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Principal, float]] = OrderedDict()
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def get(self, token: str) -> Principal | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            principal, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(self, token: str, principal: Principal):
+        if self.maxsize <= 0:
+            return
+        expires_at = time.time() + self.ttl
+        exp = principal.claims.get("exp")
+        if isinstance(exp, (int, float)):
+            expires_at = min(expires_at, float(exp))
+        with self._lock:
+            self._entries[self._key(token)] = (principal, expires_at)
+            self._entries.move_to_end(self._key(token))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *, login_ids=(), emp_ids=()):
+        login_ids, emp_ids = set(login_ids), set(emp_ids)
+        if not login_ids and not emp_ids:
+            return
+        with self._lock:
+            for key in [
+                k
+                for k, (p, _) in self._entries.items()
+                if p.login_id in login_ids or (p.emp_id is not None and p.emp_id in emp_ids)
+            ]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+principal_cache = PrincipalCache()
+
+
+# ----------------------------------------
+# 무효화: 멤버 삭제·변경, 직원 삭제·역할/부서 변경
+# (flush 시점 + 커밋 직후 두 번 → 커밋 전 재적재된 옛 값도 제거)
+# ----------------------------------------
+_MEMBER_FIELDS = ("login_id", "user_type", "emp_id", "ext_id")
+_EMPLOYEE_FIELDS = ("role_id", "dept_id")
+
+
+def _invalidate(session: Session, login_ids=(), emp_ids=()):
+    principal_cache.invalidate(login_ids=login_ids, emp_ids=emp_ids)
+    pending = session.info.setdefault("principal_invalidations", ([], []))
+    pending[0].extend(login_ids)
+    pending[1].extend(emp_ids)
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_principal_changes(session: Session, flush_context, instances):
+    login_ids, emp_ids = [], []
+    for obj in session.deleted:
+        if isinstance(obj, Member):
+            login_ids.append(obj.login_id)
+        elif isinstance(obj, Employee):
+            emp_ids.append(obj.emp_id)
+    for obj in session.dirty:
+        if isinstance(obj, Member):
+            attrs = inspect(obj).attrs
+            if any(attrs[name].history.has_changes() for name in _MEMBER_FIELDS):
+                login_ids.append(obj.login_id)
+                # login_id 자체가 바뀐 경우 이전 값으로 캐시된 항목도 제거
+                login_ids.extend(v for v in attrs.login_id.history.deleted if v)
+        elif isinstance(obj, Employee):
+            attrs = inspect(obj).attrs
+            if any(attrs[name].history.has_changes() for name in _EMPLOYEE_FIELDS):
+                emp_ids.append(obj.emp_id)
+    if login_ids or emp_ids:
+        _invalidate(session, login_ids, emp_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_principal_invalidations(session: Session):
+    pending = session.info.pop("principal_invalidations", None)
+    if pending:
+        principal_cache.invalidate(login_ids=pending[0], emp_ids=pending[1])
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_principal_invalidations(session: Session):
+    session.info.pop("principal_invalidations", None)
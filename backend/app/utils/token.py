@@ -6,10 +6,11 @@ from pathlib import Path
 from dotenv import load_dotenv
 from fastapi import Depends, Header, HTTPException, status
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
-from app.models.member import Member
+from app.database import get_async_db, get_db
+from app.utils.password_hasher import password_hasher
+from app.utils.principal import Principal, principal_cache, principal_from_row, principal_stmt
 
 # .env 로드 (절대경로로 안전하게)
 BASE_DIR = Path(__file__).resolve().parent.parent  # backend/app
@@ -19,18 +20,20 @@ SECRET_KEY = os.getenv("SECRET_KEY", "change_this_in_production")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 
-# bcrypt 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 def hash_password(password: str) -> str:
-    """평문 비밀번호를 bcrypt로 해시"""
-    return pwd_context.hash(password)
+    """평문 비밀번호를 bcrypt로 해시 (전용 프로세스 풀)"""
+    return password_hasher.hash(password)
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     """평문과 해시 비교"""
-    return pwd_context.verify(plain, hashed)
+    return password_hasher.verify_and_update(plain, hashed)[0]
+
+
+def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """평문과 해시 비교 + BCRYPT_ROUNDS가 바뀐 해시면 새 해시 반환 (로그인 시 교체용)"""
+    return password_hasher.verify_and_update(plain, hashed)
 
 
 def create_access_token(data: dict, expires_minutes: int = ACCESS_TOKEN_EXPIRE_MINUTES) -> str:
@@ -41,16 +44,8 @@ def create_access_token(data: dict, expires_minutes: int = ACCESS_TOKEN_EXPIRE_M
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_current_user(Authorization: str = Header(None), db=Depends(get_db)):
-    """JWT 토큰에서 현재 사용자 추출"""
-    if Authorization is None or not Authorization.startswith("Bearer "):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="인증 헤더가 누락되었습니다.",
-        )
-
-    token = Authorization.split(" ")[1]
-
+def decode_token(token: str) -> dict:
+    """JWT 검증 후 클레임 반환 (login_id 필수)"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         login_id = payload.get("login_id")  # ✅ login_id 기반으로 변경
@@ -58,8 +53,60 @@ def get_current_user(Authorization: str = Header(None), db=Depends(get_db)):
             raise HTTPException(status_code=401, detail="토큰에 사용자 정보가 없습니다.")
     except JWTError:
         raise HTTPException(status_code=401, detail="토큰이 유효하지 않습니다.")
+    return payload
+
+
+def decode_login_id(token: str) -> str:
+    """JWT 검증 후 login_id 반환 (헤더 외 경로 — WebSocket 쿼리 등에서도 사용)"""
+    return decode_token(token)["login_id"]
 
-    user = db.query(Member).filter(Member.login_id == login_id).first()
-    if not user:
-        raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
-    return user
+
+def _bearer_token(Authorization: str | None) -> str:
+    """Authorization 헤더에서 Bearer 토큰 추출"""
+    if Authorization is None or not Authorization.startswith("Bearer "):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="인증 헤더가 누락되었습니다.",
+        )
+    return Authorization.split(" ")[1]
+
+
+def _user_not_found():
+    raise HTTPException(status_code=401, detail="사용자를 찾을 수 없습니다.")
+
+
+def get_current_user(Authorization: str = Header(None), db=Depends(get_db)) -> Principal:
+    """
+    JWT 토큰에서 현재 사용자 추출.
+    - 같은 토큰은 principal_cache에서 바로 반환 (JWT 검증·DB 조회 생략)
+    """
+    token = _bearer_token(Authorization)
+    principal = principal_cache.get(token)
+    if principal:
+        return principal
+
+    claims = decode_token(token)
+    row = db.execute(principal_stmt(claims["login_id"])).first()
+    if not row:
+        _user_not_found()
+    principal = principal_from_row(row, claims)
+    principal_cache.put(token, principal)
+    return principal
+
+
+async def get_current_user_async(
+    Authorization: str = Header(None), db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """JWT 토큰에서 현재 사용자 추출 (async def 라우터용, 같은 캐시 사용)"""
+    token = _bearer_token(Authorization)
+    principal = principal_cache.get(token)
+    if principal:
+        return principal
+
+    claims = decode_token(token)
+    row = (await db.execute(principal_stmt(claims["login_id"]))).first()
+    if not row:
+        _user_not_found()
+    principal = principal_from_row(row, claims)
+    principal_cache.put(token, principal)
+    return principal
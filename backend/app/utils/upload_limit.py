@@ -0,0 +1,60 @@
+# app/utils/upload_limit.py
+import re
+
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.exceptions import payload_too_large
+
+
+class BodySizeLimitMiddleware:
+    """
+    요청 본문 크기 제한 (순수 ASGI 미들웨어).
+    FastAPI는 엔드포인트 의존성보다 먼저 multipart 폼 전체를 임시 파일로 스풀링하므로
+    한도 검사는 그 앞단인 여기서 수행.
+    - Content-Length가 한도를 넘으면 본문을 읽지 않고 바로 413
+    - Content-Length가 없거나(chunked) 맞지 않으면 수신 바이트를 세다가 한도를 넘는 순간 413
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_bytes: int,
+        path_pattern: str,
+        methods: tuple[str, ...] = ("POST",),
+        detail: str = "요청 본문이 허용 크기를 초과했습니다.",
+    ):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_pattern = re.compile(path_pattern)
+        self.methods = set(methods)
+        self.detail = detail
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in self.methods
+            or not self.path_pattern.match(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        length = dict(scope["headers"]).get(b"content-length", b"")
+        if length.isdigit() and int(length) > self.max_bytes:
+            response = JSONResponse({"detail": self.detail}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # HTTPException은 폼 파싱 중에도 그대로 전파되어 413 응답으로 변환됨
+                    payload_too_large(self.detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
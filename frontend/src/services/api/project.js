@@ -11,7 +11,18 @@ const request = async (fn, context = "프로젝트") => {
   }
 };
 
-export const getProjects = () => request(() => api.get("/projects/"), "프로젝트 목록");
+// 목록은 커서 페이지 → X-Next-Cursor 헤더가 없을 때까지 이어서 조회 (페이지당 최대 200건)
+export const getProjects = () =>
+  request(async () => {
+    const data = [];
+    let cursor;
+    do {
+      const res = await api.get("/projects/", { params: { limit: 200, cursor } });
+      data.push(...res.data);
+      cursor = res.headers["x-next-cursor"];
+    } while (cursor);
+    return { data };
+  }, "프로젝트 목록");
 export const getProject = projectId =>
   request(() => api.get(`/projects/${projectId}`), "프로젝트 상세");
 export const createProject = data => request(() => api.post("/projects/", data), "프로젝트 생성");
@@ -23,6 +23,18 @@ const ensureInt = (value, name = "ID") => {
   return num;
 };
 
+// ✅ 커서 페이지 목록 전체 조회 (X-Next-Cursor 헤더가 없을 때까지 이어서 요청)
+const getAllPages = async (url, limit) => {
+  const data = [];
+  let cursor;
+  do {
+    const res = await api.get(url, { params: { limit, cursor } });
+    data.push(...res.data);
+    cursor = res.headers["x-next-cursor"];
+  } while (cursor);
+  return data;
+};
+
 // ✅ 태스크 Payload 정규화 (422 방지용)
 const normalizeTaskPayload = (data = {}) => {
   const safe = { ...data };
@@ -56,9 +68,14 @@ const normalizeTaskPayload = (data = {}) => {
  * 📋 TASKS (업무)
  * ------------------------------------------- */
 
-// ✅ 프로젝트별 평면 태스크 목록
+// ✅ 프로젝트별 평면 태스크 목록 (커서 페이지 전체, 페이지당 최대 500건)
 export const getTasks = projectId =>
-  request(() => api.get(`/projects/${ensureInt(projectId, "projectId")}/tasks`), "태스크 목록");
+  request(
+    async () => ({
+      data: await getAllPages(`/projects/${ensureInt(projectId, "projectId")}/tasks`, 500),
+    }),
+    "태스크 목록",
+  );
 
 // ✅ 트리형 태스크 목록
 export const getTaskTree = projectId =>
@@ -135,15 +152,33 @@ export const updateTaskProgress = (projectId, taskId, progress) =>
  * 💬 COMMENTS (댓글)
  * ------------------------------------------- */
 
-export const getComments = (projectId, taskId) =>
+const commentsUrl = (projectId, taskId) =>
+  `/projects/${ensureInt(projectId, "projectId")}/tasks/${ensureInt(taskId, "taskId")}/comments`;
+
+// ✅ 한 스레드의 답글 목록 (커서 페이지 전체, 작성순)
+export const getCommentReplies = (projectId, taskId, commentId) =>
   request(
-    () =>
-      api.get(
-        `/projects/${ensureInt(projectId, "projectId")}/tasks/${ensureInt(taskId, "taskId")}/comments`,
+    async () => ({
+      data: await getAllPages(
+        `${commentsUrl(projectId, taskId)}/${ensureInt(commentId, "commentId")}/replies`,
+        200,
       ),
-    "댓글 목록",
+    }),
+    "답글 목록",
   );
 
+// ✅ 댓글 목록: 최상위 댓글 전체 + 답글이 있는 스레드는 답글까지 (부모 댓글 바로 뒤에 배치)
+export const getComments = (projectId, taskId) =>
+  request(async () => {
+    const comments = await getAllPages(commentsUrl(projectId, taskId), 200);
+    const replies = await Promise.all(
+      comments.map(c =>
+        c.reply_count > 0 ? getCommentReplies(projectId, taskId, c.comment_id) : [],
+      ),
+    );
+    return { data: comments.flatMap((c, i) => [c, ...replies[i]]) };
+  }, "댓글 목록");
+
 export const createComment = (projectId, taskId, body) =>
   request(
     () =>
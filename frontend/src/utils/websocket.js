@@ -7,8 +7,12 @@ let socket = null;
 export function connectProjectSocket(projectId, onMessage) {
   if (socket) disconnectProjectSocket();
 
-  // ✅ FastAPI 예시: ws://localhost:8000/ws/projects/{project_id}
-  socket = new WebSocket(`${import.meta.env.VITE_WS_BASE}/projects/${projectId}`);
+  // ✅ FastAPI 예시: ws://localhost:8000/ws/projects/{project_id}?token=<JWT>
+  // (브라우저 WebSocket은 헤더 지정 불가 → 쿼리로 인증, 프로젝트 멤버만 연결됨)
+  const token = localStorage.getItem("access_token") || "";
+  socket = new WebSocket(
+    `${import.meta.env.VITE_WS_BASE}/projects/${projectId}?token=${encodeURIComponent(token)}`,
+  );
 
   socket.onopen = () => console.log("✅ WebSocket 연결됨:", projectId);
   socket.onclose = () => console.log("🔌 WebSocket 연결 종료됨");